@@ -24,6 +24,16 @@ import os
 import json
 import numpy as np
 import re
+from html import escape
+
+# orjson is optional, configuration files are read and written with it when installed
+try:
+    import orjson
+    # The same options for files and text, int/float keys are written as strings like json does
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QPushButton, QFileDialog, QLabel, 
                               QTabWidget, QTableWidget, QTableWidgetItem, QMessageBox,
@@ -32,15 +42,18 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QLineEdit, QScrollArea, QGridLayout, QFrame, QRadioButton,
                               QButtonGroup, QMenu, QToolButton, QSizePolicy, QListWidget,
                               QHeaderView, QListWidgetItem, QDialogButtonBox, QTreeWidget, 
-                              QTreeWidgetItem, QProgressBar)
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QTimer
-from PySide6.QtGui import QFont, QIcon, QAction, QColor
+                              QTreeWidgetItem, QProgressBar, QStackedWidget, QTableView, QSpacerItem)
+from PySide6.QtCore import (Qt, QSize, Signal, Slot, QTimer, QStringListModel, QSignalBlocker,
+                            QObject, QThread)
+from PySide6.QtGui import QFont, QIcon, QAction, QColor, QStandardItemModel, QStandardItem, QTextCursor
 
 # Import matplotlib for plotting
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.lines import Line2D
 
 # Import your data processing classes
 from ...UtilityAPI.SensorsAPI import ReplicaXSensorDataReader
@@ -56,8 +69,154 @@ class SmartQDoubleSpinBox(QDoubleSpinBox):
         text = format(decimal_value.normalize(), 'f')  # 'normalize()' removes unnecessary trailing zeros
         return text if text else "0"
 
+def _configure_spin(spin, *, lo, hi, step=None, decimals=None, value=None):
+    """
+    Apply range, step and decimals to a spin box in one go, then its value.
+    Signals are blocked while the limits change so no transient valueChanged is emitted.
+    """
+    spin.blockSignals(True)
+    if decimals is not None:
+        spin.setDecimals(decimals)  # before the range, so the limits are not rounded
+    spin.setRange(lo, hi)
+    if step is not None:
+        spin.setSingleStep(step)
+    spin.blockSignals(False)
+    if value is not None:
+        spin.setValue(value)
+    return spin
+
+# Fixed choices of the filter and configuration combos, built once at import
+_FILTER_TYPES = ("none", "butterworth", "chebyshev1", "chebyshev2", "elliptic",
+                 "bessel", "fir", "savgol", "moving_avg")
+_FIR_WINDOWS = ("hamming", "hann", "blackman", "boxcar", "kaiser")
+_SEPARATORS = (",", ";", "\\t", " ", "|")
+_DECIMALS = (".", ",")
+_RESAMPLE_METHODS = ("linear", "cubic", "nearest")
+_DETREND_TYPES = ("linear", "poly")
+_BTYPES = ("low", "high", "band", "bandstop")
+
+# Combo index of each value, so a stored setting is selected without searching the item texts
+_SEPARATOR_INDEX = {value: i for i, value in enumerate(_SEPARATORS)}
+_DECIMAL_INDEX = {value: i for i, value in enumerate(_DECIMALS)}
+_RESAMPLE_METHOD_INDEX = {value: i for i, value in enumerate(_RESAMPLE_METHODS)}
+_DETREND_TYPE_INDEX = {value: i for i, value in enumerate(_DETREND_TYPES)}
+_BTYPE_INDEX = {value: i for i, value in enumerate(_BTYPES)}
+
+def _fix_combo_width(combo, min_chars):
+    """
+    Size a combo from a fixed number of characters instead of its longest item,
+    so the width is not recomputed over all items whenever the items change.
+    """
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(min_chars)
+    return combo
+
+def _add_choices(combo, choices):
+    """Add fixed choices to a combo, keeping each value as the item's UserRole data"""
+    for value in choices:
+        combo.addItem(value, value)
+    return combo
+
+# Level and prefix length ("LEVEL: ") of the sensor data log lines, keyed by the text up to and
+# including the first colon, so a bare level word without a colon stays a plain INFO line
+_LOG_LINE_PREFIXES = {
+    "INFO:": ("INFO", 6),
+    "WARNING:": ("WARNING", 9),
+    "ERROR:": ("ERROR", 7),
+}
+
+def _describe_detrend(settings):
+    """Summary line of the detrend correction"""
+    detrend_type = settings.get("type", "linear")
+    if detrend_type == "poly":
+        return f"5. Detrend ({detrend_type}, degree: {settings.get('degree', 2)})"
+    return f"5. Detrend ({detrend_type})"
+
+def _describe_filter(settings):
+    """Summary line of the filter correction"""
+    params_str = ", ".join([f"{k}: {v}" for k, v in settings.get("params", {}).items()])
+    return f"8. Filter ({settings.get('type', 'none')}{', ' + params_str if params_str else ''})"
+
+# Bold font of the sensor name in the individual plot legends, the same size as the legend font.
+# Legend texts copy the font properties they are given, so one instance serves every plot.
+_LEGEND_BOLD_FONT = FontProperties(weight='bold', size=6)
+
+def _legend_text_handle(label):
+    """Invisible legend handle, so the legend entry shows only its label"""
+    return Line2D([0], [0], color='white', marker='', linestyle='', label=label)
+
+# Basic settings and units sections of the configuration summary
+_SUMMARY_SETTINGS_TEMPLATE = (
+    "<h3>Basic Settings</h3>"
+    "<p><b>File:</b> {file}</p>"
+    "<p><b>Rows:</b> {start_row} to {end_row}</p>"
+    "<p><b>Time Column:</b> {time_column}</p>"
+    "<p><b>Sample Rate:</b> {sample_rate:.2f} Hz</p>"
+    "<h3>Units</h3>"
+    "<p><b>Data Type:</b> {data_type}</p>"
+    "<p><b>Input Units:</b> {input_data} ({input_time})</p>"
+    "<p><b>Output Units:</b> {output_data} ({output_time})</p>"
+)
+
+def _html_text(value):
+    """Configuration value as HTML text, so names with <, > or & show as written"""
+    return escape(str(value), quote=False)
+
+# Data correction keys in processing order, with the summary line of each when it is active
+_CORRECTION_DESCRIPTIONS = (
+    ("trim_time", lambda c: f"1. Trim Time (Range: {c.get('start_time', '')} to {c.get('end_time', '')})"),
+    ("resample", lambda c: f"2. Resample ({c.get('value', '')} Hz, Method: {c.get('method', 'linear')})"),
+    ("shift_time", lambda c: f"3. Shift Time (Value: {c.get('value', '')})"),
+    ("zero_start_y", lambda c: f"4. Zero Start Y (Points: {c.get('value', '')})"),
+    ("reverse_y", lambda c: "5. Reverse Y"),
+    ("detrend", _describe_detrend),
+    ("derivative", lambda c: "7. Derivative"),
+    ("filter", _describe_filter),
+    ("stretch_y", lambda c: f"9. Stretch Y (Factor: {c.get('value', '')})"),
+    ("normilized", lambda c: "10. Normalize"),
+    ("zero_start_time", lambda c: "11. Zero Start Time"),
+)
+
+def _write_json_file(obj, file_path):
+    """Write an object to a JSON file, using orjson when available"""
+    if orjson is not None:
+        # Serialize before opening the file, so a failure falls back to json without a half-written file
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(file_path, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+            return
+    with open(file_path, 'w', buffering=1 << 20) as f:
+        json.dump(obj, f, indent=4)
+
+def _format_json(obj):
+    """Format an object as indented JSON text, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=4)
+
+def _read_json_file(file_path):
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
 class FilterComparisonWindow(QMainWindow):
     """Main window for filter comparison tool"""
+    # Metrics shown in the metrics / frequency band tables (column order)
+    TIME_METRICS = ('rmse', 'snr_db', 'correlation', 'energy_ratio')
+    FREQ_METRICS = ('low_band_ratio', 'mid_band_ratio', 'high_band_ratio')
+    # Foreground colors indexed by the color codes of the metric matrices
+    METRIC_COLORS = ("red", "orange", "green")
+    
     def __init__(self, sensor_data, parent=None):
         super(FilterComparisonWindow, self).__init__(parent)
         self.sensor_data = sensor_data
@@ -67,6 +226,19 @@ class FilterComparisonWindow(QMainWindow):
         self.scores = None
         self.figures = {}
         
+        # Metric values and color codes, one row per ranked filter
+        self._time_values = None
+        self._time_colors = None
+        self._freq_values = None
+        self._freq_colors = None
+        
+        # Plot canvases not drawn yet, keyed by their results tab
+        self._pending_canvases = {}
+        
+        # Filter name items of the metric tables, reused across refreshes
+        self._metrics_name_items = {}
+        self._freq_band_name_items = {}
+        
         # Setup UI
         self.setup_ui()
         self.setWindowTitle("Filter Comparison Tool")
@@ -291,6 +463,7 @@ class FilterComparisonWindow(QMainWindow):
         peaks_layout.addWidget(self.peaks_plot_container)
         
         self.results_tabs.addTab(self.peaks_tab, "Peak Preservation")
+        self.results_tabs.currentChanged.connect(self.on_results_tab_changed)
         
         # Add export button
         export_layout = QHBoxLayout()
@@ -580,8 +753,21 @@ class FilterComparisonWindow(QMainWindow):
         self.filter_list.clear()
         self.update_run_button()
     
+    def data_is_idle(self):
+        """
+        Warn and return False while the reader window processes sensor_data on its
+        worker thread, the comparison reads the same data on the GUI thread.
+        """
+        if getattr(self.parent(), "_processing", False):
+            QMessageBox.warning(self, "Processing Running", "Please wait for the data processing to finish.")
+            return False
+        return True
+    
     def run_comparison(self):
         """Run the filter comparison with selected configurations"""
+        if not self.data_is_idle():
+            return
+        
         if len(self.filter_configs) < 2:
             QMessageBox.warning(self, "Insufficient Filters", 
                                "Please add at least two filter configurations to compare.")
@@ -646,6 +832,7 @@ class FilterComparisonWindow(QMainWindow):
             self.ranked_filters, self.scores = self.sensor_data.rank_filters(
                 self.comparison_results, ranking_criteria
             )
+            self._build_metric_matrices()
             
             progress_bar.setValue(70)
             progress_label.setText("Generating visualizations...")
@@ -681,22 +868,35 @@ class FilterComparisonWindow(QMainWindow):
         # Clear the plot containers
         for layout in [self.time_plot_layout, self.freq_plot_layout, 
                        self.fft_plot_layout, self.peaks_plot_layout]:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+            self.clear_layout(layout)
+        self._pending_canvases.clear()
         
         # Reset the summary label
         self.summary_label.setText("Running comparison...")
         
-        # Clear tables
+        # Clear tables (keeping the cached filter name items alive)
         self.rankings_table.setRowCount(0)
+        self._take_name_items(self.metrics_table)
         self.metrics_table.setRowCount(0)
         self.metrics_table.setColumnCount(0)
+        self._take_name_items(self.freq_band_table)
         self.freq_band_table.setRowCount(0)
         self.freq_band_table.setColumnCount(0)
     
+    def _take_name_items(self, table):
+        """Take the filter name column out of a metric table so its items survive a reset"""
+        for row in range(table.rowCount()):
+            table.takeItem(row, 0)
+    
+    def clear_layout(self, layout):
+        """Take every item out of a layout in one sweep and relayout once"""
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.deleteLater()
+        layout.update()
+    
     def update_results_ui(self):
         """Update UI with comparison results"""
         if not self.comparison_results or not self.ranked_filters:
@@ -754,131 +954,100 @@ class FilterComparisonWindow(QMainWindow):
         # Update plot tabs
         self.update_plot_tabs()
     
-    def update_metrics_table(self):
-        """Update the metrics table with detailed comparison results"""
+    def _build_metric_matrices(self):
+        """Collect the table metrics of the ranked filters into arrays with their color codes"""
         if not self.comparison_results or not self.ranked_filters:
             return
         
-        # Define metrics to display
-        time_metrics = ['rmse', 'snr_db', 'correlation', 'energy_ratio']
-        
-        # Set up the table
-        self.metrics_table.setRowCount(len(self.ranked_filters))
-        self.metrics_table.setColumnCount(len(time_metrics) + 1)  # +1 for filter names
+        self._time_values = np.array(
+            [[self.comparison_results[f]['time_metrics'].get(m, 0.0) for m in self.TIME_METRICS]
+             for f in self.ranked_filters], dtype=np.float64)
+        self._freq_values = np.array(
+            [[self.comparison_results[f]['frequency_metrics'].get(m, 0.0) for m in self.FREQ_METRICS]
+             for f in self.ranked_filters], dtype=np.float64)
+        
+        # Color codes index METRIC_COLORS: 0 = red, 1 = orange, 2 = green
+        rmse, snr_db, correlation, energy_ratio = self._time_values.T
+        good_time = np.column_stack([
+            rmse < 1.0,                                 # Lower is better for RMSE
+            snr_db > 40,                                # Higher is better
+            correlation > 0.99,                         # Higher is better
+            (energy_ratio > 0.95) & (energy_ratio < 1.05),  # Closer to 1.0 is better
+        ])
+        self._time_colors = np.where(good_time, 2, 0).astype(np.uint8)
+        
+        self._freq_colors = np.empty_like(self._freq_values, dtype=np.uint8)
+        # Low band should be preserved (close to 1.0 is good)
+        low_band = self._freq_values[:, 0]
+        self._freq_colors[:, 0] = np.where((low_band > 0.95) & (low_band < 1.05), 2, 0)
+        # Mid/High band suppression depends on filter purpose
+        # Just color by value for visualization
+        upper_bands = self._freq_values[:, 1:]
+        self._freq_colors[:, 1:] = np.where(upper_bands < 0.05, 0, np.where(upper_bands < 0.5, 1, 2))
+    
+    def _fill_metric_table(self, table, header_labels, values, colors, name_items):
+        """Fill a read-only metric table from a value matrix and its color codes"""
+        # Detach the reusable name items before rows are resized or overwritten
+        self._take_name_items(table)
+        for filter_name in set(name_items) - set(self.ranked_filters):
+            del name_items[filter_name]
         
-        # Set horizontal header (metric names)
-        header_labels = ["Filter"]
-        header_labels.extend(['RMSE', 'SNR (dB)', 'Correlation', 'Energy Ratio'])
-        self.metrics_table.setHorizontalHeaderLabels(header_labels)
+        table.setRowCount(len(self.ranked_filters))
+        table.setColumnCount(len(header_labels))
+        table.setHorizontalHeaderLabels(header_labels)
         
         # Configure table appearance
-        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        
+        foregrounds = [QColor(color) for color in self.METRIC_COLORS]
         
         # Fill the table
         for row, filter_name in enumerate(self.ranked_filters):
             # Filter name column
-            filter_item = QTableWidgetItem(filter_name)
-            filter_item.setFlags(filter_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-            self.metrics_table.setItem(row, 0, filter_item)
+            filter_item = name_items.get(filter_name)
+            if filter_item is None:
+                filter_item = QTableWidgetItem(filter_name)
+                filter_item.setFlags(filter_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
+                name_items[filter_name] = filter_item
+            else:
+                filter_item.setData(Qt.BackgroundRole, None)  # Drop a previous highlight
+            table.setItem(row, 0, filter_item)
             
             # Metrics columns
-            results = self.comparison_results[filter_name]
-            for col, metric in enumerate(time_metrics, 1):
-                value = results['time_metrics'].get(metric, 0)
-                cell_item = QTableWidgetItem(f"{value:.6f}" if isinstance(value, float) else str(value))
+            for col in range(values.shape[1]):
+                cell_item = QTableWidgetItem(f"{values[row, col]:.6f}")
                 cell_item.setFlags(cell_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
                 cell_item.setTextAlignment(Qt.AlignCenter)
-                
-                # Add color coding
-                if metric == 'rmse':
-                    # Lower is better for RMSE
-                    if value < 1.0:
-                        cell_item.setForeground(QColor("green"))
-                    else:
-                        cell_item.setForeground(QColor("red"))
-                elif metric in ['snr_db', 'correlation']:
-                    # Higher is better
-                    if (metric == 'snr_db' and value > 40) or (metric == 'correlation' and value > 0.99):
-                        cell_item.setForeground(QColor("green"))
-                    else:
-                        cell_item.setForeground(QColor("red"))
-                elif metric == 'energy_ratio':
-                    # Closer to 1.0 is better
-                    if 0.95 < value < 1.05:
-                        cell_item.setForeground(QColor("green"))
-                    else:
-                        cell_item.setForeground(QColor("red"))
-                
-                self.metrics_table.setItem(row, col, cell_item)
+                cell_item.setForeground(foregrounds[colors[row, col]])
+                table.setItem(row, col + 1, cell_item)
             
             # Highlight the best filter
             if row == 0:
-                for col in range(self.metrics_table.columnCount()):
-                    self.metrics_table.item(row, col).setBackground(QColor("#d4edda"))  # Light green
+                for col in range(table.columnCount()):
+                    table.item(row, col).setBackground(QColor("#d4edda"))  # Light green
         
         # Resize columns to content
-        self.metrics_table.resizeColumnsToContents()
+        table.resizeColumnsToContents()
+    
+    def update_metrics_table(self):
+        """Update the metrics table with detailed comparison results"""
+        if not self.comparison_results or not self.ranked_filters or self._time_values is None:
+            return
+        
+        header_labels = ["Filter", "RMSE", "SNR (dB)", "Correlation", "Energy Ratio"]
+        self._fill_metric_table(self.metrics_table, header_labels,
+                                self._time_values, self._time_colors,
+                                self._metrics_name_items)
     
     def update_frequency_band_table(self):
         """Update the frequency band analysis table"""
-        if not self.comparison_results or not self.ranked_filters:
+        if not self.comparison_results or not self.ranked_filters or self._freq_values is None:
             return
         
-        # Define frequency band metrics
-        freq_metrics = ['low_band_ratio', 'mid_band_ratio', 'high_band_ratio']
-        
-        # Set up the table
-        self.freq_band_table.setRowCount(len(self.ranked_filters))
-        self.freq_band_table.setColumnCount(len(freq_metrics) + 1)  # +1 for filter names
-        
-        # Set horizontal header
         header_labels = ["Filter", "Low Band Ratio", "Mid Band Ratio", "High Band Ratio"]
-        self.freq_band_table.setHorizontalHeaderLabels(header_labels)
-        
-        # Configure table appearance
-        self.freq_band_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        
-        # Fill the table
-        for row, filter_name in enumerate(self.ranked_filters):
-            # Filter name column
-            filter_item = QTableWidgetItem(filter_name)
-            filter_item.setFlags(filter_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-            self.freq_band_table.setItem(row, 0, filter_item)
-            
-            # Frequency metrics columns
-            results = self.comparison_results[filter_name]
-            for col, metric in enumerate(freq_metrics, 1):
-                value = results['frequency_metrics'].get(metric, 0)
-                cell_item = QTableWidgetItem(f"{value:.6f}" if isinstance(value, float) else str(value))
-                cell_item.setFlags(cell_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-                cell_item.setTextAlignment(Qt.AlignCenter)
-                
-                # Color coding for frequency band ratios
-                if metric == 'low_band_ratio':
-                    # Low band should be preserved (close to 1.0 is good)
-                    if 0.95 < value < 1.05:
-                        cell_item.setForeground(QColor("green"))
-                    else:
-                        cell_item.setForeground(QColor("red"))
-                elif metric in ['mid_band_ratio', 'high_band_ratio']:
-                    # Mid/High band suppression depends on filter purpose
-                    # Just color by value for visualization
-                    if value < 0.05:
-                        cell_item.setForeground(QColor("red"))
-                    elif value < 0.5:
-                        cell_item.setForeground(QColor("orange"))
-                    else:
-                        cell_item.setForeground(QColor("green"))
-                
-                self.freq_band_table.setItem(row, col, cell_item)
-            
-            # Highlight the best filter
-            if row == 0:
-                for col in range(self.freq_band_table.columnCount()):
-                    self.freq_band_table.item(row, col).setBackground(QColor("#d4edda"))  # Light green
-        
-        # Resize columns to content
-        self.freq_band_table.resizeColumnsToContents()
+        self._fill_metric_table(self.freq_band_table, header_labels,
+                                self._freq_values, self._freq_colors,
+                                self._freq_band_name_items)
     
     def update_plot_tabs(self):
         """Update the plot tabs with matplotlib figures"""
@@ -886,34 +1055,45 @@ class FilterComparisonWindow(QMainWindow):
             return
         
         # Helper function to add a figure to a layout
-        def add_figure_to_layout(figure, layout):
+        def add_figure_to_layout(figure, layout, tab):
             # Clear layout first
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+            self.clear_layout(layout)
             
             # Create a canvas to display the figure
             canvas = FigureCanvas(figure)
             toolbar = NavigationToolbar(canvas, self)
             
+            # Keep the canvas hidden until its tab is shown, so only the
+            # visible figure gets rendered
+            canvas.setVisible(False)
+            self._pending_canvases[tab] = canvas
+            
             # Add to layout
             layout.addWidget(toolbar)
             layout.addWidget(canvas)
         
         # Add figures to respective tabs
         if 'time' in self.figures:
-            add_figure_to_layout(self.figures['time'], self.time_plot_layout)
+            add_figure_to_layout(self.figures['time'], self.time_plot_layout, self.time_tab)
         
         if 'frequency' in self.figures:
-            add_figure_to_layout(self.figures['frequency'], self.freq_plot_layout)
+            add_figure_to_layout(self.figures['frequency'], self.freq_plot_layout, self.freq_tab)
         
         if 'fft' in self.figures:
-            add_figure_to_layout(self.figures['fft'], self.fft_plot_layout)
+            add_figure_to_layout(self.figures['fft'], self.fft_plot_layout, self.fft_tab)
         
         if 'peaks' in self.figures:
-            add_figure_to_layout(self.figures['peaks'], self.peaks_plot_layout)
+            add_figure_to_layout(self.figures['peaks'], self.peaks_plot_layout, self.peaks_tab)
+        
+        # Draw the canvas of the plot tab that is already on screen, if any
+        self.on_results_tab_changed(self.results_tabs.currentIndex())
+    
+    def on_results_tab_changed(self, index):
+        """Show and draw a plot canvas the first time its tab becomes current"""
+        canvas = self._pending_canvases.pop(self.results_tabs.widget(index), None)
+        if canvas is not None:
+            canvas.setVisible(True)
+            canvas.draw_idle()
     
     def export_report(self):
         """Export a comprehensive HTML report of the comparison"""
@@ -921,6 +1101,9 @@ class FilterComparisonWindow(QMainWindow):
             QMessageBox.warning(self, "No Results", "No comparison results to export.")
             return
         
+        if not self.data_is_idle():
+            return
+        
         # Get the directory to save the report
         output_dir = QFileDialog.getExistingDirectory(
             self, "Select Directory for Report", "", QFileDialog.ShowDirsOnly
@@ -1001,17 +1184,7 @@ class FilterConfigDialog(QDialog):
         type_layout = QHBoxLayout()
         type_layout.addWidget(QLabel("Filter Type:"))
         self.filter_type = QComboBox()
-        self.filter_type.addItems([
-            "none", 
-            "butterworth", 
-            "chebyshev1", 
-            "chebyshev2", 
-            "elliptic", 
-            "bessel", 
-            "fir", 
-            "savgol", 
-            "moving_avg"
-        ])
+        self.filter_type.addItems(_FILTER_TYPES)
         self.filter_type.currentIndexChanged.connect(self.update_parameter_ui)
         type_layout.addWidget(self.filter_type)
         layout.addLayout(type_layout)
@@ -1021,15 +1194,18 @@ class FilterConfigDialog(QDialog):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.NoFrame)
         
-        self.params_group = QWidget()
-        self.params_layout = QFormLayout(self.params_group)
-        self.params_layout.setContentsMargins(0, 0, 0, 0)
+        # One page per filter type, built on first selection and reused afterwards
+        self.params_stack = QStackedWidget()
         
-        scroll_area.setWidget(self.params_group)
+        scroll_area.setWidget(self.params_stack)
         layout.addWidget(scroll_area)
         
         # Create parameter widgets containers
+        self._pages = {}
+        self._param_widgets_per_type = {}
+        self._param_labels_per_type = {}
         self.param_widgets = {}
+        self.param_labels = {}
         
         # Initialize with empty parameters
         self.update_parameter_ui()
@@ -1042,26 +1218,41 @@ class FilterConfigDialog(QDialog):
     
     def update_parameter_ui(self):
         """
-        Rebuild the parameter panel whenever the Filter‑Type changes.
-        This version makes sure the old 'none'‑info label is completely
-        removed, so it never lingers at the bottom of the dialog.
+        Show the parameter panel whenever the Filter‑Type changes.
+        Each panel is built once, on the first selection of its type, and
+        afterwards only brought to the front of the stack.
         """
-        # ── 0.  Wipe the form clean  ────────────────────────────────────────────
-        for i in reversed(range(self.params_layout.rowCount())):
-            self.params_layout.removeRow(i)
-        self.param_widgets = {}                         # reset our widget map
-
-        # ── 1.  Which filter are we showing controls for?  ─────────────────────
         filter_type = self.filter_type.currentText()
 
-        # ── 2.  Special case: 'none'  ──────────────────────────────────────────
+        if filter_type not in self._pages:
+            self._build_parameter_page(filter_type)
+
+        self.param_widgets = self._param_widgets_per_type[filter_type]
+        self.param_labels = self._param_labels_per_type[filter_type]
+        self.params_stack.setCurrentWidget(self._pages[filter_type])
+
+    def _build_parameter_page(self, filter_type):
+        """Build the parameter page of one filter type and add it to the stack"""
+        # ── 0.  Fresh page and widget maps for this type  ──────────────────────
+        page = QWidget()
+        self.params_layout = QFormLayout(page)
+        self.params_layout.setContentsMargins(0, 0, 0, 0)
+        self.param_widgets = {}
+        self.param_labels = {}
+
+        self._pages[filter_type] = page
+        self._param_widgets_per_type[filter_type] = self.param_widgets
+        self._param_labels_per_type[filter_type] = self.param_labels
+        self.params_stack.addWidget(page)
+
+        # ── 1.  Special case: 'none'  ──────────────────────────────────────────
         if filter_type == "none":
             info_lbl = QLabel("No parameters needed for 'none' filter type.")
             info_lbl.setObjectName("_info_none")        # helpful if you ever want to find it
             self.params_layout.addRow(info_lbl)
             return                                      # <-- done for this type
 
-        # ── 3.  Parameter widgets for every other type  ────────────────────────
+        # ── 2.  Parameter widgets for every other type  ────────────────────────
         # ▷ Example for Savitzky–Golay  (repeat the same idea for the others)
         if filter_type == "savgol":
             # window_length
@@ -1095,7 +1286,7 @@ class FilterConfigDialog(QDialog):
             self.param_widgets["numtaps"] = numtaps
 
             window = QComboBox()
-            window.addItems(["hamming", "hann", "blackman", "boxcar", "kaiser"])
+            window.addItems(_FIR_WINDOWS)
             self.params_layout.addRow("Window Type:", window)
             self.param_widgets["window"] = window
 
@@ -1145,7 +1336,7 @@ class FilterConfigDialog(QDialog):
         """Add filter mode (low, high, band, bandstop) UI elements"""
         # Filter type selection (low, high, band, bandstop)
         btype = QComboBox()
-        btype.addItems(["low", "high", "band", "bandstop"])
+        btype.addItems(_BTYPES)
         self.params_layout.addRow("Filter Mode:", btype)
         self.param_widgets["btype"] = btype
         
@@ -1159,7 +1350,7 @@ class FilterConfigDialog(QDialog):
         cutoff_label = QLabel("Cutoff Frequency (Hz):")
         self.params_layout.addRow(cutoff_label, cutoff)
         self.param_widgets["cutoff"] = cutoff
-        self.cutoff_label = cutoff_label
+        self.param_labels["cutoff"] = cutoff_label
         
         # Dual cutoffs for band/bandstop
         cutoff_low = QDoubleSpinBox()
@@ -1171,7 +1362,7 @@ class FilterConfigDialog(QDialog):
         cutoff_low_label = QLabel("Low Cutoff Frequency (Hz):")
         self.params_layout.addRow(cutoff_low_label, cutoff_low)
         self.param_widgets["cutoff_low"] = cutoff_low
-        self.cutoff_low_label = cutoff_low_label
+        self.param_labels["cutoff_low"] = cutoff_low_label
         
         cutoff_high = QDoubleSpinBox()
         cutoff_high.setMinimum(0.001)
@@ -1182,7 +1373,7 @@ class FilterConfigDialog(QDialog):
         cutoff_high_label = QLabel("High Cutoff Frequency (Hz):")
         self.params_layout.addRow(cutoff_high_label, cutoff_high)
         self.param_widgets["cutoff_high"] = cutoff_high
-        self.cutoff_high_label = cutoff_high_label
+        self.param_labels["cutoff_high"] = cutoff_high_label
         
         # Connect signal to update cutoff visibility
         btype.currentTextChanged.connect(self.update_cutoff_visibility)
@@ -1196,13 +1387,13 @@ class FilterConfigDialog(QDialog):
         
         # Show/hide single cutoff
         self.param_widgets["cutoff"].setVisible(not is_band)
-        self.cutoff_label.setVisible(not is_band)
+        self.param_labels["cutoff"].setVisible(not is_band)
         
         # Show/hide dual cutoffs
         self.param_widgets["cutoff_low"].setVisible(is_band)
-        self.cutoff_low_label.setVisible(is_band)
+        self.param_labels["cutoff_low"].setVisible(is_band)
         self.param_widgets["cutoff_high"].setVisible(is_band)
-        self.cutoff_high_label.setVisible(is_band)
+        self.param_labels["cutoff_high"].setVisible(is_band)
     
     def load_config(self, config: dict):
         """
@@ -1231,11 +1422,11 @@ class FilterConfigDialog(QDialog):
         # ── 1.  Name  ──────────────────────────────────────────────────────────
         self.name_edit.setText(config.get("name", ""))
 
-        # ── 2.  Select the filter‑type in the combo; this immediately rebuilds
+        # ── 2.  Select the filter‑type in the combo; this immediately shows
         #        the parameter panel via update_parameter_ui()  ────────────────
         f_cfg = config.get("filter", {})
         f_type = f_cfg.get("type", "none")
-        self.filter_type.setCurrentText(f_type)     # triggers UI rebuild
+        self.filter_type.setCurrentText(f_type)     # triggers page switch
 
         # ── 3.  Fill in parameter values  ─────────────────────────────────────
         params = f_cfg.get("params", {})
@@ -1270,9 +1461,9 @@ class FilterConfigDialog(QDialog):
         
         filter_type = self.filter_type.currentText()
         
-        # Collect parameters
+        # Collect parameters from the page of the current filter type
         params = {}
-        for param_name, widget in self.param_widgets.items():
+        for param_name, widget in self._param_widgets_per_type[filter_type].items():
             if isinstance(widget, QComboBox):
                 params[param_name] = widget.currentText()
             elif isinstance(widget, QCheckBox):
@@ -1342,6 +1533,41 @@ class SensorPlotCanvas(FigureCanvas):
         self.axes.autoscale_view()
         self.fig.canvas.draw_idle()
     
+    def plot_sensors(self, sensors):
+        """
+        Plot several sensors at once from (sensor_name, time_array, data_array, color)
+        tuples, updating the existing lines in place and removing those not given
+        """
+        sensor_names = {sensor[0] for sensor in sensors}
+        for sensor_name in [name for name in self.plot_lines if name not in sensor_names]:
+            self.plot_lines.pop(sensor_name).remove()
+        
+        for sensor_name, time_array, data_array, color in sensors:
+            line = self.plot_lines.get(sensor_name)
+            if line is None:
+                line, = self.axes.plot(time_array, data_array, label=sensor_name, color=color, 
+                                      linewidth=1.5, marker='', markersize=2)
+                self.plot_lines[sensor_name] = line
+            else:
+                line.set_data(time_array, data_array)
+                # None keeps the color the line already took from the color cycle
+                if color is not None:
+                    line.set_color(color)
+        
+        # One legend in the given sensor order
+        if sensors:
+            self.axes.legend(handles=[self.plot_lines[sensor[0]] for sensor in sensors])
+            self.legend_added = True
+        elif self.legend_added:
+            self.axes.get_legend().remove()
+            self.legend_added = False
+        
+        # Auto-scale the axes, as a freshly cleared plot would
+        self.axes.relim()
+        self.axes.set_autoscale_on(True)
+        self.axes.autoscale_view()
+        self.fig.canvas.draw_idle()
+    
     def clear_plot(self):
         """Clear all plots"""
         self.axes.clear()
@@ -1375,25 +1601,84 @@ class SensorPlotCanvas(FigureCanvas):
 
 class LogTextEdit(QTextEdit):
     """Custom text edit for logging with level-based formatting"""
+    # Messages arriving within this many milliseconds are added to the document together
+    FLUSH_INTERVAL_MS = 100
+    # Oldest lines are dropped beyond this many, so long live-update sessions stay bounded
+    MAX_LINES = 5000
+    # Text color of each message level, other levels are shown in black
+    LEVEL_COLORS = {
+        "INFO": "magenta",
+        "WARNING": "orange",
+        "ERROR": "red",
+        "SUCCESS": "green"
+    }
+    
     def __init__(self, parent=None):
         super(LogTextEdit, self).__init__(parent)
         self.setReadOnly(True)
+        self.document().setMaximumBlockCount(self.MAX_LINES)
         
-    def append_message(self, message, level="INFO"):
-        """Append a message with level-based formatting"""
-        color_map = {
-            "INFO": "magenta",
-            "WARNING": "orange",
-            "ERROR": "red",
-            "SUCCESS": "green"
-        }
+        # Formatted messages waiting for the next flush
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
         
-        color = color_map.get(level, "black")
-        formatted_msg = f"<span style='color:{color};'><b>[{level}]</b> {message}</span>"
-        self.append(formatted_msg)
+    def append_message(self, message, level="INFO"):
+        """Queue a message with level-based formatting, it is shown on the next flush"""
+        self._pending.append(self.format_message(message, level))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def append_messages(self, entries):
+        """Queue several (message, level) pairs at once, they are shown on the next flush"""
+        format_message = self.format_message
+        self._pending.extend(format_message(message, level) for message, level in entries)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def format_message(self, message, level):
+        """HTML of a message in the color of its level"""
+        color = self.LEVEL_COLORS.get(level, "black")
+        return f"<span style='color:{color};'><b>[{level}]</b> {message}</span>"
+    
+    @Slot()
+    def flush(self):
+        """Add all queued messages to the document in a single edit"""
+        if not self._pending:
+            return
+        messages, self._pending = self._pending, []
+        
+        scroll_bar = self.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for message in messages:
+            # One paragraph per message, like append()
+            if not self.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(message)
+        cursor.endEditBlock()
+        
+        # Keep following the log if it was scrolled to the end
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+    
+    def clear(self):
+        """Clear the log, including messages not shown yet"""
+        self._pending = []
+        self._flush_timer.stop()
+        super(LogTextEdit, self).clear()
 
 class ConfigurationEditorDialog(QDialog):
     """Dialog for editing the full configuration"""
+    # Style sheets of the detrend degree label when the degree is used / unused
+    _LBL_STYLE_ACTIVE = ""
+    _LBL_STYLE_DISABLED = "color: gray;"
+    
     def __init__(self, config, units_converter, parent=None):
         super(ConfigurationEditorDialog, self).__init__(parent)
         self.setWindowTitle("Configuration Editor")
@@ -1403,6 +1688,11 @@ class ConfigurationEditorDialog(QDialog):
         self.config = config.copy() if config else {}
         self.units_converter = units_converter
         
+        # Unit list models per data type, shared by the data unit combos
+        self._unit_models = {}
+        # Combo index of each data type name
+        self._unit_var_index = {name: i for i, name in enumerate(self.units_converter.unit_vars)}
+        
         # Main layout
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
@@ -1411,11 +1701,21 @@ class ConfigurationEditorDialog(QDialog):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Create tabs for different configuration sections
-        self.create_basic_settings_tab()
-        self.create_units_tab()
-        self.create_data_mapping_tab()
-        self.create_corrections_tab()
+        # Create tabs for different configuration sections. Each tab starts as an
+        # empty page and its widgets are only built the first time it is shown.
+        self._tab_builders = {}
+        for title, builder in [("Basic Settings", self.create_basic_settings_tab),
+                               ("Units", self.create_units_tab),
+                               ("Data Mapping", self.create_data_mapping_tab),
+                               ("Data Corrections", self.create_corrections_tab)]:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            index = self.tab_widget.addTab(page, title)
+            self._tab_builders[index] = builder
+        
+        self.tab_widget.currentChanged.connect(self.build_tab)
+        self.build_tab(self.tab_widget.currentIndex())
         
         # Add buttons
         buttons_layout = QHBoxLayout()
@@ -1427,6 +1727,17 @@ class ConfigurationEditorDialog(QDialog):
         buttons_layout.addWidget(self.ok_button)
         main_layout.addLayout(buttons_layout)
     
+    def build_tab(self, index):
+        """Build the widgets of a tab the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+    
+    def build_pending_tabs(self):
+        """Build every tab that has not been shown yet"""
+        for index in sorted(self._tab_builders):
+            self.build_tab(index)
+    
     # ADD NEW METHOD FOR FILTER
     def edit_filter_parameters(self):
         """Open dialog to edit filter parameters"""
@@ -1440,129 +1751,17 @@ class ConfigurationEditorDialog(QDialog):
         if not hasattr(self, 'filter_params') or self.filter_params is None:
             self.filter_params = {}
         
-        # Create different parameter fields based on filter type
+        # Create only the parameter fields the filter type needs
         if filter_type == "savgol":
-            # Savitzky-Golay filter parameters
-            window_length = QSpinBox()
-            window_length.setMinimum(3)
-            window_length.setMaximum(100001)
-            window_length.setSingleStep(2)  # Must be odd
-            window_length.setValue(self.filter_params.get("window_length", 11))
-            layout.addRow("Window Length:", window_length)
-            
-            polyorder = QSpinBox()
-            polyorder.setMinimum(1)
-            polyorder.setMaximum(10)
-            polyorder.setValue(self.filter_params.get("polyorder", 3))
-            layout.addRow("Polynomial Order:", polyorder)
-            
+            widgets = self._build_savgol_widgets(layout)
         elif filter_type == "moving_avg":
-            # Moving average filter parameters
-            window_size = QSpinBox()
-            window_size.setMinimum(2)
-            window_size.setMaximum(100001)
-            window_size.setValue(self.filter_params.get("window_size", 11))
-            layout.addRow("Window Size:", window_size)
-            
-        elif filter_type in ["butterworth", "chebyshev1", "chebyshev2", "elliptic", "bessel", "fir"]:
-            # Common IIR and FIR filter parameters
-            
-            # For FIR filters, we need numtaps
-            if filter_type == "fir":
-                numtaps = QSpinBox()
-                numtaps.setMinimum(3)
-                numtaps.setMaximum(1001)
-                numtaps.setSingleStep(2)  # Keep it odd
-                numtaps.setValue(self.filter_params.get("numtaps", 101))
-                layout.addRow("Number of Taps:", numtaps)
-                
-                window_type = QComboBox()
-                window_type.addItems(["hamming", "hann", "blackman", "boxcar", "kaiser"])
-                window_type.setCurrentText(self.filter_params.get("window", "hamming"))
-                layout.addRow("Window Type:", window_type)
-            
-            # For IIR filters, we need order
-            if filter_type in ["butterworth", "chebyshev1", "chebyshev2", "elliptic", "bessel"]:
-                order = QSpinBox()
-                order.setMinimum(1)
-                order.setMaximum(20)
-                order.setValue(self.filter_params.get("order", 4))
-                layout.addRow("Order:", order)
-            
-            # Ripple parameters for Chebyshev and Elliptic
-            if filter_type in ["chebyshev1", "elliptic"]:
-                rp = QDoubleSpinBox()
-                rp.setMinimum(0.1)
-                rp.setMaximum(20.0)
-                rp.setSingleStep(0.1)
-                rp.setDecimals(1)
-                rp.setValue(self.filter_params.get("rp", 1.0))
-                layout.addRow("Passband Ripple (dB):", rp)
-            
-            if filter_type in ["chebyshev2", "elliptic"]:
-                rs = QDoubleSpinBox()
-                rs.setMinimum(10.0)
-                rs.setMaximum(120.0)
-                rs.setSingleStep(1.0)
-                rs.setDecimals(1)
-                rs.setValue(self.filter_params.get("rs", 40.0))
-                layout.addRow("Stopband Attenuation (dB):", rs)
-            
-            # Zero-phase option
-            zero_phase = QCheckBox("Enable Zero-Phase Filtering")
-            zero_phase.setChecked(self.filter_params.get("zero_phase", True))
-            zero_phase.setToolTip("Eliminates phase distortion but doubles filter order")
-            layout.addRow("", zero_phase)
-            
-            # Filter type selection (low, high, band, bandstop)
-            btype = QComboBox()
-            btype.addItems(["low", "high", "band", "bandstop"])
-            btype.setCurrentText(self.filter_params.get("btype", "low"))
-            layout.addRow("Filter Mode:", btype)
-            
-            # Single cutoff for low/high pass
-            cutoff = QDoubleSpinBox()
-            cutoff.setMinimum(0.001)
-            cutoff.setMaximum(99999.0)
-            cutoff.setSingleStep(0.01)
-            cutoff.setDecimals(3)
-            cutoff.setValue(self.filter_params.get("cutoff", 0.1))
-            cutoff_row = layout.addRow("Cutoff Frequency (Hz):", cutoff)
-            
-            # Dual cutoffs for band/bandstop
-            cutoff_low = QDoubleSpinBox()
-            cutoff_low.setMinimum(0.001)
-            cutoff_low.setMaximum(99999.0)
-            cutoff_low.setSingleStep(0.01)
-            cutoff_low.setDecimals(3)
-            cutoff_low.setValue(self.filter_params.get("cutoff_low", 0.1))
-            cutoff_low_row = layout.addRow("Low Cutoff Frequency (Hz):", cutoff_low)
-            
-            cutoff_high = QDoubleSpinBox()
-            cutoff_high.setMinimum(0.001)
-            cutoff_high.setMaximum(99999.0)
-            cutoff_high.setSingleStep(0.01)
-            cutoff_high.setDecimals(3)
-            cutoff_high.setValue(self.filter_params.get("cutoff_high", 0.2))
-            cutoff_high_row = layout.addRow("High Cutoff Frequency (Hz):", cutoff_high)
-            
-            # Function to update visibility of cutoff fields based on filter type
-            def update_cutoff_visibility():
-                is_band = btype.currentText() in ["band", "bandstop"]
-                # For band filters, show low/high cutoffs, hide single cutoff
-                # For low/high filters, hide low/high cutoffs, show single cutoff
-                cutoff.setVisible(not is_band)
-                layout.labelForField(cutoff).setVisible(not is_band)
-                cutoff_low.setVisible(is_band)
-                layout.labelForField(cutoff_low).setVisible(is_band)
-                cutoff_high.setVisible(is_band)
-                layout.labelForField(cutoff_high).setVisible(is_band)
-            
-            # Connect signal
-            btype.currentTextChanged.connect(update_cutoff_visibility)
-            
-            # Initialize visibility
-            update_cutoff_visibility()
+            widgets = self._build_moving_avg_widgets(layout)
+        elif filter_type == "fir":
+            widgets = self._build_fir_widgets(layout)
+        elif filter_type in ["butterworth", "chebyshev1", "chebyshev2", "elliptic", "bessel"]:
+            widgets = self._build_iir_widgets(layout, filter_type)
+        else:
+            widgets = {}
         
         # Add buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -1574,45 +1773,160 @@ class ConfigurationEditorDialog(QDialog):
             # Update filter parameters based on the selected filter type
             self.filter_params = {}
             
-            if filter_type == "savgol":
-                self.filter_params["window_length"] = window_length.value()
-                self.filter_params["polyorder"] = polyorder.value()
-                
-            elif filter_type == "moving_avg":
-                self.filter_params["window_size"] = window_size.value()
-                
-            elif filter_type == "fir":
-                self.filter_params["numtaps"] = numtaps.value()
-                self.filter_params["window"] = window_type.currentText()
-                self.filter_params["zero_phase"] = zero_phase.isChecked()
-                self.filter_params["btype"] = btype.currentText()
-                
-                # Store the appropriate cutoff values based on filter type
-                if btype.currentText() in ["band", "bandstop"]:
-                    self.filter_params["cutoff_low"] = cutoff_low.value()
-                    self.filter_params["cutoff_high"] = cutoff_high.value()
+            for param_name, widget in widgets.items():
+                if isinstance(widget, QComboBox):
+                    self.filter_params[param_name] = widget.currentText()
+                elif isinstance(widget, QCheckBox):
+                    self.filter_params[param_name] = widget.isChecked()
                 else:
-                    self.filter_params["cutoff"] = cutoff.value()
-                    
-            elif filter_type in ["butterworth", "chebyshev1", "chebyshev2", "elliptic", "bessel"]:
-                self.filter_params["order"] = order.value()
-                
-                # Add ripple parameters for relevant filter types
-                if filter_type in ["chebyshev1", "elliptic"]:
-                    self.filter_params["rp"] = rp.value()
-                    
-                if filter_type in ["chebyshev2", "elliptic"]:
-                    self.filter_params["rs"] = rs.value()
-                    
-                self.filter_params["zero_phase"] = zero_phase.isChecked()
-                self.filter_params["btype"] = btype.currentText()
-                
-                # Store the appropriate cutoff values based on filter type
-                if btype.currentText() in ["band", "bandstop"]:
-                    self.filter_params["cutoff_low"] = cutoff_low.value()
-                    self.filter_params["cutoff_high"] = cutoff_high.value()
+                    self.filter_params[param_name] = widget.value()
+            
+            # Store the appropriate cutoff values based on filter type
+            if "btype" in self.filter_params:
+                if self.filter_params["btype"] in ["band", "bandstop"]:
+                    self.filter_params.pop("cutoff", None)
                 else:
-                    self.filter_params["cutoff"] = cutoff.value()
+                    self.filter_params.pop("cutoff_low", None)
+                    self.filter_params.pop("cutoff_high", None)
+    
+    def _build_savgol_widgets(self, layout):
+        """Add the Savitzky-Golay filter parameter fields to a form layout"""
+        window_length = QSpinBox()
+        _configure_spin(window_length, lo=3, hi=100001, step=2,  # Must be odd
+                        value=self.filter_params.get("window_length", 11))
+        layout.addRow("Window Length:", window_length)
+        
+        polyorder = QSpinBox()
+        _configure_spin(polyorder, lo=1, hi=10, value=self.filter_params.get("polyorder", 3))
+        layout.addRow("Polynomial Order:", polyorder)
+        
+        return {"window_length": window_length, "polyorder": polyorder}
+    
+    def _build_moving_avg_widgets(self, layout):
+        """Add the moving average filter parameter fields to a form layout"""
+        window_size = QSpinBox()
+        _configure_spin(window_size, lo=2, hi=100001,
+                        value=self.filter_params.get("window_size", 11))
+        layout.addRow("Window Size:", window_size)
+        
+        return {"window_size": window_size}
+    
+    def _build_fir_widgets(self, layout):
+        """Add the FIR filter parameter fields to a form layout"""
+        numtaps = QSpinBox()
+        _configure_spin(numtaps, lo=3, hi=1001, step=2,  # Keep it odd
+                        value=self.filter_params.get("numtaps", 101))
+        layout.addRow("Number of Taps:", numtaps)
+        
+        window_type = QComboBox()
+        window_type.addItems(_FIR_WINDOWS)
+        window_type.setCurrentText(self.filter_params.get("window", "hamming"))
+        layout.addRow("Window Type:", window_type)
+        
+        widgets = {"numtaps": numtaps, "window": window_type}
+        self._build_filter_mode_widgets(layout, widgets)
+        return widgets
+    
+    def _build_iir_widgets(self, layout, filter_type):
+        """Add the IIR filter parameter fields to a form layout"""
+        order = QSpinBox()
+        _configure_spin(order, lo=1, hi=20, value=self.filter_params.get("order", 4))
+        layout.addRow("Order:", order)
+        widgets = {"order": order}
+        
+        # Ripple parameters for Chebyshev and Elliptic
+        if filter_type in ["chebyshev1", "elliptic"]:
+            rp = QDoubleSpinBox()
+            _configure_spin(rp, lo=0.1, hi=20.0, step=0.1, decimals=1,
+                            value=self.filter_params.get("rp", 1.0))
+            layout.addRow("Passband Ripple (dB):", rp)
+            widgets["rp"] = rp
+        
+        if filter_type in ["chebyshev2", "elliptic"]:
+            rs = QDoubleSpinBox()
+            _configure_spin(rs, lo=10.0, hi=120.0, step=1.0, decimals=1,
+                            value=self.filter_params.get("rs", 40.0))
+            layout.addRow("Stopband Attenuation (dB):", rs)
+            widgets["rs"] = rs
+        
+        self._build_filter_mode_widgets(layout, widgets)
+        return widgets
+    
+    def _build_filter_mode_widgets(self, layout, widgets):
+        """
+        Add the zero-phase, filter mode and cutoff fields shared by IIR and FIR filters.
+        The band cutoff fields are only created the first time a band mode is selected.
+        """
+        # Zero-phase option
+        zero_phase = QCheckBox("Enable Zero-Phase Filtering")
+        zero_phase.setChecked(self.filter_params.get("zero_phase", True))
+        zero_phase.setToolTip("Eliminates phase distortion but doubles filter order")
+        layout.addRow("", zero_phase)
+        widgets["zero_phase"] = zero_phase
+        
+        # Filter type selection (low, high, band, bandstop)
+        btype = QComboBox()
+        _add_choices(btype, _BTYPES)
+        btype.setCurrentIndex(_BTYPE_INDEX.get(self.filter_params.get("btype", "low"), 0))
+        layout.addRow("Filter Mode:", btype)
+        widgets["btype"] = btype
+        
+        # Single cutoff for low/high pass
+        cutoff = QDoubleSpinBox()
+        _configure_spin(cutoff, lo=0.001, hi=99999.0, step=0.01, decimals=3,
+                        value=self.filter_params.get("cutoff", 0.1))
+        cutoff_row = layout.rowCount()
+        cutoff_label = QLabel("Cutoff Frequency (Hz):")
+        layout.addRow(cutoff_label, cutoff)
+        widgets["cutoff"] = cutoff
+        
+        # Row labels of the band cutoff fields, kept to toggle them with their fields
+        band_labels = []
+        last_is_band = None
+        
+        def build_band_cutoffs():
+            # Dual cutoffs for band/bandstop, inserted right below the single cutoff
+            cutoff_low = QDoubleSpinBox()
+            _configure_spin(cutoff_low, lo=0.001, hi=99999.0, step=0.01, decimals=3,
+                            value=self.filter_params.get("cutoff_low", 0.1))
+            cutoff_low_label = QLabel("Low Cutoff Frequency (Hz):")
+            layout.insertRow(cutoff_row + 1, cutoff_low_label, cutoff_low)
+            widgets["cutoff_low"] = cutoff_low
+            
+            cutoff_high = QDoubleSpinBox()
+            _configure_spin(cutoff_high, lo=0.001, hi=99999.0, step=0.01, decimals=3,
+                            value=self.filter_params.get("cutoff_high", 0.2))
+            cutoff_high_label = QLabel("High Cutoff Frequency (Hz):")
+            layout.insertRow(cutoff_row + 2, cutoff_high_label, cutoff_high)
+            widgets["cutoff_high"] = cutoff_high
+            
+            band_labels.extend((cutoff_low_label, cutoff_high_label))
+        
+        # Function to update visibility of cutoff fields based on filter type
+        def update_cutoff_visibility():
+            nonlocal last_is_band
+            is_band = btype.currentText() in ["band", "bandstop"]
+            if is_band == last_is_band:
+                return  # e.g. low -> high, nothing to show or hide
+            last_is_band = is_band
+            
+            if is_band and "cutoff_low" not in widgets:
+                build_band_cutoffs()
+            # For band filters, show low/high cutoffs, hide single cutoff
+            # For low/high filters, hide low/high cutoffs, show single cutoff
+            cutoff.setVisible(not is_band)
+            cutoff_label.setVisible(not is_band)
+            if band_labels:
+                widgets["cutoff_low"].setVisible(is_band)
+                widgets["cutoff_high"].setVisible(is_band)
+                for label in band_labels:
+                    label.setVisible(is_band)
+        
+        # Connect signal
+        btype.currentTextChanged.connect(update_cutoff_visibility)
+        
+        # Initialize visibility
+        update_cutoff_visibility()
 
     def create_basic_settings_tab(self):
         """Create the tab for basic settings"""
@@ -1620,6 +1934,10 @@ class ConfigurationEditorDialog(QDialog):
         layout = QFormLayout()
         tab.setLayout(layout)
         
+        # Hold off layout passes and repaints until every row is added
+        tab.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        
         # File path
         self.file_path_edit = QLineEdit(self.config.get("file_path", ""))
         file_path_layout = QHBoxLayout()
@@ -1631,14 +1949,14 @@ class ConfigurationEditorDialog(QDialog):
         
         # Separator
         self.separator_combo = QComboBox()
-        self.separator_combo.addItems([",", ";", "\\t", " ", "|"])
-        self.separator_combo.setCurrentText(self.config.get("seperator", ","))
+        _add_choices(self.separator_combo, _SEPARATORS)
+        self.separator_combo.setCurrentIndex(_SEPARATOR_INDEX.get(self.config.get("seperator", ","), 0))
         layout.addRow("Separator:", self.separator_combo)
         
         # Decimal
         self.decimal_combo = QComboBox()
-        self.decimal_combo.addItems([".", ","])
-        self.decimal_combo.setCurrentText(self.config.get("decimal", "."))
+        _add_choices(self.decimal_combo, _DECIMALS)
+        self.decimal_combo.setCurrentIndex(_DECIMAL_INDEX.get(self.config.get("decimal", "."), 0))
         layout.addRow("Decimal:", self.decimal_combo)
         
         # Start and end rows
@@ -1667,7 +1985,10 @@ class ConfigurationEditorDialog(QDialog):
         self.time_column_edit.setMaxLength(2)
         layout.addRow("Time Column:", self.time_column_edit)
         
-        self.tab_widget.addTab(tab, "Basic Settings")
+        layout.setEnabled(True)
+        tab.setUpdatesEnabled(True)
+        
+        return tab
     
     def create_units_tab(self):
         """Create the tab for units settings"""
@@ -1675,16 +1996,17 @@ class ConfigurationEditorDialog(QDialog):
         layout = QFormLayout()
         tab.setLayout(layout)
         
+        # Hold off layout passes and repaints until every row is added
+        tab.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        
         # Data type
-        self.data_type_combo = QComboBox()
+        self.data_type_combo = _fix_combo_width(QComboBox(), 16)
         self.data_type_combo.addItems(self.units_converter.unit_names)
         
         # Set current data type
         current_data_type = self.config.get("data_type", "Length")
-        for i, type_name in enumerate(self.units_converter.unit_vars):
-            if type_name == current_data_type:
-                self.data_type_combo.setCurrentIndex(i)
-                break
+        self.data_type_combo.setCurrentIndex(self._unit_var_index.get(current_data_type, 0))
         
         layout.addRow("Data Type:", self.data_type_combo)
         
@@ -1694,69 +2016,81 @@ class ConfigurationEditorDialog(QDialog):
         # Input units
         input_units = self.config.get("input_units", {})
         
-        # Time units
-        self.input_time_combo = QComboBox()
-        time_units = list(self.units_converter.units["Time"].keys())
-        self.input_time_combo.addItems(time_units)
+        # Time units (one list model shared by the input and output combos)
+        time_model = self.get_unit_model("Time")
+        self.input_time_combo = _fix_combo_width(QComboBox(), 16)
+        self.input_time_combo.setModel(time_model)
         self.input_time_combo.setCurrentText(input_units.get("time", "s"))
         layout.addRow("Input Time Unit:", self.input_time_combo)
         
         # Data units
-        self.input_data_combo = QComboBox()
+        self.input_data_combo = _fix_combo_width(QComboBox(), 16)
         layout.addRow("Input Data Unit:", self.input_data_combo)
         
         # Output units
         output_units = self.config.get("output_units", {})
         
         # Output time units
-        self.output_time_combo = QComboBox()
-        self.output_time_combo.addItems(time_units)
+        self.output_time_combo = _fix_combo_width(QComboBox(), 16)
+        self.output_time_combo.setModel(time_model)
         self.output_time_combo.setCurrentText(output_units.get("time", "s"))
         layout.addRow("Output Time Unit:", self.output_time_combo)
         
         # Output data units
-        self.output_data_combo = QComboBox()
+        self.output_data_combo = _fix_combo_width(QComboBox(), 16)
         layout.addRow("Output Data Unit:", self.output_data_combo)
         
         # Initialize data unit combos
         self.update_unit_combos()
         
-        self.tab_widget.addTab(tab, "Units")
+        layout.setEnabled(True)
+        tab.setUpdatesEnabled(True)
+        
+        return tab
+    
+    def get_unit_model(self, unit_type):
+        """Return the (cached) list model with the unit names of a data type"""
+        model = self._unit_models.get(unit_type)
+        if model is None:
+            model = QStringListModel(list(self.units_converter.units[unit_type].keys()), self)
+            self._unit_models[unit_type] = model
+        return model
     
     def update_unit_combos(self):
         """Update the data unit combos based on the selected data type"""
         selected_type = self.units_converter.unit_vars[self.data_type_combo.currentIndex()]
-        data_units = list(self.units_converter.units[selected_type].keys())
+        unit_model = self.get_unit_model(selected_type)
+        data_units = unit_model.stringList()
         
         # Save current selections if possible
         input_data_current = self.input_data_combo.currentText() if self.input_data_combo.count() > 0 else ""
         output_data_current = self.output_data_combo.currentText() if self.output_data_combo.count() > 0 else ""
         
-        # Clear and repopulate
-        self.input_data_combo.clear()
-        self.output_data_combo.clear()
-        
-        self.input_data_combo.addItems(data_units)
-        self.output_data_combo.addItems(data_units)
-        
-        # Get current units from config
-        input_units = self.config.get("input_units", {})
-        output_units = self.config.get("output_units", {})
-        
-        # Try to restore selections
-        if input_data_current in data_units:
-            self.input_data_combo.setCurrentText(input_data_current)
-        elif "data" in input_units and input_units["data"] in data_units:
-            self.input_data_combo.setCurrentText(input_units["data"])
-        else:
-            self.input_data_combo.setCurrentIndex(0)
+        # Swap the model and restore the selections without emitting the
+        # intermediate index changes
+        with QSignalBlocker(self.input_data_combo), QSignalBlocker(self.output_data_combo):
+            # Switch both combos to the unit list of the selected type
+            self.input_data_combo.setModel(unit_model)
+            self.output_data_combo.setModel(unit_model)
+        
+            # Get current units from config
+            input_units = self.config.get("input_units", {})
+            output_units = self.config.get("output_units", {})
+        
+            # Try to restore selections
+            if input_data_current in data_units:
+                self.input_data_combo.setCurrentText(input_data_current)
+            elif "data" in input_units and input_units["data"] in data_units:
+                self.input_data_combo.setCurrentText(input_units["data"])
+            else:
+                self.input_data_combo.setCurrentIndex(0)
         
-        if output_data_current in data_units:
-            self.output_data_combo.setCurrentText(output_data_current)
-        elif "data" in output_units and output_units["data"] in data_units:
-            self.output_data_combo.setCurrentText(output_units["data"])
-        else:
-            self.output_data_combo.setCurrentIndex(0)
+            if output_data_current in data_units:
+                self.output_data_combo.setCurrentText(output_data_current)
+            elif "data" in output_units and output_units["data"] in data_units:
+                self.output_data_combo.setCurrentText(output_units["data"])
+            else:
+                self.output_data_combo.setCurrentIndex(0)
     
     def create_data_mapping_tab(self):
         """Create the tab for data mapping settings"""
@@ -1764,24 +2098,29 @@ class ConfigurationEditorDialog(QDialog):
         layout = QVBoxLayout()
         tab.setLayout(layout)
         
-        # Create a table for data mapping
-        self.data_mapping_table = QTableWidget()
-        self.data_mapping_table.setColumnCount(3)
-        self.data_mapping_table.setHorizontalHeaderLabels(["Original Name", "Column", "Display Name"])
-        self.data_mapping_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.data_mapping_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        # Hold off layout passes and repaints until every row is added
+        tab.setUpdatesEnabled(False)
+        layout.setEnabled(False)
         
-        # Fill the table with current data
+        # Fill the mapping model with current data before attaching it to the
+        # view, so the table is laid out and painted once
         data_columns = self.config.get("data", {})
         data_names = self.config.get("data_name", {})
         
-        self.data_mapping_table.setRowCount(len(data_columns))
+        self._mapping_model = QStandardItemModel(len(data_columns), 3, self)
+        self._mapping_model.setHorizontalHeaderLabels(["Original Name", "Column", "Display Name"])
         
         for i, (orig_name, column) in enumerate(data_columns.items()):
-            self.data_mapping_table.setItem(i, 0, QTableWidgetItem(orig_name))
-            self.data_mapping_table.setItem(i, 1, QTableWidgetItem(column))
+            self._mapping_model.setItem(i, 0, QStandardItem(orig_name))
+            self._mapping_model.setItem(i, 1, QStandardItem(column))
             display_name = data_names.get(orig_name, orig_name)
-            self.data_mapping_table.setItem(i, 2, QTableWidgetItem(display_name))
+            self._mapping_model.setItem(i, 2, QStandardItem(display_name))
+        
+        # Create a table for data mapping
+        self.data_mapping_table = QTableView()
+        self.data_mapping_table.setModel(self._mapping_model)
+        self.data_mapping_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.data_mapping_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         
         layout.addWidget(self.data_mapping_table)
         
@@ -1798,17 +2137,21 @@ class ConfigurationEditorDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        self.tab_widget.addTab(tab, "Data Mapping")
+        layout.setEnabled(True)
+        tab.setUpdatesEnabled(True)
+        
+        return tab
     
     def add_sensor_mapping(self):
         """Add a new row to the data mapping table"""
-        row = self.data_mapping_table.rowCount()
-        self.data_mapping_table.setRowCount(row + 1)
+        row = self._mapping_model.rowCount()
         
         # Set default values
-        self.data_mapping_table.setItem(row, 0, QTableWidgetItem(f"Sensor_{row+1}"))
-        self.data_mapping_table.setItem(row, 1, QTableWidgetItem(""))
-        self.data_mapping_table.setItem(row, 2, QTableWidgetItem(f"S{row+1}"))
+        self._mapping_model.appendRow([
+            QStandardItem(f"Sensor_{row+1}"),
+            QStandardItem(""),
+            QStandardItem(f"S{row+1}")
+        ])
     
     def remove_sensor_mapping(self):
         """Remove the selected row from the data mapping table"""
@@ -1820,13 +2163,17 @@ class ConfigurationEditorDialog(QDialog):
         rows = sorted([row.row() for row in selected_rows], reverse=True)
         
         for row in rows:
-            self.data_mapping_table.removeRow(row)
+            self._mapping_model.removeRow(row)
     
     def create_corrections_tab(self):
         """Create the tab for data correction settings with improved layout"""
         tab = QWidget()
         tab_layout = QVBoxLayout()
         tab.setLayout(tab_layout)
+        
+        # Hold off layout passes and repaints until every row is added
+        tab.setUpdatesEnabled(False)
+        tab_layout.setEnabled(False)
 
         # Add note about processing order at the top
         note_label = QLabel("NOTE: Corrections are applied in numerical order when multiple options are enabled.")
@@ -1838,6 +2185,17 @@ class ConfigurationEditorDialog(QDialog):
         tab_layout.addSpacing(10)
         
         correction_config = self.config.get("data_correction", {})
+        trim_cfg = correction_config.get("trim_time") or {}
+        resample_cfg = correction_config.get("resample") or {}
+        shift_time_cfg = correction_config.get("shift_time") or {}
+        zero_start_y_cfg = correction_config.get("zero_start_y") or {}
+        reverse_y_cfg = correction_config.get("reverse_y") or {}
+        detrend_cfg = correction_config.get("detrend") or {}
+        derivative_cfg = correction_config.get("derivative") or {}
+        filter_cfg = correction_config.get("filter") or {}
+        stretch_y_cfg = correction_config.get("stretch_y") or {}
+        normalize_cfg = correction_config.get("normilized") or {}
+        zero_start_time_cfg = correction_config.get("zero_start_time") or {}
 
         grid_layout = QGridLayout()
         grid_layout.setColumnStretch(0, 0)
@@ -1856,96 +2214,84 @@ class ConfigurationEditorDialog(QDialog):
         # 1. TRIM Correction
         grid_layout.addWidget(QLabel("1. Trim Time Correction:"), current_row, 0)
         self.trim_check = QCheckBox("Enable")
-        self.trim_check.setChecked(correction_config.get("trim_time", {}).get("process", False))
+        self.trim_check.setChecked(trim_cfg.get("process", False))
         grid_layout.addWidget(self.trim_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Start:"), current_row, 2)
         self.trim_start_time = SmartQDoubleSpinBox()
-        self.trim_start_time.setMinimum(-100000.0)
-        self.trim_start_time.setMaximum(100000.0)
-        self.trim_start_time.setSingleStep(0.1)
-        self.trim_start_time.setDecimals(8)  # <-- Allow many decimals
-        trim_start = correction_config.get("trim_time", {}).get("start_time")
+        _configure_spin(self.trim_start_time, lo=-100000.0, hi=100000.0, step=0.1, decimals=8)  # <-- Allow many decimals
+        trim_start = trim_cfg.get("start_time")
         self.trim_start_time.setValue(0.0 if trim_start is None else float(trim_start))
         grid_layout.addWidget(self.trim_start_time, current_row, 3)
 
         grid_layout.addWidget(QLabel("End:"), current_row, 4)
         self.trim_end_time = SmartQDoubleSpinBox()
-        self.trim_end_time.setMinimum(-100000.0)
-        self.trim_end_time.setMaximum(100000.0)
-        self.trim_end_time.setSingleStep(0.1)
-        self.trim_end_time.setDecimals(8)  # <-- Allow many decimals
-        trim_end = correction_config.get("trim_time", {}).get("end_time")
-        self.trim_end_time.setValue(10.0 if trim_end is None else float(trim_end))
+        _configure_spin(self.trim_end_time, lo=-100000.0, hi=100000.0, step=0.1, decimals=8)  # <-- Allow many decimals
+        trim_end = trim_cfg.get("end_time")
+        self.trim_end_time.setValue(10.0 if trim_end is None else float(trim_end))  # 0.0 is a valid end time
         grid_layout.addWidget(self.trim_end_time, current_row, 5)
         current_row += 1
 
         # 2. RESAMPLE Correction
         grid_layout.addWidget(QLabel("2. Resample Correction:"), current_row, 0)
         self.resample_check = QCheckBox("Enable")
-        self.resample_check.setChecked(correction_config.get("resample", {}).get("process", False))
+        self.resample_check.setChecked(resample_cfg.get("process", False))
         grid_layout.addWidget(self.resample_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Rate (Hz):"), current_row, 2)
         self.resample_value = SmartQDoubleSpinBox()
-        self.resample_value.setMinimum(0.001)
-        self.resample_value.setMaximum(100000.0)
-        self.resample_value.setDecimals(8)  # <-- Allow many decimals
-        resample_value = correction_config.get("resample", {}).get("value")
-        self.resample_value.setValue(100.0 if resample_value is None else float(resample_value))
+        _configure_spin(self.resample_value, lo=0.001, hi=100000.0, decimals=8)  # <-- Allow many decimals
+        resample_value = resample_cfg.get("value")
+        self.resample_value.setValue(float(resample_value or 100.0))  # 0 Hz is not a valid rate
         grid_layout.addWidget(self.resample_value, current_row, 3)
 
         grid_layout.addWidget(QLabel("Method:"), current_row, 4)
         self.resample_method = QComboBox()
-        self.resample_method.addItems(["linear", "cubic", "nearest"])
-        current_method = correction_config.get("resample", {}).get("method", "linear")
-        self.resample_method.setCurrentText(current_method)
+        _add_choices(self.resample_method, _RESAMPLE_METHODS)
+        current_method = resample_cfg.get("method", "linear")
+        self.resample_method.setCurrentIndex(_RESAMPLE_METHOD_INDEX.get(current_method, 0))
         grid_layout.addWidget(self.resample_method, current_row, 5)
         current_row += 1
 
         # 3. SHIFT_TIME Correction
         grid_layout.addWidget(QLabel("3. Shift Time Correction:"), current_row, 0)
         self.shift_time_check = QCheckBox("Enable")
-        self.shift_time_check.setChecked(correction_config.get("shift_time", {}).get("process", False))
+        self.shift_time_check.setChecked(shift_time_cfg.get("process", False))
         grid_layout.addWidget(self.shift_time_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Shift (s):"), current_row, 2)
         self.shift_time_value = SmartQDoubleSpinBox()
-        self.shift_time_value.setMinimum(-100000.0)
-        self.shift_time_value.setMaximum(100000.0)
-        self.shift_time_value.setSingleStep(0.1)
-        self.shift_time_value.setDecimals(8)  # <-- Allow many decimals
-        shift_time_value = correction_config.get("shift_time", {}).get("value")
-        self.shift_time_value.setValue(0.0 if shift_time_value is None else float(shift_time_value))
+        _configure_spin(self.shift_time_value, lo=-100000.0, hi=100000.0, step=0.1, decimals=8)  # <-- Allow many decimals
+        shift_time_value = shift_time_cfg.get("value")
+        self.shift_time_value.setValue(float(shift_time_value or 0.0))
         grid_layout.addWidget(self.shift_time_value, current_row, 3)
         current_row += 1
 
         # 4. ZERO_START_Y Correction
         grid_layout.addWidget(QLabel("4. Zero Start Y Correction:"), current_row, 0)
         self.zero_start_y_check = QCheckBox("Enable")
-        self.zero_start_y_check.setChecked(correction_config.get("zero_start_y", {}).get("process", False))
+        self.zero_start_y_check.setChecked(zero_start_y_cfg.get("process", False))
         grid_layout.addWidget(self.zero_start_y_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Points:"), current_row, 2)
         self.zero_start_y_value = QSpinBox()
-        self.zero_start_y_value.setMinimum(1)
-        self.zero_start_y_value.setMaximum(10000000)
-        zero_start_y_value = correction_config.get("zero_start_y", {}).get("value")
-        self.zero_start_y_value.setValue(1 if zero_start_y_value is None else int(zero_start_y_value))
+        _configure_spin(self.zero_start_y_value, lo=1, hi=10000000)
+        zero_start_y_value = zero_start_y_cfg.get("value")
+        self.zero_start_y_value.setValue(int(zero_start_y_value or 1))  # at least one point
         grid_layout.addWidget(self.zero_start_y_value, current_row, 3)
         current_row += 1
 
         # 5. REVERSE_Y Correction
         grid_layout.addWidget(QLabel("5. Reverse Y Correction:"), current_row, 0)
         self.reverse_y_check = QCheckBox("Enable")
-        self.reverse_y_check.setChecked(correction_config.get("reverse_y", {}).get("process", False))
+        self.reverse_y_check.setChecked(reverse_y_cfg.get("process", False))
         grid_layout.addWidget(self.reverse_y_check, current_row, 1)
         current_row += 1
         
         # 6. DETREND
         grid_layout.addWidget(QLabel("6. Detrend Correction:"), current_row, 0)
         self.detrend_check = QCheckBox("Enable")
-        self.detrend_check.setChecked(correction_config.get("detrend", {}).get("process", False))
+        self.detrend_check.setChecked(detrend_cfg.get("process", False))
         grid_layout.addWidget(self.detrend_check, current_row, 1)
 
         # Store the labels as instance variables so we can reference them directly
@@ -1953,71 +2299,48 @@ class ConfigurationEditorDialog(QDialog):
         grid_layout.addWidget(self.detrend_type_label, current_row, 2)
 
         self.detrend_type = QComboBox()
-        self.detrend_type.addItems(["linear", "poly"])
-        current_detrend_type = correction_config.get("detrend", {}).get("type", "linear")
-        self.detrend_type.setCurrentText(current_detrend_type)
+        _add_choices(self.detrend_type, _DETREND_TYPES)
+        current_detrend_type = detrend_cfg.get("type", "linear")
+        self.detrend_type.setCurrentIndex(_DETREND_TYPE_INDEX.get(current_detrend_type, 0))
         grid_layout.addWidget(self.detrend_type, current_row, 3)
 
         self.detrend_degree_label = QLabel("Degree:")
         grid_layout.addWidget(self.detrend_degree_label, current_row, 4)
 
         self.detrend_degree = QSpinBox()
-        self.detrend_degree.setMinimum(1)
-        self.detrend_degree.setMaximum(10)
+        _configure_spin(self.detrend_degree, lo=1, hi=10)
         self.detrend_degree.setToolTip("Polynomial degree (used only with 'poly' type)")
-        detrend_degree = correction_config.get("detrend", {}).get("degree", 2)
+        detrend_degree = detrend_cfg.get("degree", 2)
         self.detrend_degree.setValue(detrend_degree)
         grid_layout.addWidget(self.detrend_degree, current_row, 5)
 
-        # Create a function to update the degree field state based on the selected type
-        def update_detrend_degree_visibility():
-            is_poly = self.detrend_type.currentText() == "poly"
-            self.detrend_degree.setEnabled(is_poly)
-            
-            # Update label color
-            if is_poly:
-                self.detrend_degree_label.setStyleSheet("")  # Reset to default
-            else:
-                self.detrend_degree_label.setStyleSheet("color: gray;")  # Gray out when disabled
-
-        # Connect the function to the detrend type combobox
-        self.detrend_type.currentTextChanged.connect(update_detrend_degree_visibility)
-
-        # Initialize states
-        update_detrend_degree_visibility()
+        # Initialize the degree field state, then follow the detrend type
+        self._detrend_is_poly = current_detrend_type == "poly"
+        self.apply_detrend_degree_state()
+        self.detrend_type.currentTextChanged.connect(self.update_detrend_degree_visibility)
         current_row += 1
 
         # 7. DERIVATIVE Correction
         grid_layout.addWidget(QLabel("7. Derivative Correction:"), current_row, 0)
         self.derivative_check = QCheckBox("Enable")
-        self.derivative_check.setChecked(correction_config.get("derivative", {}).get("process", False))
+        self.derivative_check.setChecked(derivative_cfg.get("process", False))
         grid_layout.addWidget(self.derivative_check, current_row, 1)
         current_row += 1
 
         # 8. FILTER Correction
         grid_layout.addWidget(QLabel("8. Filter Correction:"), current_row, 0)
         self.filter_check = QCheckBox("Enable")
-        self.filter_check.setChecked(correction_config.get("filter", {}).get("process", False))
+        self.filter_check.setChecked(filter_cfg.get("process", False))
         grid_layout.addWidget(self.filter_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Type:"), current_row, 2)
         self.filter_type = QComboBox()
-        self.filter_type.addItems([
-            "none", 
-            "butterworth", 
-            "chebyshev1", 
-            "chebyshev2", 
-            "elliptic", 
-            "bessel", 
-            "fir", 
-            "savgol", 
-            "moving_avg"
-        ])
-        current_filter_type = correction_config.get("filter", {}).get("type", "none")
+        self.filter_type.addItems(_FILTER_TYPES)
+        current_filter_type = filter_cfg.get("type", "none")
         self.filter_type.setCurrentText(current_filter_type)
         grid_layout.addWidget(self.filter_type, current_row, 3)
 
-        self.filter_params = correction_config.get("filter", {}).get("params", {})
+        self.filter_params = filter_cfg.get("params", {})
         self.filter_params_btn = QPushButton("Parameters...")
         self.filter_params_btn.clicked.connect(self.edit_filter_parameters)
         grid_layout.addWidget(self.filter_params_btn, current_row, 5)
@@ -2026,38 +2349,53 @@ class ConfigurationEditorDialog(QDialog):
         # 9. STRETCH_Y Correction
         grid_layout.addWidget(QLabel("9. Stretch Y Correction:"), current_row, 0)
         self.stretch_y_check = QCheckBox("Enable")
-        self.stretch_y_check.setChecked(correction_config.get("stretch_y", {}).get("process", False))
+        self.stretch_y_check.setChecked(stretch_y_cfg.get("process", False))
         grid_layout.addWidget(self.stretch_y_check, current_row, 1)
 
         grid_layout.addWidget(QLabel("Factor:"), current_row, 2)
         self.stretch_y_value = SmartQDoubleSpinBox()
-        self.stretch_y_value.setMinimum(-100000.0)
-        self.stretch_y_value.setMaximum(100000.0)
-        self.stretch_y_value.setSingleStep(0.1)
-        self.stretch_y_value.setDecimals(8)  # <-- Allow many decimals
-        stretch_y_value = correction_config.get("stretch_y", {}).get("value")
-        self.stretch_y_value.setValue(0.0 if stretch_y_value is None else float(stretch_y_value))
+        _configure_spin(self.stretch_y_value, lo=-100000.0, hi=100000.0, step=0.1, decimals=8)  # <-- Allow many decimals
+        stretch_y_value = stretch_y_cfg.get("value")
+        self.stretch_y_value.setValue(float(stretch_y_value or 0.0))
         grid_layout.addWidget(self.stretch_y_value, current_row, 3)
         current_row += 1
 
         # 10. NORMALIZE Correction
         grid_layout.addWidget(QLabel("10. Normalize Correction:"), current_row, 0)
         self.normalize_check = QCheckBox("Enable")
-        self.normalize_check.setChecked(correction_config.get("normilized", {}).get("process", False))
+        self.normalize_check.setChecked(normalize_cfg.get("process", False))
         grid_layout.addWidget(self.normalize_check, current_row, 1)
         current_row += 1
 
         # 11. ZERO_START_TIME Correction
         grid_layout.addWidget(QLabel("11. Zero Start Time Correction:"), current_row, 0)
         self.zero_start_time_check = QCheckBox("Enable")
-        self.zero_start_time_check.setChecked(correction_config.get("zero_start_time", {}).get("process", False))
+        self.zero_start_time_check.setChecked(zero_start_time_cfg.get("process", False))
         grid_layout.addWidget(self.zero_start_time_check, current_row, 1)
 
         tab_layout.addLayout(grid_layout)
         tab_layout.addStretch(1)
 
-        self.tab_widget.addTab(tab, "Data Corrections")
+        tab_layout.setEnabled(True)
+        tab.setUpdatesEnabled(True)
+        
+        return tab
+
 
+    def update_detrend_degree_visibility(self, detrend_type):
+        """Enable the degree field only for the 'poly' detrend type"""
+        is_poly = detrend_type == "poly"
+        if is_poly == self._detrend_is_poly:
+            return  # e.g. the same type re-selected, nothing to update
+        self._detrend_is_poly = is_poly
+        self.apply_detrend_degree_state()
+    
+    def apply_detrend_degree_state(self):
+        """Set the degree field and its label from the current detrend type flag"""
+        self.detrend_degree.setEnabled(self._detrend_is_poly)
+        # Gray out the label when the degree is not used
+        self.detrend_degree_label.setStyleSheet(
+            self._LBL_STYLE_ACTIVE if self._detrend_is_poly else self._LBL_STYLE_DISABLED)
 
     def browse_file(self):
         """Open a file dialog to select a data file"""
@@ -2070,10 +2408,13 @@ class ConfigurationEditorDialog(QDialog):
     
     def get_updated_config(self):
         """Get the updated configuration from all tabs"""
+        # Tabs that were never opened still contribute their (loaded) settings
+        self.build_pending_tabs()
+        
         # Basic settings
         self.config["file_path"] = self.file_path_edit.text()
-        self.config["seperator"] = self.separator_combo.currentText()
-        self.config["decimal"] = self.decimal_combo.currentText()
+        self.config["seperator"] = self.separator_combo.currentData()
+        self.config["decimal"] = self.decimal_combo.currentData()
         self.config["start_row"] = self.start_row_spin.value()
         self.config["end_row"] = self.end_row_spin.value()
         self.config["dt"] = self.dt_spin.value()
@@ -2096,11 +2437,12 @@ class ConfigurationEditorDialog(QDialog):
         data = {}
         data_name = {}
         
-        for row in range(self.data_mapping_table.rowCount()):
-            orig_name = self.data_mapping_table.item(row, 0).text()
-            column = self.data_mapping_table.item(row, 1).text()
-            display_name = self.data_mapping_table.item(row, 2).text()
-            
+        # Snapshot the mapping model once, then work on plain Python strings
+        model = self._mapping_model
+        rows = [[model.item(row, col).text() for col in range(3)]
+                for row in range(model.rowCount())]
+        
+        for orig_name, column, display_name in rows:
             if orig_name and column:
                 data[orig_name] = column
                 data_name[orig_name] = display_name
@@ -2108,24 +2450,30 @@ class ConfigurationEditorDialog(QDialog):
         self.config["data"] = data
         self.config["data_name"] = data_name
         
+        # Read each enable flag once; values of disabled corrections are stored as None
+        trim_on = self.trim_check.isChecked()
+        resample_on = self.resample_check.isChecked()
+        shift_time_on = self.shift_time_check.isChecked()
+        stretch_y_on = self.stretch_y_check.isChecked()
+        
         # Update the data_correction section in get_updated_config
         self.config["data_correction"] = {
             # 1. TRIM TIME
             "trim_time": {
-                "process": self.trim_check.isChecked(),
-                "start_time": self.trim_start_time.value() if self.trim_check.isChecked() else None,
-                "end_time": self.trim_end_time.value() if self.trim_check.isChecked() else None
+                "process": trim_on,
+                "start_time": self.trim_start_time.value() if trim_on else None,
+                "end_time": self.trim_end_time.value() if trim_on else None
             },
             # 2. RESAMPLE
             "resample": {
-                "process": self.resample_check.isChecked(),
-                "value": self.resample_value.value() if self.resample_check.isChecked() else None,
-                "method": self.resample_method.currentText()
+                "process": resample_on,
+                "value": self.resample_value.value() if resample_on else None,
+                "method": self.resample_method.currentData()
             },
             # 3. SHIFT_TIME
             "shift_time": {
-                "process": self.shift_time_check.isChecked(),
-                "value": self.shift_time_value.value() if self.shift_time_check.isChecked() else None
+                "process": shift_time_on,
+                "value": self.shift_time_value.value() if shift_time_on else None
             },
             # 4. ZERO_START_Y
             "zero_start_y": {
@@ -2139,7 +2487,7 @@ class ConfigurationEditorDialog(QDialog):
             # 6. DETREND
             "detrend": {
                 "process": self.detrend_check.isChecked(),
-                "type": self.detrend_type.currentText(),
+                "type": self.detrend_type.currentData(),
                 "degree": self.detrend_degree.value()
             },
             # 7. DERIVATIVE
@@ -2154,8 +2502,8 @@ class ConfigurationEditorDialog(QDialog):
             },
             # 9. STRETCH_Y
             "stretch_y": {
-                "process": self.stretch_y_check.isChecked(),
-                "value": self.stretch_y_value.value() if self.stretch_y_check.isChecked() else None
+                "process": stretch_y_on,
+                "value": self.stretch_y_value.value() if stretch_y_on else None
             },
             # 10. NORMALIZE
             "normilized": {
@@ -2183,7 +2531,7 @@ class ExportOptionsDialog(QDialog):
         self.setLayout(layout)
         
         # Export type selection
-        self.export_type_combo = QComboBox()
+        self.export_type_combo = _fix_combo_width(QComboBox(), 32)
         self.export_type_combo.addItems([
             "Export All Data", 
             "Export Selected Sensors", 
@@ -2198,11 +2546,13 @@ class ExportOptionsDialog(QDialog):
         sensors_layout = QVBoxLayout(self.sensors_group)
         
         self.sensor_checkboxes = {}
-        for sensor_name in sensor_names:
-            checkbox = QCheckBox(sensor_name)
-            checkbox.setChecked(True)
-            self.sensor_checkboxes[sensor_name] = checkbox
-            sensors_layout.addWidget(checkbox)
+        # Non-exclusive group of the sensor checkboxes; a checkbox's id indexes its sensor name
+        self.sensor_button_group = QButtonGroup(self)
+        self.sensor_button_group.setExclusive(False)
+        self._sensor_button_names = []
+        self.sensor_checkbox_layout = QVBoxLayout()
+        sensors_layout.addLayout(self.sensor_checkbox_layout)
+        self.refresh(sensor_names)
         
         # Add select all/none buttons
         buttons_layout = QHBoxLayout()
@@ -2255,6 +2605,36 @@ class ExportOptionsDialog(QDialog):
         # Initial update
         self.update_ui()
     
+    def refresh(self, sensor_names):
+        """
+        Update the sensor checkboxes to a new list of sensor names.
+        Checkboxes of kept sensors are reused with their checked state, stale ones are
+        removed and new sensors are added checked.
+        """
+        self.sensor_names = sensor_names
+        
+        # Lay out and repaint the group once, after all checkboxes are in place
+        self.sensors_group.setUpdatesEnabled(False)
+        
+        names = set(sensor_names)
+        for sensor_name in [name for name in self.sensor_checkboxes if name not in names]:
+            checkbox = self.sensor_checkboxes.pop(sensor_name)
+            self.sensor_button_group.removeButton(checkbox)
+            self.sensor_checkbox_layout.removeWidget(checkbox)
+            checkbox.deleteLater()
+        
+        for index, sensor_name in enumerate(sensor_names):
+            if sensor_name not in self.sensor_checkboxes:
+                checkbox = QCheckBox(sensor_name)
+                checkbox.setChecked(True)
+                self.sensor_checkboxes[sensor_name] = checkbox
+                self.sensor_button_group.addButton(checkbox, len(self._sensor_button_names))
+                self._sensor_button_names.append(sensor_name)
+                self.sensor_checkbox_layout.insertWidget(index, checkbox)
+        
+        self.sensors_group.setUpdatesEnabled(True)
+    
+    @Slot()
     def update_ui(self):
         """Update UI based on selected export type"""
         export_type = self.export_type_combo.currentIndex()
@@ -2262,16 +2642,25 @@ class ExportOptionsDialog(QDialog):
         # Show/hide sensors selection
         self.sensors_group.setVisible(export_type == 1)  # Only for "Export Selected Sensors"
     
+    @Slot()
     def select_all_sensors(self):
         """Select all sensors"""
-        for checkbox in self.sensor_checkboxes.values():
-            checkbox.setChecked(True)
+        self.set_all_sensors_checked(True)
     
+    @Slot()
     def select_none_sensors(self):
         """Deselect all sensors"""
+        self.set_all_sensors_checked(False)
+    
+    def set_all_sensors_checked(self, checked):
+        """Set every sensor checkbox to the given state, skipping those already in it"""
         for checkbox in self.sensor_checkboxes.values():
-            checkbox.setChecked(False)
+            if checkbox.isChecked() != checked:
+                checkbox.blockSignals(True)
+                checkbox.setChecked(checked)
+                checkbox.blockSignals(False)
     
+    @Slot()
     def browse_output(self):
         """Open a dialog to select output file path"""
         export_type = self.export_type_combo.currentIndex()
@@ -2295,9 +2684,9 @@ class ExportOptionsDialog(QDialog):
         
         selected_sensors = []
         if export_type == 1:  # Export Selected Sensors
-            for sensor_name, checkbox in self.sensor_checkboxes.items():
-                if checkbox.isChecked():
-                    selected_sensors.append(sensor_name)
+            group = self.sensor_button_group
+            selected_sensors = [self._sensor_button_names[group.id(checkbox)]
+                                for checkbox in group.buttons() if checkbox.isChecked()]
         
         return {
             "export_type": export_type,
@@ -2307,8 +2696,80 @@ class ExportOptionsDialog(QDialog):
             "export_config": self.export_config_checkbox.isChecked() ## ADD LINE Filter
         }
 
+class ExportWorker(QObject):
+    """Runs a data export off the GUI thread"""
+    progress = Signal(int)          # percentage of rows written
+    finished = Signal(bool, str)    # success, message to log
+    
+    def __init__(self, sensor_data, export_config):
+        super(ExportWorker, self).__init__()
+        self.sensor_data = sensor_data
+        self.export_config = export_config
+    
+    def report_progress(self, rows_written, total_rows):
+        """Progress callback of the CSV export"""
+        self.progress.emit(int(100 * rows_written / total_rows) if total_rows else 100)
+    
+    @Slot()
+    def run(self):
+        """Export the data as described by the export configuration"""
+        export_type = self.export_config["export_type"]
+        output_path = self.export_config["output_path"]
+        precision = self.export_config["precision"]
+        export_config = self.export_config["export_config"]
+        
+        try:
+            if export_type == 0:  # Export All Data
+                success = self.sensor_data.export_to_csv(
+                    output_path, precision, export_config,
+                    progress_callback=self.report_progress
+                )
+                message = (f"All data exported to {output_path}" if success
+                           else "Failed to export all data")
+                
+            elif export_type == 1:  # Export Selected Sensors
+                success = self.sensor_data.export_selected_sensors_to_csv(
+                    output_path, self.export_config["selected_sensors"], precision, export_config,
+                    progress_callback=self.report_progress
+                )
+                message = (f"Selected sensors exported to {output_path}" if success
+                           else "Failed to export selected sensors")
+                
+            else:  # Export in Original Format
+                success = self.sensor_data.export_processed_data_in_original_format(
+                    output_path, precision, export_config
+                )
+                message = (f"Data exported in original format to {output_path}" if success
+                           else "Failed to export data in original format")
+        except Exception as e:
+            success, message = False, f"Error exporting data: {e}"
+        
+        self.finished.emit(success, message)
+
+class ProcessWorker(QObject):
+    """Runs the data processing off the GUI thread"""
+    finished = Signal(bool, str, str)   # success, error message, traceback
+    
+    def __init__(self, sensor_data):
+        super(ProcessWorker, self).__init__()
+        self.sensor_data = sensor_data
+    
+    @Slot()
+    def run(self):
+        """Process the sensor data"""
+        try:
+            success = self.sensor_data.process_data()
+        except Exception as e:
+            import traceback
+            self.finished.emit(False, str(e), traceback.format_exc())
+            return
+        self.finished.emit(success, "", "")
+
 class ReplicaXSensorDataReaderGUI(QMainWindow):
     """Main GUI application for ReplicaXSensorDataReader"""
+    # Checkbox toggles within this many milliseconds of each other share one replot
+    REPLOT_DELAY_MS = 50
+    
     def __init__(self):
         super(ReplicaXSensorDataReaderGUI, self).__init__()
         
@@ -2321,7 +2782,70 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             "brown", "cyan", "magenta", "darkblue", "darkgreen",
             "darkred", "darkmagenta", "darkorange", "darkgray"
         ]
-        self.sensor_colors = {}  # Will be populated dynamically
+        # Sensor name -> color slot, a slot's color is its palette entry in rotation.
+        # Slots are kept while a sensor stays defined, so its color does not change.
+        self._sensor_index = {}
+        self._sensor_colors = np.array(self.available_colors)
+        
+        # Export options dialog, created on the first export and reused afterwards
+        self._export_dialog = None
+        
+        # Set when the individual plots are out of date because their tab was hidden
+        self._individual_plots_stale = False
+        
+        # Coalesces the replots requested by quick successive checkbox toggles
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(self.REPLOT_DELAY_MS)
+        self._replot_timer.timeout.connect(self.update_plots)
+        
+        # Set when the configuration text is out of date because its tab was hidden
+        self._config_text_stale = False
+        
+        # sensor_data.config_version last shown by the summary and the text editor
+        self._summary_config_version = None
+        self._text_config_version = None
+        
+        # Whether sensor_data holds processed data, updated whenever it is (re)processed
+        self._has_processed_data = False
+        
+        # Set while process_data runs, so overlapping real time updates are dropped
+        self._processing = False
+        
+        # Thread and worker of the data processing in progress, if any
+        self._process_thread = None
+        self._process_worker = None
+        
+        # Thread and worker of the export in progress, if any
+        self._export_thread = None
+        self._export_worker = None
+        
+        # Widgets touched when the application state is reset, created by setup_ui
+        self.real_time_update_timer = None
+        self.combined_canvas = None
+        self.individual_plots_widget = None
+        self.sensor_scroll_area = None
+        self.config_summary = None
+        self.config_text_editor = None
+        self.log_text = None
+        self.export_btn = None
+        self.process_btn = None
+        self.real_time_update_btn = None
+        self.select_all_btn = None
+        self.select_none_btn = None
+        
+        # Sensor selection checkboxes keyed by sensor name, filled by update_sensor_selection
+        self.sensor_checkboxes = {}
+        
+        # Export actions keyed by export type, shared by the export button and the File menu
+        self._export_actions = {}
+        for export_type, text in enumerate(("Export &All Data...",
+                                             "Export &Selected Sensors...",
+                                             "Export in &Original Format...")):
+            action = QAction(text, self)
+            action.setData(export_type)
+            action.triggered.connect(self.export_from_action)
+            self._export_actions[export_type] = action
         
         # Setup the UI
         self.setup_ui()
@@ -2376,75 +2900,120 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         
         # Initialize live update timer
         self.real_time_update_timer = QTimer(self)
+        self.real_time_update_timer.setTimerType(Qt.CoarseTimer)  # intervals are >= 0.1 s
         self.real_time_update_timer.timeout.connect(self.process_data)
     
+    def create_sensor_container(self):
+        """Set a new, empty widget for the sensor checkboxes in the sensor scroll area"""
+        self.sensor_container = QWidget()
+        self.sensor_container_layout = QVBoxLayout(self.sensor_container)
+        self.sensor_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.sensor_container_layout.setSpacing(2)  # Compact spacing
+        
+        # The placeholder and the stretch stay at the end, checkboxes are inserted before them
+        self.sensor_placeholder = QLabel("No sensors defined")
+        self.sensor_placeholder.hide()
+        self.sensor_container_layout.addWidget(self.sensor_placeholder)
+        self.sensor_stretch = QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+        self.sensor_container_layout.addItem(self.sensor_stretch)
+        
+        # The scroll area deletes the previous container with all its checkboxes
+        self.sensor_scroll_area.setWidget(self.sensor_container)
+    
+    def create_individual_plots_container(self):
+        """Set a new, empty grid widget for the individual plots in their scroll area"""
+        self.individual_plots_container = QWidget()
+        self.individual_plots_layout = QGridLayout(self.individual_plots_container)
+        
+        # Shown instead of the plots when there is nothing to plot
+        self.individual_plots_label = QLabel()
+        self.individual_plots_label.hide()
+        self.individual_plots_layout.addWidget(self.individual_plots_label, 0, 0)
+        
+        # The figure is created with the first plots and redrawn in place afterwards
+        self.individual_plot_widget = None
+        self.individual_figure = None
+        self.individual_canvas = None
+        self.individual_toolbar = None
+        
+        # The scroll area deletes the previous container with all its plots
+        self.individual_plots_widget.setWidget(self.individual_plots_container)
+    
+    @Slot()
     def reset_application_state(self):
         """Reset the application state before loading a new configuration"""
         self.log_message("Resetting application state")
+        self.wait_for_processing()
         
         # Stop real time update if running
-        if hasattr(self, 'real_time_update_timer') and self.real_time_update_timer.isActive():
+        if self.real_time_update_timer is not None and self.real_time_update_timer.isActive():
             self.real_time_update_timer.stop()
             self.real_time_update_btn.setChecked(False)
-            self.real_time_update_btn.setText("Start Real Time Update")
+            self.set_real_time_button_text("Start Real Time Update")
         
         # Reset ReplicaXSensorDataReader object
         self.sensor_data = ReplicaXSensorDataReader()
+        self._has_processed_data = False
+        self._summary_config_version = None
+        self._text_config_version = None
         
         # Clear all plots
-        if hasattr(self, 'combined_canvas'):
+        if self.combined_canvas is not None:
             self.combined_canvas.clear_plot()
         
-        # Clear individual plots
-        if hasattr(self, 'individual_plots_layout'):
-            for i in reversed(range(self.individual_plots_layout.count())):
-                item = self.individual_plots_layout.itemAt(i)
-                if item and item.widget():
-                    item.widget().deleteLater()
+        # Clear individual plots, replacing the container drops all plot widgets at once
+        if self.individual_plots_widget is not None:
+            self.create_individual_plots_container()
         
         # Clear sensor selection
-        if hasattr(self, 'sensor_container_layout'):
-            for i in reversed(range(self.sensor_container_layout.count())):
-                item = self.sensor_container_layout.itemAt(i)
-                if item and item.widget():
-                    item.widget().deleteLater()
-            # Add a placeholder after clearing
-            if hasattr(self, 'sensor_container_layout'):
-                label = QLabel("No sensors defined")
-                self.sensor_container_layout.addWidget(label)
+        if self.sensor_scroll_area is not None:
+            self.create_sensor_container()
+            # Show the placeholder after clearing
+            self.sensor_placeholder.show()
         
         # Clear sensor colors and checkboxes
-        self.sensor_colors = {}
+        self.assign_colors_to_sensors([])
         self.sensor_checkboxes = {}
         
+        # Drop the cached export dialog, it lists the sensors of the old configuration
+        if self._export_dialog is not None:
+            self._export_dialog.deleteLater()
+            self._export_dialog = None
+        
         # Reset config summary
-        if hasattr(self, 'config_summary'):
+        if self.config_summary is not None:
             self.config_summary.setText("No configuration loaded")
         
         # Reset config text editor
-        if hasattr(self, 'config_text_editor'):
+        if self.config_text_editor is not None:
             self.config_text_editor.setPlainText("")
         
         # Reset status bar
         self.statusBar().showMessage("Ready")
         
         # Disable all buttons except Load Configuration
-        if hasattr(self, 'export_btn'):
-            self.export_btn.setEnabled(False)
-        if hasattr(self, 'process_btn'):
-            self.process_btn.setEnabled(False)
-        if hasattr(self, 'real_time_update_btn'):
-            self.real_time_update_btn.setEnabled(False)
-        if hasattr(self, 'select_all_btn'):
-            self.select_all_btn.setEnabled(False)
-        if hasattr(self, 'select_none_btn'):
-            self.select_none_btn.setEnabled(False)
+        self.set_data_buttons_enabled(False)
         
         # Clear the log
-        if hasattr(self, 'log_text'):
+        if self.log_text is not None:
             self.log_text.clear()
             self.log_message("Application reset successfully", "SUCCESS")
 
+    def load_sensor_config(self, config):
+        """Load a configuration into sensor_data, which also processes the data"""
+        self.wait_for_export()
+        self.wait_for_processing()
+        success = self.sensor_data.load_config_from_dict(config)
+        self._has_processed_data = bool(self.sensor_data.processed_data)
+        return success
+    
+    def set_data_buttons_enabled(self, enabled):
+        """Enable or disable the buttons that need a loaded configuration"""
+        for button in (self.export_btn, self.process_btn, self.real_time_update_btn,
+                       self.select_all_btn, self.select_none_btn):
+            if button is not None:
+                button.setEnabled(enabled)
+
     def create_data_viewer_tab(self):
         """Create the data viewer tab"""
         data_viewer = QWidget()
@@ -2476,19 +3045,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         self.export_btn.setPopupMode(QToolButton.InstantPopup)
         self.export_btn.setEnabled(False)  # Initially disabled
         export_menu = QMenu(self.export_btn)
-        
-        export_all_action = QAction("Export All Data", self)
-        export_all_action.triggered.connect(lambda: self.export_data(0))
-        export_menu.addAction(export_all_action)
-        
-        export_selected_action = QAction("Export Selected Sensors", self)
-        export_selected_action.triggered.connect(lambda: self.export_data(1))
-        export_menu.addAction(export_selected_action)
-        
-        export_original_action = QAction("Export in Original Format", self)
-        export_original_action.triggered.connect(lambda: self.export_data(2))
-        export_menu.addAction(export_original_action)
-        
+        export_menu.addActions(list(self._export_actions.values()))
         self.export_btn.setMenu(export_menu)
         self.export_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         file_layout.addWidget(self.export_btn)
@@ -2566,13 +3123,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         self.sensor_scroll_area.setMinimumHeight(150)  # Set minimum height to show several sensors
 
         # Create widget to hold the checkboxes
-        self.sensor_container = QWidget()
-        self.sensor_container_layout = QVBoxLayout(self.sensor_container)
-        self.sensor_container_layout.setContentsMargins(0, 0, 0, 0)
-        self.sensor_container_layout.setSpacing(2)  # Compact spacing
-        # Don't add stretch here - we want it to fill naturally
-
-        self.sensor_scroll_area.setWidget(self.sensor_container)
+        self.create_sensor_container()
         sensor_selection_layout.addWidget(self.sensor_scroll_area, 1)  # Give it a stretch factor
 
         # Make sure the group expands with available space
@@ -2603,10 +3154,9 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         # Individual plots tab - using grid layout
         self.individual_plots_widget = QScrollArea()
         self.individual_plots_widget.setWidgetResizable(True)
-        self.individual_plots_container = QWidget()
-        self.individual_plots_layout = QGridLayout(self.individual_plots_container)
-        self.individual_plots_widget.setWidget(self.individual_plots_container)
+        self.create_individual_plots_container()
         self.plot_tabs.addTab(self.individual_plots_widget, "Individual Plots")
+        self.plot_tabs.currentChanged.connect(self.on_plot_tab_changed)
         
         right_layout.addWidget(self.plot_tabs)
         
@@ -2621,7 +3171,30 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         self.main_tabs.addTab(data_viewer, "Data Viewer")
 
     def create_config_editor_tab(self):
-        """Create the configuration editor tab"""
+        """
+        Add the configuration editor tab.
+        The tab starts as an empty page, its widgets are built the first time it is shown.
+        """
+        self.config_editor_page = QWidget()
+        page_layout = QVBoxLayout(self.config_editor_page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Add to main tabs
+        self.config_editor_tab_index = self.main_tabs.addTab(self.config_editor_page, "Configuration Editor")
+        self.main_tabs.currentChanged.connect(self.on_main_tab_changed)
+    
+    @Slot(int)
+    def on_main_tab_changed(self, index):
+        """Build the configuration editor the first time its tab is selected, refresh it when stale"""
+        if index != self.config_editor_tab_index:
+            return
+        if self.config_text_editor is None:
+            self.build_config_editor_tab()
+        elif self._config_text_stale:
+            self.update_config_text_editor()
+    
+    def build_config_editor_tab(self):
+        """Create the widgets of the configuration editor tab"""
         config_editor = QWidget()
         layout = QVBoxLayout(config_editor)
         
@@ -2646,8 +3219,10 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         update_config_btn.clicked.connect(self.update_config_from_text)
         layout.addWidget(update_config_btn)
         
-        # Add to main tabs
-        self.main_tabs.addTab(config_editor, "Configuration Editor")
+        self.config_editor_page.layout().addWidget(config_editor)
+        
+        # Show the configuration loaded so far
+        self.update_config_text_editor()
     
     def create_menu_bar(self):
         """Create the application menu bar"""
@@ -2670,18 +3245,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         
         # Export submenu
         export_menu = file_menu.addMenu("Export Data")
-        
-        export_all_action = QAction("Export &All Data...", self)
-        export_all_action.triggered.connect(lambda: self.export_data(0))
-        export_menu.addAction(export_all_action)
-        
-        export_selected_action = QAction("Export &Selected Sensors...", self)
-        export_selected_action.triggered.connect(lambda: self.export_data(1))
-        export_menu.addAction(export_selected_action)
-        
-        export_original_action = QAction("Export in &Original Format...", self)
-        export_original_action.triggered.connect(lambda: self.export_data(2))
-        export_menu.addAction(export_original_action)
+        export_menu.addActions(list(self._export_actions.values()))
         
         file_menu.addSeparator()
         
@@ -2734,23 +3298,29 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
     
+    @Slot()
     def open_filter_comparison(self):
         """Open the filter comparison tool window"""
-        if not hasattr(self.sensor_data, 'processed_data') or not self.sensor_data.processed_data:
+        if not self._has_processed_data:
             QMessageBox.warning(self, "No Data", "Please process data first before using the Filter Comparison tool.")
             return
         
+        if self._processing:
+            QMessageBox.warning(self, "Processing Running", "Please wait for the data processing to finish.")
+            return
+        
         # Create and show the filter comparison window
         self.filter_comparison_window = FilterComparisonWindow(self.sensor_data, self)
         self.filter_comparison_window.show()
 
+    @Slot()
     def toggle_real_time_update(self):
         """Toggle the live update functionality"""
         if self.real_time_update_btn.isChecked():
             # Start the timer
             interval_ms = int(self.update_interval_spin.value() * 1000)  # Convert to milliseconds
             self.real_time_update_timer.start(interval_ms)
-            self.real_time_update_btn.setText("Stop Real Time Update")
+            self.set_real_time_button_text("Stop Real Time Update")
             self.log_message("Real Time update started", "INFO")
             
             # Process data immediately when starting
@@ -2758,22 +3328,32 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         else:
             # Stop the timer
             self.real_time_update_timer.stop()
-            self.real_time_update_btn.setText("Start Real Time Update")
+            self.set_real_time_button_text("Start Real Time Update")
             self.log_message("Real Time update stopped", "INFO")
+    
+    def set_real_time_button_text(self, text):
+        """Set the real time update button text, skipping the repaint when it is unchanged"""
+        if self.real_time_update_btn.text() != text:
+            self.real_time_update_btn.setText(text)
 
+    @Slot(bool)
     def toggle_real_time_update_from_menu(self, checked):
         """Toggle live update from menu action"""
         # Sync the button state with the menu action
         self.real_time_update_btn.setChecked(checked)
         self.toggle_real_time_update()
 
+    @Slot(float)
     def update_timer_interval(self, value):
         """Update the timer interval when the spinbox value changes"""
         if self.real_time_update_timer.isActive():
             interval_ms = int(value * 1000)  # Convert to milliseconds
+            if interval_ms == self.real_time_update_timer.interval():
+                return  # e.g. a value that rounds to the current interval
             self.real_time_update_timer.setInterval(interval_ms)
             self.log_message(f"Update interval changed to {value} seconds", "INFO")
     
+    @Slot()
     def load_config_file(self):
         """Open a dialog to select and load a configuration file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -2792,11 +3372,10 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             self.log_message(f"Loading configuration from {file_path}")
             
             # Read the JSON file
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            config = _read_json_file(file_path)
             
             # Update the ReplicaXSensorDataReader object
-            success = self.sensor_data.load_config_from_dict(config)
+            success = self.load_sensor_config(config)
             
             if success:
                 self.log_message(f"Configuration loaded successfully", "SUCCESS")
@@ -2804,22 +3383,14 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                 self.update_config_text_editor()
                 self.update_sensor_selection()
                 # Enable all buttons
-                if hasattr(self, 'export_btn'):
-                    self.export_btn.setEnabled(True)
-                if hasattr(self, 'process_btn'):
-                    self.process_btn.setEnabled(True)
-                if hasattr(self, 'real_time_update_btn'):
-                    self.real_time_update_btn.setEnabled(True)
-                if hasattr(self, 'select_all_btn'):
-                    self.select_all_btn.setEnabled(True)
-                if hasattr(self, 'select_none_btn'):
-                    self.select_none_btn.setEnabled(True)
+                self.set_data_buttons_enabled(True)
                 self.statusBar().showMessage(f"Loaded: {file_path}")
             else:
                 self.log_message("Failed to load configuration", "ERROR")
         except Exception as e:
             self.log_message(f"Error loading configuration: {e}", "ERROR")
     
+    @Slot()
     def save_config_file(self):
         """Open a dialog to save the current configuration"""
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
@@ -2832,20 +3403,37 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(self.sensor_data.config, f, indent=4)
+                _write_json_file(self.sensor_data.config, file_path)
                 self.log_message(f"Configuration saved to {file_path}", "SUCCESS")
             except Exception as e:
                 self.log_message(f"Error saving configuration: {e}", "ERROR")
     
+    @Slot()
+    def export_from_action(self):
+        """Export with the export type stored in the triggering action"""
+        self.export_data(self.sender().data())
+    
+    @Slot(int)
     def export_data(self, export_type=0):
         """Export data with the specified export type"""
-        if not hasattr(self.sensor_data, 'processed_data') or not self.sensor_data.processed_data:
+        if not self._has_processed_data:
             QMessageBox.warning(self, "No Data", "No processed data to export.")
             return
         
+        if self._export_thread is not None:
+            QMessageBox.warning(self, "Export Running", "Please wait for the current export to finish.")
+            return
+        
+        if self._processing:
+            QMessageBox.warning(self, "Processing Running", "Please wait for the data processing to finish.")
+            return
+        
         sensor_names = list(self.sensor_data.processed_data.keys())
-        dialog = ExportOptionsDialog(sensor_names, self)
+        if self._export_dialog is None:
+            self._export_dialog = ExportOptionsDialog(sensor_names, self)
+        else:
+            self._export_dialog.refresh(sensor_names)
+        dialog = self._export_dialog
         
         # Pre-select the export type
         dialog.export_type_combo.setCurrentIndex(export_type)
@@ -2858,183 +3446,136 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                 QMessageBox.warning(self, "No Output Path", "Please select an output file path.")
                 return
             
-            try:
-                if export_config["export_type"] == 0:  # Export All Data
-                    # UPDATE THIS LINE to pass export_config parameter
-                    success = self.sensor_data.export_to_csv(
-                        output_path, 
-                        export_config["precision"],
-                        export_config["export_config"]  # Add this parameter
-                    )
-                    if success:
-                        self.log_message(f"All data exported to {output_path}", "SUCCESS")
-                    else:
-                        self.log_message("Failed to export all data", "ERROR")
-                        
-                elif export_config["export_type"] == 1:  # Export Selected Sensors
-                    selected_sensors = export_config["selected_sensors"]
-                    if not selected_sensors:
-                        QMessageBox.warning(self, "No Sensors Selected", "Please select at least one sensor to export.")
-                        return
-                        
-                    # UPDATE THIS LINE to pass export_config parameter
-                    success = self.sensor_data.export_selected_sensors_to_csv(
-                        output_path, 
-                        selected_sensors, 
-                        export_config["precision"],
-                        export_config["export_config"]  # Add this parameter
-                    )
-                    if success:
-                        self.log_message(f"Selected sensors exported to {output_path}", "SUCCESS")
-                    else:
-                        self.log_message("Failed to export selected sensors", "ERROR")
-                        
-                elif export_config["export_type"] == 2:  # Export in Original Format
-                    # UPDATE THIS LINE to pass export_config parameter
-                    success = self.sensor_data.export_processed_data_in_original_format(
-                        output_path, 
-                        export_config["precision"],
-                        export_config["export_config"]  # Add this parameter
-                    )
-                    if success:
-                        self.log_message(f"Data exported in original format to {output_path}", "SUCCESS")
-                    else:
-                        self.log_message("Failed to export data in original format", "ERROR")
-                    
-            except Exception as e:
-                self.log_message(f"Error exporting data: {e}", "ERROR")
+            if export_config["export_type"] == 1 and not export_config["selected_sensors"]:
+                QMessageBox.warning(self, "No Sensors Selected", "Please select at least one sensor to export.")
+                return
+            
+            self.start_export(export_config)
+    
+    def start_export(self, export_config):
+        """Run an export in a worker thread, keeping the GUI responsive"""
+        self.export_btn.setEnabled(False)
+        self.statusBar().showMessage("Exporting data...")
+        
+        thread = QThread(self)
+        worker = ExportWorker(self.sensor_data, export_config)
+        worker.moveToThread(thread)
+        
+        thread.started.connect(worker.run)
+        worker.progress.connect(self.on_export_progress, type=Qt.QueuedConnection)
+        worker.finished.connect(self.on_export_finished, type=Qt.QueuedConnection)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        
+        self._export_thread = thread
+        self._export_worker = worker
+        thread.start()
+    
+    @Slot(int)
+    def on_export_progress(self, percent):
+        """Show the export progress in the status bar"""
+        self.statusBar().showMessage(f"Exporting data... {percent}%")
+    
+    @Slot(bool, str)
+    def on_export_finished(self, success, message):
+        """Log the export result and re-enable exporting"""
+        self.log_message(message, "SUCCESS" if success else "ERROR")
+        self.statusBar().showMessage("Export finished" if success else "Export failed")
+        self.export_btn.setEnabled(self._has_processed_data)
+        self._export_thread = None
+        self._export_worker = None
 
     def update_config_summary(self):
-        """Update the configuration summary"""
+        """Update the configuration summary, unless it already shows the current configuration"""
+        if self.sensor_data.config_version == self._summary_config_version:
+            return
+        self._summary_config_version = self.sensor_data.config_version
+        
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
             self.config_summary.setText("No configuration loaded")
             return
         
         config = self.sensor_data.config
-        summary = "<html><body>"
-        
-        # Add basic properties
-        summary += "<h3>Basic Settings</h3>"
-        summary += f"<p><b>File:</b> {os.path.basename(config.get('file_path', ''))}</p>"
-        summary += f"<p><b>Rows:</b> {config.get('start_row', '')} to {config.get('end_row', '')}</p>"
-        summary += f"<p><b>Time Column:</b> {config.get('time_column', '')}</p>"
-        summary += f"<p><b>Sample Rate:</b> {1/config.get('dt', 1):.2f} Hz</p>"
-        
-        # Add units information
-        summary += "<h3>Units</h3>"
-        input_units = config.get("input_units", {})
-        output_units = config.get("output_units", {})
-        data_type = config.get("data_type", "")
-        
-        summary += f"<p><b>Data Type:</b> {data_type.replace('_', ' ')}</p>"
-        summary += f"<p><b>Input Units:</b> {input_units.get('data', '')} ({input_units.get('time', '')})</p>"
-        summary += f"<p><b>Output Units:</b> {output_units.get('data', '')} ({output_units.get('time', '')})</p>"
+        parts = ["<html><body>"]
+        
+        # Add basic properties and units information
+        input_units = config.get("input_units") or {}
+        output_units = config.get("output_units") or {}
+        parts.append(_SUMMARY_SETTINGS_TEMPLATE.format(
+            file=_html_text(os.path.basename(config.get('file_path', ''))),
+            start_row=_html_text(config.get('start_row', '')),
+            end_row=_html_text(config.get('end_row', '')),
+            time_column=_html_text(config.get('time_column', '')),
+            sample_rate=1/config.get('dt', 1),
+            data_type=_html_text(config.get("data_type", "").replace('_', ' ')),
+            input_data=_html_text(input_units.get('data', '')),
+            input_time=_html_text(input_units.get('time', '')),
+            output_data=_html_text(output_units.get('data', '')),
+            output_time=_html_text(output_units.get('time', '')),
+        ))
         
         # Add data corrections
-        summary += "<h3>Corrections</h3>"
-        corrections = config.get("data_correction", {})
+        parts.append("<h3>Corrections</h3>")
+        corrections = config.get("data_correction") or {}
         
-        # Add this in the update_config_summary method where it builds the active_corrections list
         active_corrections = []
-
-        # 1. TRIM TIME
-        if corrections.get("trim_time", {}).get("process", False):
-            start_time = corrections.get("trim_time", {}).get("start_time", "")
-            end_time = corrections.get("trim_time", {}).get("end_time", "")
-            active_corrections.append(f"1. Trim Time (Range: {start_time} to {end_time})")
-
-        # 2. RESAMPLE
-        if corrections.get("resample", {}).get("process", False):
-            value = corrections.get("resample", {}).get("value", "")
-            method = corrections.get("resample", {}).get("method", "linear")
-            active_corrections.append(f"2. Resample ({value} Hz, Method: {method})")
-
-        # 3. SHIFT_TIME
-        if corrections.get("shift_time", {}).get("process", False):
-            value = corrections.get("shift_time", {}).get("value", "")
-            active_corrections.append(f"3. Shift Time (Value: {value})")
-
-        # 4. ZERO_START_Y
-        if corrections.get("zero_start_y", {}).get("process", False):
-            value = corrections.get("zero_start_y", {}).get("value", "")
-            active_corrections.append(f"4. Zero Start Y (Points: {value})")
-
-        # 5. REVERSE_Y
-        if corrections.get("reverse_y", {}).get("process", False):
-            active_corrections.append("5. Reverse Y")
-
-        # 6. DETREND 
-        if corrections.get("detrend", {}).get("process", False):
-            detrend_type = corrections.get("detrend", {}).get("type", "linear")
-            detrend_degree = corrections.get("detrend", {}).get("degree", 2)
-            detrend_info = f"5. Detrend ({detrend_type}"
-            if detrend_type == "poly":
-                detrend_info += f", degree: {detrend_degree}"
-            detrend_info += ")"
-            active_corrections.append(detrend_info)
-
-        # 7. DERIVATIVE
-        if corrections.get("derivative", {}).get("process", False):
-            active_corrections.append("7. Derivative")
-
-        # 8. FILTER
-        if corrections.get("filter", {}).get("process", False):
-            filter_type = corrections.get("filter", {}).get("type", "none")
-            filter_params = corrections.get("filter", {}).get("params", {})
-            params_str = ", ".join([f"{k}: {v}" for k, v in filter_params.items()])
-            active_corrections.append(f"8. Filter ({filter_type}{', ' + params_str if params_str else ''})")
-
-        # 9. STRETCH_Y
-        if corrections.get("stretch_y", {}).get("process", False):
-            value = corrections.get("stretch_y", {}).get("value", "")
-            active_corrections.append(f"9. Stretch Y (Factor: {value})")
-
-        # 10. NORMALIZE
-        if corrections.get("normilized", {}).get("process", False):
-            active_corrections.append("10. Normalize")
-
-        # 11. ZERO_START_TIME
-        if corrections.get("zero_start_time", {}).get("process", False):
-            active_corrections.append("11. Zero Start Time")
-
+        for key, describe in _CORRECTION_DESCRIPTIONS:
+            settings = corrections.get(key)
+            if settings and settings.get("process", False):
+                active_corrections.append(describe(settings))
+        
         if active_corrections:
-            summary += "<ul>"
-            for correction in active_corrections:
-                summary += f"<li>{correction}</li>"
-            summary += "</ul>"
+            parts.append("<ul>")
+            parts.extend(f"<li>{_html_text(correction)}</li>" for correction in active_corrections)
+            parts.append("</ul>")
         else:
-            summary += "<p>No active corrections</p>"
+            parts.append("<p>No active corrections</p>")
         
         # Add sensors
-        summary += "<h3>Sensors</h3>"
+        parts.append("<h3>Sensors</h3>")
         data_columns = config.get("data", {})
         data_names = config.get("data_name", {})
         
         if data_columns:
-            summary += "<ul>"
+            parts.append("<ul>")
             for orig_name, column in data_columns.items():
                 display_name = data_names.get(orig_name, orig_name)
-                summary += f"<li>{orig_name} → {display_name} (Column {column})</li>"
-            summary += "</ul>"
+                parts.append(f"<li>{_html_text(orig_name)} → {_html_text(display_name)} "
+                             f"(Column {_html_text(column)})</li>")
+            parts.append("</ul>")
         else:
-            summary += "<p>No sensors defined</p>"
+            parts.append("<p>No sensors defined</p>")
         
-        summary += "</body></html>"
-        self.config_summary.setHtml(summary)
+        parts.append("</body></html>")
+        self.config_summary.setHtml("".join(parts))
     
     def update_config_text_editor(self):
         """Update the config text editor with the current configuration"""
+        if self.config_text_editor is None:
+            return  # Not built yet, it is filled when its tab is first shown
+        
+        if self.main_tabs.currentIndex() != self.config_editor_tab_index:
+            self._config_text_stale = True
+            return  # Filled when its tab is shown again
+        self._config_text_stale = False
+        
+        if self.sensor_data.config_version == self._text_config_version:
+            return  # Already shows the current configuration
+        self._text_config_version = self.sensor_data.config_version
+        
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
             self.config_text_editor.setPlainText("")
             return
         
         try:
             # Format the JSON for display
-            formatted_json = json.dumps(self.sensor_data.config, indent=4)
+            formatted_json = _format_json(self.sensor_data.config)
             self.config_text_editor.setPlainText(formatted_json)
         except Exception as e:
             self.log_message(f"Error updating config editor: {e}", "ERROR")
     
+    @Slot()
     def update_config_from_text(self):
         """Update the configuration from the text editor"""
         try:
@@ -3047,7 +3588,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             config = json.loads(config_text)
             
             # Update the ReplicaXSensorDataReader object
-            success = self.sensor_data.load_config_from_dict(config)
+            success = self.load_sensor_config(config)
             
             if success:
                 self.log_message("Configuration updated from text editor", "SUCCESS")
@@ -3061,6 +3602,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         except Exception as e:
             self.log_message(f"Error updating configuration: {e}", "ERROR")
     
+    @Slot()
     def open_config_editor(self):
         """Open the configuration editor dialog"""
         if not hasattr(self.sensor_data, 'config'):
@@ -3074,7 +3616,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             new_config = dialog.get_updated_config()
             
             # Update the ReplicaXSensorDataReader object
-            success = self.sensor_data.load_config_from_dict(new_config)
+            success = self.load_sensor_config(new_config)
             
             if success:
                 self.log_message("Configuration updated from editor", "SUCCESS")
@@ -3086,93 +3628,193 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                 self.log_message("Failed to update configuration", "ERROR")
     
     def update_sensor_selection(self):
-        """Update the sensor selection checkboxes"""
-        # Clear existing checkboxes
-        for i in reversed(range(self.sensor_container_layout.count())):
-            item = self.sensor_container_layout.itemAt(i)
-            if item and item.widget():
-                item.widget().deleteLater()
-        
-        # Clear existing checkboxes dictionary
-        self.sensor_checkboxes = {}
-        
-        # Get sensor names from config (we might not have processed data yet)
-        config_sensor_names = []
-        for orig_name, display_name in self.sensor_data.config.get("data_name", {}).items():
-            config_sensor_names.append(display_name)
-        
-        # Get sensor names from processed data
-        processed_sensor_names = []
-        if hasattr(self.sensor_data, 'processed_data') and self.sensor_data.processed_data:
-            processed_sensor_names = list(self.sensor_data.processed_data.keys())
-        
-        # Use processed names if available, otherwise use config names
-        sensor_names = processed_sensor_names if processed_sensor_names else config_sensor_names
-        
-        # Initialize sensor colors if needed
-        self.assign_colors_to_sensors(sensor_names)
-        
-        if not sensor_names:
-            # Add a placeholder
-            label = QLabel("No sensors defined")
-            self.sensor_container_layout.addWidget(label)
-            return
-        
-        # Add checkboxes for each sensor
-        for sensor_name in sensor_names:
-            checkbox = QCheckBox(sensor_name)
-            checkbox.setChecked(True)  # Default to checked
-            checkbox.stateChanged.connect(self.update_plots)
-            
-            self.sensor_checkboxes[sensor_name] = checkbox
-            self.sensor_container_layout.addWidget(checkbox)
-        
-        # Add some empty space at the end if needed
-        self.sensor_container_layout.addStretch(1)
+        """Update the sensor selection checkboxes, keeping those of sensors that are still present"""
+        # Hide the container while it is updated, so it is laid out and painted once
+        self.sensor_container.hide()
+        try:
+            # Get sensor names from config (we might not have processed data yet)
+            config_sensor_names = []
+            for orig_name, display_name in self.sensor_data.config.get("data_name", {}).items():
+                config_sensor_names.append(display_name)
+        
+            # Get sensor names from processed data
+            processed_sensor_names = []
+            if self._has_processed_data:
+                processed_sensor_names = list(self.sensor_data.processed_data.keys())
+        
+            # Use processed names if available, otherwise use config names
+            sensor_names = processed_sensor_names if processed_sensor_names else config_sensor_names
+        
+            # Initialize sensor colors if needed
+            self.assign_colors_to_sensors(sensor_names)
+        
+            # Remove the checkboxes of sensors that are no longer defined
+            new_names = set(sensor_names)
+            for sensor_name in [name for name in self.sensor_checkboxes if name not in new_names]:
+                checkbox = self.sensor_checkboxes.pop(sensor_name)
+                self.sensor_container_layout.removeWidget(checkbox)
+                checkbox.deleteLater()
+        
+            # Add checkboxes for new sensors and move the kept ones into sensor order
+            for index, sensor_name in enumerate(sensor_names):
+                checkbox = self.sensor_checkboxes.get(sensor_name)
+                if checkbox is None:
+                    checkbox = QCheckBox(sensor_name)
+                    checkbox.setChecked(True)  # Default to checked
+                    checkbox.stateChanged.connect(self.schedule_plot_update)
+                    self.sensor_checkboxes[sensor_name] = checkbox
+                else:
+                    # Kept checkboxes are checked again, like new ones, without replotting
+                    with QSignalBlocker(checkbox):
+                        checkbox.setChecked(True)
+                    if self.sensor_container_layout.indexOf(checkbox) == index:
+                        continue
+                    self.sensor_container_layout.removeWidget(checkbox)
+                self.sensor_container_layout.insertWidget(index, checkbox)
+            self.sensor_checkboxes = {sensor_name: self.sensor_checkboxes[sensor_name] for sensor_name in sensor_names}
+        
+            # Show a placeholder when there are no sensors
+            self.sensor_placeholder.setVisible(not sensor_names)
+        finally:
+            self.sensor_container.show()
     
     def assign_colors_to_sensors(self, sensor_names):
-        """Assign colors to sensors"""
-        # Clear existing color assignments
-        self.sensor_colors = {}
-        
-        # Assign colors to sensors
-        for i, sensor_name in enumerate(sensor_names):
-            # Use predefined colors in rotation
-            color_idx = i % len(self.available_colors)
-            self.sensor_colors[sensor_name] = self.available_colors[color_idx]
+        """
+        Assign colors to sensors. Sensors that already have a color keep it, new sensors
+        take the lowest free color slots and sensors not listed are forgotten.
+        """
+        sensor_index = {sensor_name: self._sensor_index[sensor_name]
+                        for sensor_name in sensor_names if sensor_name in self._sensor_index}
+        used_slots = set(sensor_index.values())
+        slot = 0
+        for sensor_name in sensor_names:
+            if sensor_name not in sensor_index:
+                while slot in used_slots:
+                    slot += 1
+                sensor_index[sensor_name] = slot
+                used_slots.add(slot)
+        self._sensor_index = sensor_index
+    
+    def get_sensor_color(self, sensor_name):
+        """Return the color assigned to a sensor, or None to use the default color cycle"""
+        index = self._sensor_index.get(sensor_name)
+        return None if index is None else str(self._sensor_colors[index % len(self._sensor_colors)])
     
+    @Slot()
     def select_all_sensors(self):
         """Select all sensors"""
-        for checkbox in self.sensor_checkboxes.values():
-            checkbox.setChecked(True)
+        self.set_all_sensors_checked(True)
     
+    @Slot()
     def select_none_sensors(self):
         """Deselect all sensors"""
+        self.set_all_sensors_checked(False)
+    
+    def set_all_sensors_checked(self, checked):
+        """
+        Set every sensor checkbox to the given state.
+        The checkbox signals are blocked while they change, so the plots are updated
+        once afterwards instead of once per checkbox.
+        """
+        changed = False
         for checkbox in self.sensor_checkboxes.values():
-            checkbox.setChecked(False)
+            if checkbox.isChecked() != checked:
+                checkbox.blockSignals(True)
+                checkbox.setChecked(checked)
+                checkbox.blockSignals(False)
+                changed = True
+        
+        if changed:
+            self.update_plots()
     
+    @Slot()
     def process_data(self):
         """Process the sensor data and update plots"""
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
             self.log_message("No configuration loaded", "ERROR")
             return
         
+        # Skip timer ticks that arrive while a previous run is still in progress,
+        # or while an export is still reading the processed data
+        if self._processing or self._export_thread is not None:
+            return
+        self._processing = True
+        self.process_btn.setEnabled(False)
+        self.export_btn.setEnabled(False)
+        self.statusBar().showMessage("Processing data...")
+        
+        # Process the data in a worker thread, keeping the GUI responsive
+        thread = QThread(self)
+        worker = ProcessWorker(self.sensor_data)
+        worker.moveToThread(thread)
+        
+        thread.started.connect(worker.run)
+        worker.finished.connect(self.on_process_finished, type=Qt.QueuedConnection)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        
+        self._process_thread = thread
+        self._process_worker = worker
+        thread.start()
+    
+    def wait_for_processing(self):
+        """
+        Block until a running data processing finishes, before sensor_data is changed
+        from the GUI thread. Its result is dropped as the change supersedes it.
+        """
+        if self._process_thread is None:
+            return
+        self._process_thread.quit()
+        self._process_thread.wait()
+        self.finish_processing()
+    
+    def wait_for_export(self):
+        """
+        Block until a running export finishes, before sensor_data is changed from the
+        GUI thread. Its result is still logged when its queued finished signal arrives.
+        """
+        if self._export_thread is None:
+            return
+        self.statusBar().showMessage("Waiting for the export to finish...")
+        self._export_thread.quit()
+        self._export_thread.wait()
+    
+    def finish_processing(self):
+        """Clear the state of the data processing run that just ended"""
+        self._process_thread = None
+        self._process_worker = None
+        self._processing = False
+        self.process_btn.setEnabled(True)
+        self.export_btn.setEnabled(self._has_processed_data)
+    
+    @Slot(bool, str, str)
+    def on_process_finished(self, success, error, details):
+        """Show the result of the data processing and update the plots"""
+        if self.sender() is not self._process_worker:
+            return  # Dropped by wait_for_processing
+        # A failed run may leave no processed data, so only offer exporting what is there
+        self._has_processed_data = bool(self.sensor_data.processed_data)
+        self.finish_processing()
+        
+        if error:
+            self.log_message(f"Error processing data: {error}", "ERROR")
+            self.log_message(details, "ERROR")
+            self.statusBar().showMessage("Processing failed")
+            return
+        
         try:
-            # Process the data
-            success = self.sensor_data.process_data()
-            
             if success:
                 # Get the log from ReplicaXSensorDataReader and display it
                 self.log_text.clear()
+                entries = []
                 for line in self.sensor_data.log.split('\n'):
-                    if line.startswith("INFO:"):
-                        self.log_message(line[6:].strip(), "INFO")
-                    elif line.startswith("WARNING:"):
-                        self.log_message(line[9:].strip(), "WARNING")
-                    elif line.startswith("ERROR:"):
-                        self.log_message(line[7:].strip(), "ERROR")
+                    level_prefix = _LOG_LINE_PREFIXES.get(line[:line.find(":") + 1])
+                    if level_prefix is None:
+                        entries.append((line.strip(), "INFO"))
                     else:
-                        self.log_message(line.strip())
+                        entries.append((line[level_prefix[1]:].strip(), level_prefix[0]))
+                self.log_text.append_messages(entries)
                 
                 # Update summary in the status bar
                 self.update_status_summary()
@@ -3186,6 +3828,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                 self.log_message("Data processed successfully", "SUCCESS")
             else:
                 self.log_message("Failed to process data", "ERROR")
+                self.statusBar().showMessage("Processing failed")
         except Exception as e:
             self.log_message(f"Error processing data: {e}", "ERROR")
             import traceback
@@ -3193,7 +3836,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
     
     def update_status_summary(self):
         """Update the status bar with summary information"""
-        if not hasattr(self.sensor_data, 'processed_data') or not self.sensor_data.processed_data:
+        if not self._has_processed_data:
             self.statusBar().showMessage("No data processed")
             return
         
@@ -3206,6 +3849,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         # Display summary
         self.statusBar().showMessage(f"Processed {num_points} data points for {num_sensors} sensors")
     
+    @Slot()
     def edit_correction_settings(self):
         """Open the configuration editor directly to the corrections tab"""
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
@@ -3223,7 +3867,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             new_config = dialog.get_updated_config()
             
             # Update the ReplicaXSensorDataReader object
-            success = self.sensor_data.load_config_from_dict(new_config)
+            success = self.load_sensor_config(new_config)
             
             if success:
                 self.log_message("Configuration updated from editor", "SUCCESS")
@@ -3234,6 +3878,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             else:
                 self.log_message("Failed to update configuration", "ERROR")
     
+    @Slot()
     def edit_units_settings(self):
         """Open the configuration editor directly to the units tab"""
         if not hasattr(self.sensor_data, 'config') or not self.sensor_data.config:
@@ -3251,7 +3896,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             new_config = dialog.get_updated_config()
             
             # Update the ReplicaXSensorDataReader object
-            success = self.sensor_data.load_config_from_dict(new_config)
+            success = self.load_sensor_config(new_config)
             
             if success:
                 self.log_message("Configuration updated from editor", "SUCCESS")
@@ -3262,34 +3907,39 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             else:
                 self.log_message("Failed to update configuration", "ERROR")
     
+    @Slot()
+    def schedule_plot_update(self):
+        """Update the plots once the checkbox toggles settle, restarting the delay on each call"""
+        self._replot_timer.start()
+    
+    @Slot()
     def update_plots(self):
         """Update all plots based on selected sensors"""
-        if not hasattr(self.sensor_data, 'processed_data') or not self.sensor_data.processed_data:
-            return
+        self._replot_timer.stop()  # Any scheduled update is covered by this one
+        if not self._has_processed_data or self._processing:
+            return  # Replotted when the processing finishes
         
-        # Clear all plots
-        self.combined_canvas.clear_plot()
+        # Get selected sensors and fetch their data once for both plot tabs
+        selected_sensors = self.get_selected_sensors()
+        get_xy = self.sensor_data.get_xy
+        xy_cache = {sensor_name: get_xy(sensor_name) for sensor_name in selected_sensors}
         
         # Update the individual plots grid
-        self.update_individual_plots()
+        self.refresh_individual_plots(xy_cache=xy_cache)
         
-        # Get selected sensors
-        selected_sensors = []
-        for sensor_name, checkbox in self.sensor_checkboxes.items():
-            if checkbox.isChecked():
-                selected_sensors.append(sensor_name)
-        
-        # Update combined plot
-        for sensor_name in selected_sensors:
-            time_array, data_array = self.sensor_data.get_xy(sensor_name)
-            # Use assigned colors for sensors
-            color = self.sensor_colors.get(sensor_name)
-            self.combined_canvas.plot_sensor(time_array, data_array, sensor_name, color)
+        # Update combined plot in place, using assigned colors for sensors
+        get_sensor_color = self.get_sensor_color
+        self.combined_canvas.plot_sensors([
+            (sensor_name, *xy, get_sensor_color(sensor_name))
+            for sensor_name, xy in xy_cache.items()
+        ])
         
         # Update units and titles
-        output_time_unit = self.sensor_data.config.get("output_units", {}).get("time", "s")
-        output_data_unit = self.sensor_data.config.get("output_units", {}).get("data", "m")
-        data_type = self.sensor_data.config.get("data_type", "Length").replace("_", " ")
+        config = self.sensor_data.config
+        output_units = config.get("output_units", {})
+        output_time_unit = output_units.get("time", "s")
+        output_data_unit = output_units.get("data", "m")
+        data_type = config.get("data_type", "Length").replace("_", " ")
         
         # Update combined plot labels
         self.combined_canvas.set_labels(
@@ -3298,61 +3948,78 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             title="Combined Sensor Data"
         )
     
-    def update_individual_plots(self):
-        """Create or update individual plots for each sensor with professional appearance"""
-        # Clear existing plots widget content
-        for i in reversed(range(self.individual_plots_layout.count())):
-            item = self.individual_plots_layout.itemAt(i)
-            if item and item.widget():
-                item.widget().deleteLater()
-        
-        if not hasattr(self.sensor_data, 'processed_data') or not self.sensor_data.processed_data:
-            # Add a placeholder
-            label = QLabel("No data processed")
-            self.individual_plots_layout.addWidget(label, 0, 0)
+    def get_selected_sensors(self):
+        """Names of the checked sensors, in checkbox order"""
+        return [sensor_name for sensor_name, checkbox in self.sensor_checkboxes.items() if checkbox.isChecked()]
+    
+    def refresh_individual_plots(self, xy_cache=None):
+        """
+        Update the individual plots now if their tab is shown, otherwise mark them
+        as stale so they are redrawn when the tab is selected.
+        """
+        if self.plot_tabs.currentWidget() is self.individual_plots_widget:
+            self._individual_plots_stale = False
+            self.update_individual_plots(xy_cache=xy_cache)
+        else:
+            self._individual_plots_stale = True
+    
+    @Slot(int)
+    def on_plot_tab_changed(self, index):
+        """Draw the individual plots when their tab is selected and they are out of date"""
+        if (self._individual_plots_stale and not self._processing
+                and self.plot_tabs.widget(index) is self.individual_plots_widget):
+            self._individual_plots_stale = False
+            self.update_individual_plots()
+    
+    def update_individual_plots(self, xy_cache=None):
+        """
+        Create or update individual plots for each sensor with professional appearance,
+        reusing any (time, data) arrays already fetched in xy_cache.
+        """
+        if not self._has_processed_data:
+            # Show a placeholder
+            self.show_individual_plots_message("No data processed")
             return
         
         # Get selected sensors
-        selected_sensors = []
-        for sensor_name, checkbox in self.sensor_checkboxes.items():
-            if checkbox.isChecked():
-                selected_sensors.append(sensor_name)
+        selected_sensors = self.get_selected_sensors()
         
         if not selected_sensors:
-            # Add a placeholder if no sensors are selected
-            label = QLabel("No sensors selected")
-            self.individual_plots_layout.addWidget(label, 0, 0)
+            # Show a placeholder if no sensors are selected
+            self.show_individual_plots_message("No sensors selected")
             return
         
         # Calculate grid layout - maximum 4 rows for better visibility
         n_sensors = len(selected_sensors)
         n_rows = min(n_sensors, 4)  # Maximum 4 rows
-        n_cols = int(np.ceil(n_sensors / n_rows))
+        n_cols = -(-n_sensors // n_rows)  # Ceiling division
         
-        # Create a main widget to hold the figure and toolbar
-        plot_widget = QWidget()
-        plot_layout = QVBoxLayout(plot_widget)
-        plot_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins to use full space
+        # Reuse a single figure for all subplots, clearing what the last refresh drew.
+        # The container is repainted once after its widgets are created and swapped.
+        self.individual_plots_container.setUpdatesEnabled(False)
+        if self.individual_figure is None:
+            self.create_individual_figure()
+        self.individual_plots_label.hide()
+        self.individual_plot_widget.show()
+        self.individual_plots_container.setUpdatesEnabled(True)
         
-        # Create a single figure for all subplots
-        width = 9  # Width for figure
         height = 2.5 * n_rows  # Height per row
         
-        fig = Figure(figsize=(width, height), dpi=100, facecolor='white')
-        canvas = FigureCanvas(fig)
-        
-        # Add a toolbar for the entire figure
-        toolbar = NavigationToolbar(canvas, plot_widget)
-        plot_layout.addWidget(toolbar)
-        plot_layout.addWidget(canvas)
+        fig = self.individual_figure
+        fig.clear()
+        # The canvas resizes the figure to the widget, so size the widget and let the scroll area follow
+        dpi = fig.dpi / self.individual_canvas.device_pixel_ratio
+        self.individual_canvas.setMinimumHeight(int(height * dpi))
         
         # Get output units and data type
-        output_time_unit = self.sensor_data.config.get("output_units", {}).get("time", "s")
-        output_data_unit = self.sensor_data.config.get("output_units", {}).get("data", "m")
-        data_type = self.sensor_data.config.get("data_type", "Length").replace("_", " ")
+        config = self.sensor_data.config
+        output_units = config.get("output_units", {})
+        output_time_unit = output_units.get("time", "s")
+        output_data_unit = output_units.get("data", "m")
+        data_type = config.get("data_type", "Length").replace("_", " ")
         
         # Set figure title with more detailed information
-        config_name = os.path.basename(self.sensor_data.config.get("file_path", ""))
+        config_name = os.path.basename(config.get("file_path", ""))
         fig.suptitle(f"Sensor Data Analysis: {config_name}", 
                     fontsize=14, fontweight='bold', y=0.98)
         
@@ -3366,20 +4033,35 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             ax = fig.add_subplot(n_rows, n_cols, i+1)
             axes.append(ax)
         
+        # Get data and calculate the statistics, one reduction per group of
+        # sensors that share the same number of samples
+        if xy_cache is None:
+            xy_cache = {}
+        sensor_xy = [xy_cache[sensor_name] if sensor_name in xy_cache else self.sensor_data.get_xy(sensor_name)
+                     for sensor_name in selected_sensors]
+        min_vals = np.empty(n_sensors)
+        max_vals = np.empty(n_sensors)
+        mean_vals = np.empty(n_sensors)
+        length_groups = {}
+        for i, (_, data_array) in enumerate(sensor_xy):
+            length_groups.setdefault(len(data_array), []).append(i)
+        for indices in length_groups.values():
+            stack = np.stack([sensor_xy[i][1] for i in indices])
+            min_vals[indices] = stack.min(axis=1)
+            max_vals[indices] = stack.max(axis=1)
+            mean_vals[indices] = stack.mean(axis=1)
+        
         # Plot each sensor in its subplot with enhanced appearance
         for i, sensor_name in enumerate(selected_sensors):
             ax = axes[i]
             
-            # Get data
-            time_array, data_array = self.sensor_data.get_xy(sensor_name)
-            
-            # Calculate some statistics
-            min_val = np.min(data_array)
-            max_val = np.max(data_array)
-            mean_val = np.mean(data_array)
+            time_array, data_array = sensor_xy[i]
+            min_val = min_vals[i]
+            max_val = max_vals[i]
+            mean_val = mean_vals[i]
             
             # Plot with consistent color and improved line properties
-            color = self.sensor_colors.get(sensor_name)
+            color = self.get_sensor_color(sensor_name)
             line, = ax.plot(time_array, data_array, color=color, linewidth=1.2, alpha=0.9, label=sensor_name)
             
             # Add horizontal line at zero if within range (but not the mean line)
@@ -3387,23 +4069,13 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                 ax.axhline(y=0, color='black', linestyle='-', alpha=0.3, linewidth=0.5)
             
             # Create custom legend handles and labels
-            # Bold sensor name with its respective color
-            from matplotlib.font_manager import FontProperties
-            from matplotlib.lines import Line2D
-            
-            # Create a bold font for the sensor name
-            bold_font = FontProperties()
-            bold_font.set_weight('bold')
-            bold_font.set_size(6)  # Set the same size as the legend font
-            
-            # Create legend elements
             legend_elements = [
                 # Sensor name with color and bold font
                 Line2D([0], [0], color=color, lw=2, label=sensor_name),
                 # Stats in black normal font
-                Line2D([0], [0], color='white', marker='', linestyle='', label=f"Min: {min_val:.3g}"),
-                Line2D([0], [0], color='white', marker='', linestyle='', label=f"Max: {max_val:.3g}"),
-                Line2D([0], [0], color='white', marker='', linestyle='', label=f"Mean: {mean_val:.3g}")
+                _legend_text_handle(f"Min: {min_val:.3g}"),
+                _legend_text_handle(f"Max: {max_val:.3g}"),
+                _legend_text_handle(f"Mean: {mean_val:.3g}")
             ]
             
             # Add legend at the top right corner with small font
@@ -3411,7 +4083,7 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
                             framealpha=0.7, ncol=1)
             
             # Set the font properties for the first entry (sensor name) to bold
-            legend.get_texts()[0].set_fontproperties(bold_font)
+            legend.get_texts()[0].set_fontproperties(_LEGEND_BOLD_FONT)
             
             # FIX: Set better y-axis limits with appropriate padding
             data_range = max_val - min_val
@@ -3424,8 +4096,8 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             # Set y-axis limits with padding
             ax.set_ylim(min_val - padding, max_val + padding)
             
-            # Configure tick appearance
-            ax.tick_params(axis='both', which='major', labelsize=8, direction='out', length=4)
+            # Configure tick appearance, with tick labels close to the edges of the plot box
+            ax.tick_params(axis='both', which='major', labelsize=8, direction='out', length=4, pad=2)
             ax.tick_params(axis='both', which='minor', labelsize=6, direction='out', length=2)
             
             # Add grid with both major and minor lines
@@ -3440,31 +4112,57 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
             # Use scientific notation for large or small numbers
             ax.ticklabel_format(style='sci', scilimits=(-3, 4), axis='y')
             
-            # Move tick labels to the edges of the plot box
-            ax.tick_params(axis='both', pad=2)  # Reduce padding for tick labels
-            
         # Adjust layout for better spacing
         fig.tight_layout(rect=[0, 0.03, 1, 0.95])  # Leave room for suptitle
         
-        # Add the widget to the layout
-        self.individual_plots_layout.addWidget(plot_widget, 0, 0)
+        # The toolbar's zoom history refers to the cleared axes
+        self.individual_toolbar.update()
+        
+        # Draw the canvas
+        self.individual_canvas.draw_idle()
+    
+    def create_individual_figure(self):
+        """Create the figure, canvas and toolbar of the individual plots"""
+        # Create a main widget to hold the figure and toolbar
+        self.individual_plot_widget = QWidget()
+        plot_layout = QVBoxLayout(self.individual_plot_widget)
+        plot_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins to use full space
+        
+        self.individual_figure = Figure(figsize=(9, 2.5), dpi=100, facecolor='white')
+        self.individual_canvas = FigureCanvas(self.individual_figure)
+        
+        # Add a toolbar for the entire figure
+        self.individual_toolbar = NavigationToolbar(self.individual_canvas, self.individual_plot_widget)
+        plot_layout.addWidget(self.individual_toolbar)
+        plot_layout.addWidget(self.individual_canvas)
         
         # Set size policy to expand
-        plot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.individual_plot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
-        # Draw the canvas
-        canvas.draw()
+        # Add the widget to the layout
+        self.individual_plots_layout.addWidget(self.individual_plot_widget, 0, 0)
+    
+    def show_individual_plots_message(self, text):
+        """Show a placeholder message instead of the individual plots"""
+        self.individual_plots_container.setUpdatesEnabled(False)
+        if self.individual_plot_widget is not None:
+            self.individual_plot_widget.hide()
+        self.individual_plots_label.setText(text)
+        self.individual_plots_label.show()
+        self.individual_plots_container.setUpdatesEnabled(True)
 
+    @Slot()
     def clear_plots(self):
         """Clear all plots"""
         self.combined_canvas.clear_plot()
-        self.update_individual_plots()
+        self.refresh_individual_plots()
         self.log_message("Plots cleared")
     
     def log_message(self, message, level="INFO"):
         """Add a message to the log text widget"""
         self.log_text.append_message(message, level)
     
+    @Slot()
     def show_about_dialog(self):
         """Show an about dialog"""
         QMessageBox.about(
@@ -3489,6 +4187,14 @@ class ReplicaXSensorDataReaderGUI(QMainWindow):
         if self.real_time_update_timer.isActive():
             self.real_time_update_timer.stop()
         
+        # Let a running processing or export finish, the export is writing its file
+        if self._process_thread is not None:
+            self._process_thread.quit()
+            self._process_thread.wait()
+        if self._export_thread is not None:
+            self._export_thread.quit()
+            self._export_thread.wait()
+        
         event.accept()
 
 
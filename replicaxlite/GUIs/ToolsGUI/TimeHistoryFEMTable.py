@@ -19,10 +19,80 @@
 ######################################################################################################
 
 
+import numpy as np
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-                              QMessageBox, QApplication)
+                              QApplication)
 from PySide6.QtCore import Qt
 from ...UtilityCode.TableGUI import ReplicaXTable
+from ...Managers.dialog_helper import DialogHelper
+
+
+def _check_time_history(values):
+    """
+    Run every numeric check of the time history on a (rows, 4) array of
+    time, acceleration, velocity and displacement, with NaN for empty cells.
+    
+    Returns a dict with the 1-based row number arrays 'missing_time', 'missing_accel'
+    and 'incomplete', the compacted time and acceleration rows as 'data', the
+    'vel_none' and 'disp_none' counts over those rows, and 'first_bad_step', the
+    index in 'data' of the first time that does not increase (None if all do).
+    """
+    # NaN is the only value not equal to itself, one ufunc gives the presence mask
+    present = values == values
+    has_time, has_accel, has_vel, has_disp = present.T
+    has_any_motion = present[:, 1:].any(axis=1)
+    no_accel = ~has_accel
+    
+    # Each class is one mask expression, matching the first applicable rule per row:
+    # 1. Any motion data without time
+    missing_time = has_any_motion & ~has_time
+    # 2. Time exists but no acceleration (acceleration is REQUIRED with time)
+    missing_accel = has_time & no_accel
+    # 3. Velocity or displacement without acceleration, not already covered above
+    incomplete = (has_vel | has_disp) & no_accel & ~(missing_time | missing_accel)
+    
+    # Only rows with both time AND acceleration are data
+    valid = has_time & has_accel
+    data = values[valid]
+    
+    # Compare neighbours directly, np.diff would turn repeated infinite times into NaN and pass them
+    time = data[:, 0]
+    not_increasing = time[1:] <= time[:-1]
+    first_bad_step = int(not_increasing.argmax()) + 1 if not_increasing.any() else None
+    
+    return {
+        'missing_time': np.flatnonzero(missing_time) + 1,
+        'missing_accel': np.flatnonzero(missing_accel) + 1,
+        'incomplete': np.flatnonzero(incomplete) + 1,
+        'data': data,
+        'vel_none': int(np.count_nonzero(~has_vel[valid])),
+        'disp_none': int(np.count_nonzero(~has_disp[valid])),
+        'first_bad_step': first_bad_step,
+    }
+
+
+# Dictionary keys and data column indices, for each (has_velocity, has_displacement)
+_DICT_KEYS = {
+    (False, False): (('time', 0), ('accel', 1)),
+    (True, False): (('time', 0), ('accel', 1), ('vel', 2)),
+    (False, True): (('time', 0), ('accel', 1), ('disp', 3)),
+    (True, True): (('time', 0), ('accel', 1), ('vel', 2), ('disp', 3)),
+}
+
+
+def _format_time_history_dict(columns, keys):
+    """Format the selected data columns as the dictionary text that is copied."""
+    entries = ",\n".join(f"    '{key}': [{', '.join(map(repr, columns[index]))}]" for key, index in keys)
+    return "{\n" + entries + "\n}\n"
+
+
+def _format_row_error(label, rows):
+    """Format one error class as its label and the first 10 of its row number array."""
+    row_list = ", ".join(map(str, rows[:10].tolist()))
+    if rows.size > 10:
+        row_list += f" ... ({rows.size} total)"
+    return f"• {label}:\n  {row_list}"
+
 
 class TimeHistoryDataDialog(QDialog):
     """
@@ -32,6 +102,8 @@ class TimeHistoryDataDialog(QDialog):
     types of motion inputs, then copy them in dictionary format suitable for use 
     with the run_time_history_analysis function.
     """
+    # The table starts with this many rows and grows by as many when the last rows are edited
+    ROW_BLOCK = 100
     
     def __init__(self, parent=None, settings=None):
         super().__init__(parent)
@@ -40,8 +112,15 @@ class TimeHistoryDataDialog(QDialog):
         self.setModal(True)
         self.resize(600, 500)
         
-        # Initialize table with 10000 rows and settings
-        self.table = ReplicaXTable(rows=10000, columns=4, settings=self.settings)
+        # Last row that ever received data, nothing below it needs to be read
+        self._last_data_row = -1
+        
+        # Initialize table with one block of rows and settings, pasted data adds the rows it needs
+        self.table = ReplicaXTable(rows=self.ROW_BLOCK, columns=4, settings=self.settings)
+        self.table.grow_rows_on_paste = True
+        # The model signals also report pasted and programmatically set values
+        self.table.model().dataChanged.connect(self.on_table_data_changed)
+        self.table.model().rowsInserted.connect(self.on_table_rows_inserted)
         self.table.set_column_types(['float', 'float', 'float', 'float'])
         self.table.set_headers(['Time', 'Acceleration', 'Velocity', 'Displacement'])
         
@@ -61,6 +140,24 @@ class TimeHistoryDataDialog(QDialog):
         main_layout.addWidget(copy_btn)
         self.setLayout(main_layout)
         
+        # The application clipboard is a single object, look it up once
+        self._clipboard = QApplication.clipboard()
+        
+        # Reuses one message box per kind for the validation messages
+        self.dialog_helper = DialogHelper(self)
+    
+    def on_table_data_changed(self, top_left, bottom_right, roles=()):
+        """Track the last data row and add a block of rows when one of the last rows is edited."""
+        self._last_data_row = max(self._last_data_row, bottom_right.row())
+        row_count = self.table.rowCount()
+        if bottom_right.row() >= row_count - 10:
+            self.table.grow_to(row_count + self.ROW_BLOCK)
+    
+    def on_table_rows_inserted(self, parent, first, last):
+        """Rows inserted above the last data row move it down."""
+        if first <= self._last_data_row:
+            self._last_data_row += last - first + 1
+        
     def copy_to_dict_format(self):
         """
         Convert table data to dictionary format and copy to clipboard.
@@ -69,65 +166,33 @@ class TimeHistoryDataDialog(QDialog):
         - All motion arrays must have same length  
         - All values must be numerical
         - Data must be continuous (no None values after filtering)
+        
+        Returns the copied dictionary string, or None when validation fails.
         """
-        # First pass: detect ALL types of illogical data
-        row_count = self.table.rowCount()
-        rows_missing_time = []
-        rows_missing_accel = []
-        rows_incomplete = []
-        
-        for i in range(row_count):
-            try:
-                time_val = self.table.get_cell_value(i, 0)
-                accel_val = self.table.get_cell_value(i, 1)
-                vel_val = self.table.get_cell_value(i, 2)
-                disp_val = self.table.get_cell_value(i, 3)
-                
-                has_time = time_val is not None
-                has_accel = accel_val is not None
-                has_vel = vel_val is not None
-                has_disp = disp_val is not None
-                has_any_motion = has_accel or has_vel or has_disp
-                
-                # Check for illogical patterns:
-                # 1. Any motion data without time
-                if has_any_motion and not has_time:
-                    rows_missing_time.append(i + 1)
-                
-                # 2. Time exists but no acceleration (acceleration is REQUIRED with time)
-                elif has_time and not has_accel:
-                    rows_missing_accel.append(i + 1)
-                
-                # 3. Velocity or displacement without acceleration
-                elif (has_vel or has_disp) and not has_accel:
-                    rows_incomplete.append(i + 1)
-                    
-            except Exception:
-                continue
+        # Bulk read up to the last data row (none if nothing was entered): one float array
+        # for the four columns, NaN where a cell is empty
+        try:
+            values = self.table.to_numpy(columns=range(4), row_count=self._last_data_row + 1)
+        except ValueError as e:
+            self.dialog_helper.show_warning("Invalid Data", f"{e}.")
+            return
+        
+        check = _check_time_history(values)
+        rows_missing_time = check['missing_time']
+        rows_missing_accel = check['missing_accel']
+        rows_incomplete = check['incomplete']
         
         # BLOCK copying if there's ANY illogical data
         error_messages = []
         
-        if rows_missing_time:
-            row_list = ", ".join(str(r) for r in rows_missing_time[:10])
-            if len(rows_missing_time) > 10:
-                row_list += f" ... ({len(rows_missing_time)} total)"
-            error_messages.append(f"• Rows with motion data but NO TIME:\n  {row_list}")
-        
-        if rows_missing_accel:
-            row_list = ", ".join(str(r) for r in rows_missing_accel[:10])
-            if len(rows_missing_accel) > 10:
-                row_list += f" ... ({len(rows_missing_accel)} total)"
-            error_messages.append(f"• Rows with time but NO ACCELERATION:\n  {row_list}")
-        
-        if rows_incomplete:
-            row_list = ", ".join(str(r) for r in rows_incomplete[:10])
-            if len(rows_incomplete) > 10:
-                row_list += f" ... ({len(rows_incomplete)} total)"
-            error_messages.append(f"• Rows with velocity/displacement but NO ACCELERATION:\n  {row_list}")
+        for rows, label in ((rows_missing_time, "Rows with motion data but NO TIME"),
+                            (rows_missing_accel, "Rows with time but NO ACCELERATION"),
+                            (rows_incomplete, "Rows with velocity/displacement but NO ACCELERATION")):
+            if rows.size:
+                error_messages.append(_format_row_error(label, rows))
         
         if error_messages:
-            QMessageBox.critical(self, "Invalid Data Structure", 
+            self.dialog_helper.show_error("Invalid Data Structure", 
                             f"Cannot copy data with illogical structure!\n\n"
                             + "\n\n".join(error_messages) +
                             f"\n\nFIX REQUIRED:\n"
@@ -135,101 +200,52 @@ class TimeHistoryDataDialog(QDialog):
                             f"• Velocity/displacement cannot exist without acceleration")
             return
         
-        # Second pass: collect valid rows
-        valid_rows = []
-        
-        for i in range(row_count):
-            try:
-                time_val = self.table.get_cell_value(i, 0)
-                accel_val = self.table.get_cell_value(i, 1)
-                vel_val = self.table.get_cell_value(i, 2)
-                disp_val = self.table.get_cell_value(i, 3)
-                
-                # Only include rows with both time AND acceleration
-                if time_val is not None and accel_val is not None:
-                    # Validate numerical values
-                    try:
-                        float(time_val)
-                        float(accel_val)
-                        if vel_val is not None:
-                            float(vel_val)
-                        if disp_val is not None:
-                            float(disp_val)
-                    except (ValueError, TypeError):
-                        QMessageBox.warning(self, "Invalid Data", 
-                                        f"Row {i+1} contains non-numerical values.")
-                        return
-                    
-                    valid_rows.append({
-                        'time': float(time_val),
-                        'accel': float(accel_val),
-                        'vel': float(vel_val) if vel_val is not None else None,
-                        'disp': float(disp_val) if disp_val is not None else None
-                    })
-                        
-            except Exception:
-                continue
+        # Rows with both time AND acceleration, split into columns
+        columns = check['data'].T.tolist()
+        time_data = columns[0]
+        vel_none_count = check['vel_none']
+        disp_none_count = check['disp_none']
         
         # Validate that we have data
-        if not valid_rows:
-            QMessageBox.warning(self, "No Valid Data", 
+        if not time_data:
+            self.dialog_helper.show_warning("No Valid Data", 
                             "No valid data to copy. Please enter time and acceleration values.")
             return
         
-        # Extract data for each column from valid rows
-        time_data = [row['time'] for row in valid_rows]
-        accel_data = [row['accel'] for row in valid_rows]
-        vel_data = [row['vel'] for row in valid_rows]
-        disp_data = [row['disp'] for row in valid_rows]
-        
-        # Check if velocity or displacement have any non-None values
-        has_velocity = any(x is not None for x in vel_data)
-        has_displacement = any(x is not None for x in disp_data)
+        # Velocity or displacement is present if any collected row has a value
+        n_points = len(time_data)
+        has_velocity = vel_none_count < n_points
+        has_displacement = disp_none_count < n_points
         
         # Validate consistency: if we have velocity or displacement data,
         # check that they don't have gaps (all should be present or all absent)
-        if has_velocity:
-            none_count = sum(1 for x in vel_data if x is None)
-            if none_count > 0:
-                QMessageBox.warning(self, "Incomplete Data", 
-                                f"Velocity data has {none_count} missing values. "
-                                "All rows with time/acceleration must have velocity data, or none should.")
-                return
+        if has_velocity and vel_none_count > 0:
+            self.dialog_helper.show_warning("Incomplete Data", 
+                            f"Velocity data has {vel_none_count} missing values. "
+                            "All rows with time/acceleration must have velocity data, or none should.")
+            return
         
-        if has_displacement:
-            none_count = sum(1 for x in disp_data if x is None)
-            if none_count > 0:
-                QMessageBox.warning(self, "Incomplete Data", 
-                                f"Displacement data has {none_count} missing values. "
-                                "All rows with time/acceleration must have displacement data, or none should.")
-                return
-        
-        # Validate time is monotonically increasing
-        for i in range(1, len(time_data)):
-            if time_data[i] <= time_data[i-1]:
-                QMessageBox.warning(self, "Invalid Time Data", 
-                                f"Time values must be monotonically increasing. "
-                                f"Issue at row {i+1}: {time_data[i]} <= {time_data[i-1]}")
-                return
-        
-        # Build dictionary with clean data (all arrays have same length)
-        dict_str = "{\n"
-        dict_str += "    'time': [" + ", ".join(str(x) for x in time_data) + "],\n"
-        dict_str += "    'accel': [" + ", ".join(str(x) for x in accel_data) + "]"
-        
-        # Add velocity if present (all values must be non-None at this point)
-        if has_velocity:
-            dict_str += ",\n    'vel': [" + ", ".join(str(x) for x in vel_data) + "]"
+        if has_displacement and disp_none_count > 0:
+            self.dialog_helper.show_warning("Incomplete Data", 
+                            f"Displacement data has {disp_none_count} missing values. "
+                            "All rows with time/acceleration must have displacement data, or none should.")
+            return
         
-        # Add displacement if present (all values must be non-None at this point)
-        if has_displacement:
-            dict_str += ",\n    'disp': [" + ", ".join(str(x) for x in disp_data) + "]"
+        # Validate time is monotonically increasing, reporting the first offending step
+        i = check['first_bad_step']
+        if i is not None:
+            self.dialog_helper.show_warning("Invalid Time Data", 
+                            f"Time values must be monotonically increasing. "
+                            f"Issue at row {i+1}: {time_data[i]} <= {time_data[i-1]}")
+            return
         
-        dict_str += "\n}\n"
+        # Build dictionary with clean data (all arrays have same length), velocity and
+        # displacement are included when present (all values are non-None at this point)
+        dict_keys = _DICT_KEYS[has_velocity, has_displacement]
+        dict_str = _format_time_history_dict(columns, dict_keys)
         
         # Copy to clipboard
-        clipboard = QApplication.clipboard()
-        clipboard.setText(dict_str)
+        self._clipboard.setText(dict_str)
         
         # Show confirmation with data summary
         data_summary = f"Copied {len(time_data)} data points"
@@ -238,7 +254,7 @@ class TimeHistoryDataDialog(QDialog):
         if has_displacement:
             data_summary += " (with displacement)"
         
-        QMessageBox.information(self, "Copied", 
+        self.dialog_helper.show_info("Copied", 
                             f"{data_summary} to clipboard.")
         
         return dict_str
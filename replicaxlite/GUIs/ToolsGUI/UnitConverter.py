@@ -19,6 +19,7 @@
 ######################################################################################################
 
 
+import re
 from PySide6.QtWidgets import (QDoubleSpinBox, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QComboBox, QPushButton, QLineEdit, QGridLayout, 
                             QDialog, QSizePolicy)
@@ -28,38 +29,66 @@ from PySide6.QtGui import QValidator
 from ...UtilityAPI.UnitsAPI import ReplicaXUnits
 
 
+# A complete float literal, and any prefix of one that typing can still complete
+_FLOAT_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
+_INTERMEDIATE_RE = re.compile(r'[+-]?\d*\.?\d*([eE][+-]?\d*)?')
+
+
+def _number_text(text):
+    """Normalize spin box text for parsing: decimal comma to point, no surrounding spaces."""
+    # str.replace returns the same string when there is no comma, and beats str.translate
+    return text.replace(',', '.').strip()
+
+
 class CustomSpinBox(QDoubleSpinBox):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Last formatted value, repaints mostly ask for the same one again
+        self._last_value = None
+        self._last_text = ''
+        
         self.setDecimals(16)
         self.setRange(-9999999999999999.0, 9999999999999999.0)
 
     def textFromValue(self, value):
-        return f"{value:.16g}"
+        # Zero is never reused, 0.0 == -0.0 but they format differently
+        if value == self._last_value and value != 0.0:
+            return self._last_text
+        self._last_value = value
+        self._last_text = f"{value:.16g}"
+        return self._last_text
 
     def valueFromText(self, text):
-        try:
-            return float(text.replace(',', '.').strip())
-        except ValueError:
-            return 0.0
+        text = _number_text(text)
+        if _FLOAT_RE.fullmatch(text):
+            return float(text)
+        return 0.0
 
     def validate(self, text, pos):
-        try:
-            float(text.replace(',', '.').strip())
+        value_text = _number_text(text)
+        if _FLOAT_RE.fullmatch(value_text):
             return QValidator.Acceptable, text, pos
-        except ValueError:
-            if text.strip() in ['-', '+', '.', '']:
-                return QValidator.Intermediate, text, pos
-            return QValidator.Invalid, text, pos
+        if _INTERMEDIATE_RE.fullmatch(value_text):
+            return QValidator.Intermediate, text, pos
+        return QValidator.Invalid, text, pos
 
     def fixup(self, text):
-        return text.replace(',', '.').strip()
+        return _number_text(text)
 
 
 class ReplicaXUnitConverterManager(QWidget):
+    # Delay that coalesces the conversions requested while a value is typed
+    CONVERT_DELAY_MS = 30
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.converter = ReplicaXUnits()
+        
+        self._convert_timer = QtCore.QTimer(self)
+        self._convert_timer.setSingleShot(True)
+        self._convert_timer.setInterval(self.CONVERT_DELAY_MS)
+        self._convert_timer.timeout.connect(self.unit_converter_gui)
+        
         self.create_ui()
         self.bindings()
 
@@ -108,18 +137,28 @@ class ReplicaXUnitConverterManager(QWidget):
         for unit_type in self.converter.units:
             self.comboBox_quantity.addItem(unit_type)
         
+        # One unit list model per quantity, shared by both unit combo boxes
+        self._unit_models = {unit_type: QtCore.QStringListModel(list(units), self)
+                             for unit_type, units in self.converter.units.items()}
+        self._empty_unit_model = QtCore.QStringListModel(self)
+        
         # Set initial units
         self.fill_unit_comboboxes(self.comboBox_quantity.currentText())
 
     def fill_unit_comboboxes(self, unit_type):
-        self.comboBox_unit_from.clear()
-        self.comboBox_unit_to.clear()
-        if unit_type:
-            for unit in self.converter.units[unit_type]:
-                self.comboBox_unit_from.addItem(unit)
-                self.comboBox_unit_to.addItem(unit)
+        # Switch models silently, then convert once for the new units
+        model = self._unit_models.get(unit_type, self._empty_unit_model)
+        for combo_box in (self.comboBox_unit_from, self.comboBox_unit_to):
+            with QtCore.QSignalBlocker(combo_box):
+                combo_box.setModel(model)
+        self.schedule_conversion()
+    
+    def schedule_conversion(self):
+        """Convert once the inputs settle, restarting the delay on each call"""
+        self._convert_timer.start()
     
     def unit_converter_gui(self):
+        self._convert_timer.stop()  # Any scheduled conversion is covered by this one
         unit_type = self.comboBox_quantity.currentText()
         from_unit = self.comboBox_unit_from.currentText()
         to_unit = self.comboBox_unit_to.currentText()
@@ -139,10 +178,10 @@ class ReplicaXUnitConverterManager(QWidget):
 
     def bindings(self):
         self.comboBox_quantity.currentTextChanged.connect(self.fill_unit_comboboxes)
-        self.comboBox_quantity.currentTextChanged.connect(self.unit_converter_gui)
-        self.comboBox_unit_from.currentTextChanged.connect(self.unit_converter_gui)
-        self.comboBox_unit_to.currentTextChanged.connect(self.unit_converter_gui)
-        self.doubleSpinBox_value_unit_from.valueChanged.connect(self.unit_converter_gui)
+        self.comboBox_quantity.currentTextChanged.connect(self.schedule_conversion)
+        self.comboBox_unit_from.currentTextChanged.connect(self.schedule_conversion)
+        self.comboBox_unit_to.currentTextChanged.connect(self.schedule_conversion)
+        self.doubleSpinBox_value_unit_from.valueChanged.connect(self.schedule_conversion)
         self.pushButton_flip_units.clicked.connect(self.flip_units)
 
 
@@ -150,24 +189,25 @@ class ReplicaXUnitConverterPopup(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        # Set window properties
+        # Set window properties, as a separate window that stays on top (flags are set once,
+        # each change recreates the native window)
         self.setWindowTitle("Unit Converter")
-        self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
+        self.setWindowFlags(QtCore.Qt.Window | 
+                           QtCore.Qt.WindowMaximizeButtonHint | 
+                           QtCore.Qt.WindowCloseButtonHint | 
+                           QtCore.Qt.WindowStaysOnTopHint)
         self.resize(800, 100)
         
-        # Create layout
-        layout = QVBoxLayout(self)
-        
-        # Create and add the UnitConverterWidget to the layout
-        self.converter_widget = ReplicaXUnitConverterManager(self)
-        layout.addWidget(self.converter_widget)
+        # Create layout, the UnitConverterWidget is added when the popup is first shown
+        QVBoxLayout(self)
+        self.converter_widget = None
         
         # Set the window modality to non-modal so user can interact with other windows
         self.setModal(False)
-        
-        # Set window flags to make it a separate window
-        self.setWindowFlags(QtCore.Qt.Window | 
-                           QtCore.Qt.WindowMaximizeButtonHint | 
-                           QtCore.Qt.WindowCloseButtonHint | 
-                           QtCore.Qt.WindowStaysOnTopHint)
-
+    
+    def showEvent(self, event):
+        """Build the converter widget on first show, the popup is created at startup but rarely opened"""
+        if self.converter_widget is None:
+            self.converter_widget = ReplicaXUnitConverterManager(self)
+            self.layout().addWidget(self.converter_widget)
+        super().showEvent(event)
@@ -26,18 +26,33 @@ class DialogHelper:
     
     def __init__(self, parent=None):
         self.parent = parent
+        self._message_boxes = {}  # {icon: QMessageBox}, created on first use
+    
+    def _show_message(self, icon, title, message):
+        """Show a message in the reusable box for its icon"""
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, title, message, QMessageBox.Ok, self.parent)
+            self._message_boxes[icon] = box
+        elif box.isVisible():
+            # Already showing a message, use a separate box for this one
+            box = QMessageBox(icon, title, message, QMessageBox.Ok, self.parent)
+        else:
+            box.setWindowTitle(title)
+            box.setText(message)
+        box.exec()
     
     def show_info(self, title, message):
         """Show information dialog"""
-        QMessageBox.information(self.parent, title, message)
+        self._show_message(QMessageBox.Information, title, message)
     
     def show_warning(self, title, message):
         """Show warning dialog"""
-        QMessageBox.warning(self.parent, title, message)
+        self._show_message(QMessageBox.Warning, title, message)
     
     def show_error(self, title, message):
         """Show error dialog"""
-        QMessageBox.critical(self.parent, title, message)
+        self._show_message(QMessageBox.Critical, title, message)
     
     def show_question(self, title, message, buttons=QMessageBox.Yes | QMessageBox.No):
         """Show question dialog and return the user's choice"""
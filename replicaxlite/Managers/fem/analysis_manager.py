@@ -18,10 +18,94 @@
 # Contact: vachanvanian@outlook.com
 ######################################################################################################
 
+import ast
+
 from PySide6.QtWidgets import QVBoxLayout, QPushButton, QHBoxLayout
 from ...UtilityCode.TableGUI import ReplicaXTable
 
 
+# Dropdown options shared by every analysis manager and parameter template
+_ANALYSIS_TYPES = ('', 'Modal', 'Gravity', 'Static', 'Pushover', 'TimeHistory')
+_SOLVER_OPTS = ('-genBandArpack', '-fullGenLapack')
+_BOOL_OPTS = (True, False)
+_DIR_OPTS = (1, 2, 3)
+
+
+# Cell converters for the parameter schemas: each returns None when the parameter is left out
+def _cell_text(value):
+    """Return the stripped text of a cell value, or None for an empty cell."""
+    return None if value is None else (str(value).strip() or None)
+
+
+def _to_int(value):
+    text = _cell_text(value)
+    return None if text is None else int(float(text))
+
+
+def _to_float(value):
+    text = _cell_text(value)
+    return None if text is None else float(text)
+
+
+def _to_str(value):
+    return _cell_text(value)
+
+
+def _to_bool(value):
+    # Handle boolean conversion properly
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
+def _to_raw(value):
+    return value
+
+
+def _to_list(value):
+    # Handle list conversion for eigenvalues
+    text = _cell_text(value)
+    if text is None:
+        return None
+    try:
+        parsed = ast.literal_eval(text)
+    except:
+        # If that fails, leave the parameter out
+        return None
+    return list(parsed) if isinstance(parsed, (list, tuple)) else [parsed]
+
+
+def _to_list_float(value):
+    # Handle list conversion properly
+    text = _cell_text(value)
+    if text is None:
+        return None
+    try:
+        parsed = ast.literal_eval(text)
+        return parsed if isinstance(parsed, (list, tuple)) else [parsed]
+    except:
+        if isinstance(value, str):
+            # Try splitting by comma
+            try:
+                return [float(x.strip()) for x in text.split(',')]
+            except:
+                pass
+    return None
+
+
+def _to_scale_factor(value):
+    # Handle float conversion for string representations
+    text = _cell_text(value)
+    if text is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return 1.0
+
+
 class ReplicaXFemAnalysisManager:
     """
     Manager for the Analysis table in ReplicaXLite.
@@ -32,6 +116,55 @@ class ReplicaXFemAnalysisManager:
     - Parameters (nested table)
     - Comment (str)
     """
+
+    # (row, col, parameter key, converter) for the Value column of each parameter template
+    PARAM_SCHEMAS = {
+        'Modal': (
+            (0, 1, 'num_modes', _to_int),
+            (1, 1, 'solver', _to_str),
+            (2, 1, 'output_tag', _to_str),
+        ),
+        'Gravity': (
+            (0, 1, 'load_pattern_tag', _to_int),
+            (1, 1, 'steps', _to_int),
+            (2, 1, 'tolerance', _to_float),
+            (3, 1, 'max_iterations', _to_int),
+            (4, 1, 'output_tag', _to_str),
+            (5, 1, 'show_progress', _to_bool),
+        ),
+        'Static': (
+            (0, 1, 'load_pattern_tag', _to_int),
+            (1, 1, 'steps', _to_int),
+            (2, 1, 'output_tag', _to_str),
+            (3, 1, 'show_progress', _to_bool),
+        ),
+        'Pushover': (
+            (0, 1, 'load_pattern_tag', _to_int),
+            (1, 1, 'control_node', _to_int),
+            (2, 1, 'control_dof', _to_int),
+            (3, 1, 'target_protocol', _to_list_float),
+            (4, 1, 'max_step_size', _to_float),
+            (5, 1, 'output_tag', _to_str),
+        ),
+        'TimeHistory': (
+            (0, 1, 'time_history', _to_raw),
+            (1, 1, 'dt', _to_float),
+            (2, 1, 'n_steps', _to_int),
+            (3, 1, 'eigenvalues', _to_list),
+            (4, 1, 'damping_ratio', _to_float),
+            (5, 1, 'odb_tag', _to_str),
+            (6, 1, 'direction', _to_int),
+            (7, 1, 'scale_factor', _to_scale_factor),
+        ),
+    }
+
+    # (row, col, source table) for the nested dropdowns linked to other tables' tags:
+    # the Load Pattern Tag rows link to the load patterns table, Pushover's Control Node to the nodes table
+    _LINK_SPECS = {
+        'Gravity': ((0, 1, 'load_patterns'),),
+        'Static': ((0, 1, 'load_patterns'),),
+        'Pushover': ((0, 1, 'load_patterns'), (1, 1, 'nodes')),
+    }
     
     def __init__(self, analysis_tab_widget, settings, load_patterns_table, nodes_table):
         """
@@ -44,7 +177,15 @@ class ReplicaXFemAnalysisManager:
         self.settings = settings
         self.load_patterns_table = load_patterns_table
         self.nodes_table = nodes_table
+        self._source_tables = {'load_patterns': self.load_patterns_table, 'nodes': self.nodes_table}
         self.store_modal_results = []  # SPECIAL CASE FOR RESET TABLE
+        self._runners = {
+            'Modal': self._run_modal,
+            'Gravity': self._run_gravity,
+            'Static': self._run_static,
+            'Pushover': self._run_pushover,
+            'TimeHistory': self._run_timehistory
+        }
 
         layout = QVBoxLayout(self.analysis_tab_widget)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -67,8 +208,7 @@ class ReplicaXFemAnalysisManager:
         self.analysis_table.set_headers(['ID', 'Analysis Type', 'Parameters', 'Comment'])
 
         # Configure dropdown for Analysis Type column with valid analysis types
-        analysis_types = ['', 'Modal', 'Gravity', 'Static', 'Pushover', 'TimeHistory']
-        self.analysis_table.set_dropdown(1, analysis_types)
+        self.analysis_table.set_dropdown(1, _ANALYSIS_TYPES)
         
         # Setup nested tables for different analysis parameters
         self._setup_nested_tables()
@@ -85,259 +225,264 @@ class ReplicaXFemAnalysisManager:
         empty_table = ReplicaXTable(rows=0, columns=0)
         
         #----------------------------------------------------------------------------------------------------
-        # Modal Analysis Parameters Table
+        # Link dropdown to nested tables - this connects the type selection to parameter tables.
+        # The parameter templates are built the first time their type is selected
+        self.analysis_table.link_dropdown_to_table(
+            dropdown_col=1,     
+            table_col=2,        
+            templates={
+                '': empty_table,
+                'Modal': self._build_modal_params,
+                'Gravity': self._build_gravity_params,
+                'Static': self._build_static_params,
+                'Pushover': self._build_pushover_params,
+                'TimeHistory': self._build_timehistory_params
+            }
+        )
+    
+    def _build_modal_params(self):
+        """Build the Modal analysis parameters template table."""
         modal_params = ReplicaXTable(rows=3, columns=5, settings=self.settings)
-        modal_params.set_column_types(['str', 'str', 'str', 'str', 'str'])
-        modal_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
+        # Populate without repaints or signals, then create the cell widgets once
+        with modal_params.bulk_update():
+            modal_params.set_column_types(['str', 'str', 'str', 'str', 'str'])
+            modal_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
         
-        modal_params.set_cell_dropdown(1,1, ['-genBandArpack', '-fullGenLapack'])
-
-        modal_params.set_row_types(0, ['str', 'int', 'str', 'str', 'str'])
-
-        # Set default values for modal analysis parameters
-        modal_params.set_cell_value(0, 0, 'Num Modes')
-        modal_params.set_cell_value(0, 1, 3)
-        modal_params.set_cell_value(0, 2, 'No')
-        modal_params.set_cell_value(1, 0, 'Solver')
-        # modal_params.set_cell_value(1, 1, '-genBandArpack')
-        modal_params.set_cell_value(1, 2, 'Yes')
-        modal_params.set_cell_value(2, 0, 'Output Tag') 
-        modal_params.set_cell_value(2, 1, 'modal') 
-        modal_params.set_cell_value(2, 2, 'No') 
-        # Initialize table cells
-        modal_params.init_table_cells()
+            modal_params.set_cell_dropdown(1,1, _SOLVER_OPTS)
+
+            modal_params.set_row_types(0, ['str', 'int', 'str', 'str', 'str'])
+
+            # Set default values for modal analysis parameters
+            modal_params.set_cell_values([
+                (0, 0, 'Num Modes'),
+                (0, 1, 3),
+                (0, 2, 'No'),
+                (1, 0, 'Solver'),
+                # (1, 1, '-genBandArpack'),
+                (1, 2, 'Yes'),
+                (2, 0, 'Output Tag'),
+                (2, 1, 'modal'),
+                (2, 2, 'No'),
+            ])
+            # Initialize table cells
+            modal_params.init_table_cells()
         
-        #----------------------------------------------------------------------------------------------------
-        # Gravity Analysis Parameters Table
+        return modal_params
+
+    def _build_gravity_params(self):
+        """Build the Gravity analysis parameters template table."""
         gravity_params = ReplicaXTable(rows=7, columns=5, settings=self.settings)
-        gravity_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
-        gravity_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
+        # Populate without repaints or signals, then create the cell widgets once
+        with gravity_params.bulk_update():
+            gravity_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
+            gravity_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
         
-        gravity_params.set_row_types(2, ['str', 'float', 'str', 'str', 'str'])
-        gravity_params.set_row_types(4, ['str', 'str', 'str', 'str', 'str'])
-        gravity_params.set_row_types(5, ['str', 'bool', 'str', 'str', 'str'])
-        gravity_params.set_row_types(6, ['str', 'dict', 'str', 'str', 'str'])
-
-        gravity_params.set_cell_dropdown(0,1, [])
-        gravity_params.set_cell_dropdown(5,1, [True, False])
-
-        # Set default values for gravity analysis parameters
-        gravity_params.set_cell_value(0, 0, 'Load Pattern Tag')
-        # gravity_params.set_cell_value(0, 1, 1)
-        gravity_params.set_cell_value(0, 2, 'No')
-        gravity_params.set_cell_value(1, 0, 'Steps')  
-        gravity_params.set_cell_value(1, 1, 10)
-        gravity_params.set_cell_value(1, 2, 'Yes')
-        gravity_params.set_cell_value(2, 0, 'Tolerance')  
-        gravity_params.set_cell_value(2, 1, 1e-5)
-        gravity_params.set_cell_value(2, 2, 'Yes')
-        gravity_params.set_cell_value(3, 0, 'Max Iterations')  
-        gravity_params.set_cell_value(3, 1, 25)
-        gravity_params.set_cell_value(3, 2, 'Yes')
-        gravity_params.set_cell_value(4, 0, 'Output Tag')  
-        gravity_params.set_cell_value(4, 1, 'gravity')
-        gravity_params.set_cell_value(4, 2, 'No')
-        gravity_params.set_cell_value(5, 0, 'Show Progress')  
-        # gravity_params.set_cell_value(5, 1, 'True')
-        gravity_params.set_cell_value(5, 2, 'Yes')
-        gravity_params.set_cell_value(6, 0, 'Analysis Params')
-        gravity_params.set_cell_value(6, 2, 'Yes')
-
-        gravity_params.link_dropdown_to_cell(
-            row=0,
-            col=1,
-            source_table=self.load_patterns_table,
-            source_col=0,
-            include_empty=True
-        )
+            gravity_params.set_row_types(2, ['str', 'float', 'str', 'str', 'str'])
+            gravity_params.set_row_types(4, ['str', 'str', 'str', 'str', 'str'])
+            gravity_params.set_row_types(5, ['str', 'bool', 'str', 'str', 'str'])
+            gravity_params.set_row_types(6, ['str', 'dict', 'str', 'str', 'str'])
+
+            gravity_params.set_cell_dropdown(0,1, [])
+            gravity_params.set_cell_dropdown(5,1, _BOOL_OPTS)
+
+            # Set default values for gravity analysis parameters
+            gravity_params.set_cell_values([
+                (0, 0, 'Load Pattern Tag'),
+                # (0, 1, 1),
+                (0, 2, 'No'),
+                (1, 0, 'Steps'),
+                (1, 1, 10),
+                (1, 2, 'Yes'),
+                (2, 0, 'Tolerance'),
+                (2, 1, 1e-5),
+                (2, 2, 'Yes'),
+                (3, 0, 'Max Iterations'),
+                (3, 1, 25),
+                (3, 2, 'Yes'),
+                (4, 0, 'Output Tag'),
+                (4, 1, 'gravity'),
+                (4, 2, 'No'),
+                (5, 0, 'Show Progress'),
+                # (5, 1, 'True'),
+                (5, 2, 'Yes'),
+                (6, 0, 'Analysis Params'),
+                (6, 2, 'Yes'),
+            ])
+
+            self._link_nested_dropdowns('Gravity', gravity_params)
         
-        # Initialize table cells
-        gravity_params.init_table_cells()
+            # Initialize table cells
+            gravity_params.init_table_cells()
         
-        #----------------------------------------------------------------------------------------------------
-        # Static Analysis Parameters Table
+        return gravity_params
+
+    def _build_static_params(self):
+        """Build the Static analysis parameters template table."""
         static_params = ReplicaXTable(rows=5, columns=5, settings=self.settings)
-        static_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
-        static_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
+        # Populate without repaints or signals, then create the cell widgets once
+        with static_params.bulk_update():
+            static_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
+            static_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
         
-        static_params.set_row_types(2, ['str', 'str', 'str', 'str', 'str'])
-        static_params.set_row_types(3, ['str', 'bool', 'str', 'str', 'str'])
-        static_params.set_row_types(4, ['str', 'dict', 'str', 'str', 'str'])
-
-        static_params.set_cell_dropdown(0,1, [])
-        static_params.set_cell_dropdown(3,1, [True, False])
-
-        # Set default values for static analysis parameters
-        static_params.set_cell_value(0, 0, 'Load Pattern Tag')
-        # static_params.set_cell_value(0, 1, 2)
-        static_params.set_cell_value(0, 2, 'No')
-        static_params.set_cell_value(1, 0, 'Steps')  
-        static_params.set_cell_value(1, 1, 10)
-        static_params.set_cell_value(1, 2, 'Yes')
-        static_params.set_cell_value(2, 0, 'Output Tag')  
-        static_params.set_cell_value(2, 1, 'static')
-        static_params.set_cell_value(2, 2, 'No')
-        static_params.set_cell_value(3, 0, 'Show Progress')  
-        # static_params.set_cell_value(3, 1, 'True')
-        static_params.set_cell_value(3, 2, 'Yes')
-        static_params.set_cell_value(4, 0, 'Analysis Params')
-        static_params.set_cell_value(4, 2, 'Yes')
+            static_params.set_row_types(2, ['str', 'str', 'str', 'str', 'str'])
+            static_params.set_row_types(3, ['str', 'bool', 'str', 'str', 'str'])
+            static_params.set_row_types(4, ['str', 'dict', 'str', 'str', 'str'])
+
+            static_params.set_cell_dropdown(0,1, [])
+            static_params.set_cell_dropdown(3,1, _BOOL_OPTS)
+
+            # Set default values for static analysis parameters
+            static_params.set_cell_values([
+                (0, 0, 'Load Pattern Tag'),
+                # (0, 1, 2),
+                (0, 2, 'No'),
+                (1, 0, 'Steps'),
+                (1, 1, 10),
+                (1, 2, 'Yes'),
+                (2, 0, 'Output Tag'),
+                (2, 1, 'static'),
+                (2, 2, 'No'),
+                (3, 0, 'Show Progress'),
+                # (3, 1, 'True'),
+                (3, 2, 'Yes'),
+                (4, 0, 'Analysis Params'),
+                (4, 2, 'Yes'),
+            ])
         
-        static_params.link_dropdown_to_cell(
-            row=0,
-            col=1,
-            source_table=self.load_patterns_table,
-            source_col=0,
-            include_empty=True
-        )
+            self._link_nested_dropdowns('Static', static_params)
 
-        # Initialize table cells
-        static_params.init_table_cells()
+            # Initialize table cells
+            static_params.init_table_cells()
         
-        #----------------------------------------------------------------------------------------------------
-        # Pushover Analysis Parameters Table
+        return static_params
+
+    def _build_pushover_params(self):
+        """Build the Pushover analysis parameters template table."""
         pushover_params = ReplicaXTable(rows=8, columns=5, settings=self.settings)
-        pushover_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
-        pushover_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
+        # Populate without repaints or signals, then create the cell widgets once
+        with pushover_params.bulk_update():
+            pushover_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
+            pushover_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
         
-        pushover_params.set_row_types(3, ['str', 'list(float)', 'str', 'str', 'str'])
-        pushover_params.set_row_types(4, ['str', 'float', 'str', 'str', 'str'])
-        pushover_params.set_row_types(5, ['str', 'str', 'str', 'str', 'str'])
-        pushover_params.set_row_types(6, ['str', 'dict', 'str', 'str', 'str'])
-        pushover_params.set_row_types(7, ['str', 'dict', 'str', 'str', 'str'])
-
-        pushover_params.set_cell_dropdown(0,1, [])
-        pushover_params.set_cell_dropdown(1,1, [])
-        pushover_params.set_cell_dropdown(2,1, [1,2,3])
-
-        # Set default values for pushover analysis parameters
-        pushover_params.set_cell_value(0, 0, 'Load Pattern Tag')
-        # pushover_params.set_cell_value(0, 1, 3)
-        pushover_params.set_cell_value(0, 2, 'No')
-        pushover_params.set_cell_value(1, 0, 'Control Node')  
-        # pushover_params.set_cell_value(1, 1, 1)
-        pushover_params.set_cell_value(1, 2, 'No')
-        pushover_params.set_cell_value(2, 0, 'Control DOF')  
-        # pushover_params.set_cell_value(2, 1, 1)
-        pushover_params.set_cell_value(2, 2, 'No')
-        pushover_params.set_cell_value(3, 0, 'Target Protocol')  
-        # pushover_params.set_cell_value(3, 1, [0.0, 0.5, 1.0])
-        pushover_params.set_cell_value(3, 2, 'No')
-        pushover_params.set_cell_value(4, 0, 'Max Step Size')  
-        # pushover_params.set_cell_value(4, 1, 0.1)
-        pushover_params.set_cell_value(4, 2, 'No')
-        pushover_params.set_cell_value(5, 0, 'Output Tag')  
-        pushover_params.set_cell_value(5, 1, 'pushover')
-        pushover_params.set_cell_value(5, 2, 'No')
-        pushover_params.set_cell_value(6, 0, 'Analysis Params')  
-        pushover_params.set_cell_value(6, 2, 'Yes')
-        pushover_params.set_cell_value(7, 0, 'Smart Analysis Params')  
-        pushover_params.set_cell_value(7, 2, 'Yes')
+            pushover_params.set_row_types(3, ['str', 'list(float)', 'str', 'str', 'str'])
+            pushover_params.set_row_types(4, ['str', 'float', 'str', 'str', 'str'])
+            pushover_params.set_row_types(5, ['str', 'str', 'str', 'str', 'str'])
+            pushover_params.set_row_types(6, ['str', 'dict', 'str', 'str', 'str'])
+            pushover_params.set_row_types(7, ['str', 'dict', 'str', 'str', 'str'])
+
+            pushover_params.set_cell_dropdown(0,1, [])
+            pushover_params.set_cell_dropdown(1,1, [])
+            pushover_params.set_cell_dropdown(2,1, _DIR_OPTS)
+
+            # Set default values for pushover analysis parameters
+            pushover_params.set_cell_values([
+                (0, 0, 'Load Pattern Tag'),
+                # (0, 1, 3),
+                (0, 2, 'No'),
+                (1, 0, 'Control Node'),
+                # (1, 1, 1),
+                (1, 2, 'No'),
+                (2, 0, 'Control DOF'),
+                # (2, 1, 1),
+                (2, 2, 'No'),
+                (3, 0, 'Target Protocol'),
+                # (3, 1, [0.0, 0.5, 1.0]),
+                (3, 2, 'No'),
+                (4, 0, 'Max Step Size'),
+                # (4, 1, 0.1),
+                (4, 2, 'No'),
+                (5, 0, 'Output Tag'),
+                (5, 1, 'pushover'),
+                (5, 2, 'No'),
+                (6, 0, 'Analysis Params'),
+                (6, 2, 'Yes'),
+                (7, 0, 'Smart Analysis Params'),
+                (7, 2, 'Yes'),
+            ])
         
-        pushover_params.link_dropdown_to_cell(
-            row=0,
-            col=1,
-            source_table=self.load_patterns_table,
-            source_col=0,
-            include_empty=True
-        )
+            self._link_nested_dropdowns('Pushover', pushover_params)
 
-        pushover_params.link_dropdown_to_cell(
-            row=1,
-            col=1,
-            source_table=self.nodes_table,
-            source_col=0,
-            include_empty=True
-        )
-
-        # Initialize table cells
-        pushover_params.init_table_cells()
+            # Initialize table cells
+            pushover_params.init_table_cells()
         
-        #----------------------------------------------------------------------------------------------------
-        # Time History Analysis Parameters Table
+        return pushover_params
+
+    def _build_timehistory_params(self):
+        """Build the Time History analysis parameters template table."""
         timehistory_params = ReplicaXTable(rows=11, columns=5, settings=self.settings)
-        timehistory_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
-        timehistory_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
-
-        timehistory_params.set_row_types(0, ['str', 'dict', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(1, ['str', 'float', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(2, ['str', 'int', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(3, ['str', 'list(float)', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(4, ['str', 'float', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(5, ['str', 'str', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(6, ['str', 'int', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(7, ['str', 'float', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(8, ['str', 'dict', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(9, ['str', 'str', 'str', 'str', 'str'])
-        timehistory_params.set_row_types(10, ['str', 'dict', 'str', 'str', 'str'])
-        # timehistory_params.set_row_types(11, ['str', 'list(int)', 'str', 'str', 'str'])
-
-        timehistory_params.set_cell_dropdown(6,1, [1,2,3])
-
-        # Set default values for time history analysis parameters
-        timehistory_params.set_cell_value(0, 0, 'time_history')
-        # timehistory_params.set_cell_value(0, 1, 'accel')  # Default to acceleration input
-        timehistory_params.set_cell_value(0, 2, 'No')
-        timehistory_params.set_cell_value(1, 0, 'dt')  
-        # timehistory_params.set_cell_value(1, 1, 0.02)
-        timehistory_params.set_cell_value(1, 2, 'No')
-        timehistory_params.set_cell_value(2, 0, 'n_steps')  
-        # timehistory_params.set_cell_value(2, 1, 100)
-        timehistory_params.set_cell_value(2, 2, 'No')
-        timehistory_params.set_cell_value(3, 0, 'eigenvalues')  
-        # timehistory_params.set_cell_value(3, 1, [])
-        timehistory_params.set_cell_value(3, 2, 'No')
-        timehistory_params.set_cell_value(4, 0, 'damping_ratio')  
-        timehistory_params.set_cell_value(4, 1, 0.05)
-        timehistory_params.set_cell_value(4, 2, 'Yes')
-        timehistory_params.set_cell_value(5, 0, 'odb_tag')  
-        timehistory_params.set_cell_value(5, 1, 'timehistory')
-        timehistory_params.set_cell_value(5, 2, 'No')
-        timehistory_params.set_cell_value(6, 0, 'direction')  
-        # timehistory_params.set_cell_value(6, 1, 1)
-        timehistory_params.set_cell_value(6, 2, 'Yes')
-        timehistory_params.set_cell_value(7, 0, 'scale_factor')  
-        timehistory_params.set_cell_value(7, 1, '1.0')
-        timehistory_params.set_cell_value(7, 2, 'Yes')
-        timehistory_params.set_cell_value(8, 0, 'analysis_params')  
-        # timehistory_params.set_cell_value(8, 1, '')
-        timehistory_params.set_cell_value(8, 2, 'Yes')
-        timehistory_params.set_cell_value(9, 0, 'pattern_type')  
-        timehistory_params.set_cell_value(9, 1, 'UniformExcitation')
-        timehistory_params.set_cell_value(9, 2, 'Yes')
-        timehistory_params.set_cell_value(10, 0, 'smart_analyze_params')  
-        # timehistory_params.set_cell_value(10, 1, '')
-        timehistory_params.set_cell_value(10, 2, 'Yes')
-        # timehistory_params.set_cell_value(11, 0, 'support_nodes')  
-        # timehistory_params.set_cell_value(11, 1, '')
-        # timehistory_params.set_cell_value(11, 2, 'Yes')
-
-        # timehistory_dict = ReplicaXTable(rows=0, columns=4, settings=self.settings)
-        # timehistory_dict.set_column_types(['float', 'float', 'float', 'float'])
-        # timehistory_dict.set_headers(['time', 'accel', 'vel', 'disp'])
-
-        # timehistory_dict.set_column_unit(0,'Time')
-        # timehistory_dict.set_column_unit(0,'Acceleration')
-        # timehistory_dict.set_column_unit(0,'Velocity')
-        # timehistory_dict.set_column_unit(0,'Displacement')
-
-        # Initialize table cells
-        timehistory_params.init_table_cells()
+        # Populate without repaints or signals, then create the cell widgets once
+        with timehistory_params.bulk_update():
+            timehistory_params.set_column_types(['str', 'int', 'str', 'str', 'str'])
+            timehistory_params.set_headers(['Property', 'Value', 'Optional', 'Group', 'Comment'])
+
+            timehistory_params.set_row_types(0, ['str', 'dict', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(1, ['str', 'float', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(2, ['str', 'int', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(3, ['str', 'list(float)', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(4, ['str', 'float', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(5, ['str', 'str', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(6, ['str', 'int', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(7, ['str', 'float', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(8, ['str', 'dict', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(9, ['str', 'str', 'str', 'str', 'str'])
+            timehistory_params.set_row_types(10, ['str', 'dict', 'str', 'str', 'str'])
+            # timehistory_params.set_row_types(11, ['str', 'list(int)', 'str', 'str', 'str'])
+
+            timehistory_params.set_cell_dropdown(6,1, _DIR_OPTS)
+
+            # Set default values for time history analysis parameters
+            timehistory_params.set_cell_values([
+                (0, 0, 'time_history'),
+                # (0, 1, 'accel'),  # Default to acceleration input
+                (0, 2, 'No'),
+                (1, 0, 'dt'),
+                # (1, 1, 0.02),
+                (1, 2, 'No'),
+                (2, 0, 'n_steps'),
+                # (2, 1, 100),
+                (2, 2, 'No'),
+                (3, 0, 'eigenvalues'),
+                # (3, 1, []),
+                (3, 2, 'No'),
+                (4, 0, 'damping_ratio'),
+                (4, 1, 0.05),
+                (4, 2, 'Yes'),
+                (5, 0, 'odb_tag'),
+                (5, 1, 'timehistory'),
+                (5, 2, 'No'),
+                (6, 0, 'direction'),
+                # (6, 1, 1),
+                (6, 2, 'Yes'),
+                (7, 0, 'scale_factor'),
+                (7, 1, '1.0'),
+                (7, 2, 'Yes'),
+                (8, 0, 'analysis_params'),
+                # (8, 1, ''),
+                (8, 2, 'Yes'),
+                (9, 0, 'pattern_type'),
+                (9, 1, 'UniformExcitation'),
+                (9, 2, 'Yes'),
+                (10, 0, 'smart_analyze_params'),
+                # (10, 1, ''),
+                (10, 2, 'Yes'),
+                # (11, 0, 'support_nodes'),
+                # (11, 1, ''),
+                # (11, 2, 'Yes'),
+            ])
+
+            # timehistory_dict = ReplicaXTable(rows=0, columns=4, settings=self.settings)
+            # timehistory_dict.set_column_types(['float', 'float', 'float', 'float'])
+            # timehistory_dict.set_headers(['time', 'accel', 'vel', 'disp'])
+
+            # timehistory_dict.set_column_unit(0,'Time')
+            # timehistory_dict.set_column_unit(0,'Acceleration')
+            # timehistory_dict.set_column_unit(0,'Velocity')
+            # timehistory_dict.set_column_unit(0,'Displacement')
+
+            # Initialize table cells
+            timehistory_params.init_table_cells()
         
-        #----------------------------------------------------------------------------------------------------
-        # Link dropdown to nested tables - this connects the type selection to parameter tables
-        self.analysis_table.link_dropdown_to_table(
-            dropdown_col=1,     
-            table_col=2,        
-            templates={
-                '': empty_table,
-                'Modal': modal_params,
-                'Gravity': gravity_params,
-                'Static': static_params,
-                'Pushover': pushover_params,
-                'TimeHistory': timehistory_params
-            }
-        )
+        return timehistory_params
 
     def refresh_dropdown_nested_table_links_after_load(self):
         """Re-establish dropdown links after table load."""
@@ -353,47 +498,18 @@ class ReplicaXFemAnalysisManager:
                 continue
 
             # Re-establish dropdown links based on analysis type
-            if analysis_type == 'Gravity':
-                # Gravity analysis - link Load Pattern Tag dropdown to load patterns table
-                nested_table.link_dropdown_to_cell(
-                    row=0,
-                    col=1,
-                    source_table=self.load_patterns_table,
-                    source_col=0,
-                    include_empty=True
-                )
-                
-            elif analysis_type == 'Static':
-                # Static analysis - link Load Pattern Tag dropdown to load patterns table  
-                nested_table.link_dropdown_to_cell(
-                    row=0,
-                    col=1,
-                    source_table=self.load_patterns_table,
-                    source_col=0,
-                    include_empty=True
-                )
-                
-            elif analysis_type == 'Pushover':
-                # Pushover analysis - link Load Pattern Tag dropdown to load patterns table
-                nested_table.link_dropdown_to_cell(
-                    row=0,
-                    col=1,
-                    source_table=self.load_patterns_table,
-                    source_col=0,
-                    include_empty=True
-                )
-                
-                # Pushover analysis - link Control Node dropdown to nodes table
-                nested_table.link_dropdown_to_cell(
-                    row=1,
-                    col=1,
-                    source_table=self.nodes_table,
-                    source_col=0,
-                    include_empty=True
-                )
-
-
-
+            self._link_nested_dropdowns(analysis_type, nested_table)
+
+    def _link_nested_dropdowns(self, analysis_type, nested_table):
+        """Link the nested table's dropdowns to their source tables for the given analysis type."""
+        for row, col, source in self._LINK_SPECS.get(analysis_type, ()):
+            nested_table.link_dropdown_to_cell(
+                row=row,
+                col=col,
+                source_table=self._source_tables[source],
+                source_col=0,
+                include_empty=True
+            )
 
     def create_fem_table_code(self, model):
         """
@@ -445,56 +561,14 @@ class ReplicaXFemAnalysisManager:
                 return False
                 
             # Run the actual analysis method in model.analysis
-            if analysis_type == 'Modal':
-                result = model.analysis.run_modal_analysis(
-                    num_modes=params.get('num_modes', 3),
-                    odb_tag=params.get('output_tag', 'modal'),
-                    solver=params.get('solver', '-genBandArpack')
-                )
-                self.store_modal_results.append(result)
-                
-            elif analysis_type == 'Gravity':
-                result = model.analysis.run_gravity_analysis(
-                    load_pattern_tag=params['load_pattern_tag'],
-                    n_steps=params.get('steps', 10),
-                    tol=params.get('tolerance', 1e-5),
-                    max_iter=params.get('max_iterations', 25),
-                    output_odb_tag=params.get('output_tag', 'gravity'),
-                    show_progress=params.get('show_progress', True)
-                )
-                
-            elif analysis_type == 'Static':
-                result = model.analysis.run_static_analysis(
-                    load_pattern_tag=params['load_pattern_tag'],
-                    n_steps=params.get('steps', 10),
-                    output_odb_tag=params.get('output_tag', 'static'),
-                    show_progress=params.get('show_progress', True)
-                )
-                
-            elif analysis_type == 'Pushover':
-                result = model.analysis.run_pushover_analysis(
-                    load_pattern_tag=params['load_pattern_tag'],
-                    control_node=params['control_node'],
-                    control_dof=params['control_dof'],
-                    target_protocol=params['target_protocol'],
-                    max_step=params['max_step_size'],
-                    output_odb_tag=params.get('output_tag', 'pushover')
-                )
-                
-            elif analysis_type == 'TimeHistory':
-                result = model.analysis.run_time_history_analysis(
-                    time_history=params['time_history'],
-                    dt=params['dt'],
-                    n_steps=params['n_steps'],
-                    eigenvalues=params.get('eigenvalues'),
-                    damping_ratio=params.get('damping_ratio', 0.05),
-                    odb_tag=params.get('odb_tag', 'timehistory'),
-                    direction=params.get('direction', 1),
-                    scale_factor=params.get('scale_factor', 1.0)
-                )
-            else:
+            runner = self._runners.get(analysis_type)
+            if runner is None:
                 print(f"Warning: Unknown analysis type '{analysis_type}' for row {row_index}")
                 return False
+
+            result = runner(model, params)
+            if analysis_type == 'Modal':
+                self.store_modal_results.append(result)
                 
             return True
             
@@ -502,6 +576,58 @@ class ReplicaXFemAnalysisManager:
             print(f"Error running analysis from row {row_index}: {e}")
             return False
 
+    def _run_modal(self, model, params):
+        """Run a modal analysis with the extracted parameters."""
+        return model.analysis.run_modal_analysis(
+            num_modes=params.get('num_modes', 3),
+            odb_tag=params.get('output_tag', 'modal'),
+            solver=params.get('solver', '-genBandArpack')
+        )
+
+    def _run_gravity(self, model, params):
+        """Run a gravity analysis with the extracted parameters."""
+        return model.analysis.run_gravity_analysis(
+            load_pattern_tag=params['load_pattern_tag'],
+            n_steps=params.get('steps', 10),
+            tol=params.get('tolerance', 1e-5),
+            max_iter=params.get('max_iterations', 25),
+            output_odb_tag=params.get('output_tag', 'gravity'),
+            show_progress=params.get('show_progress', True)
+        )
+
+    def _run_static(self, model, params):
+        """Run a static analysis with the extracted parameters."""
+        return model.analysis.run_static_analysis(
+            load_pattern_tag=params['load_pattern_tag'],
+            n_steps=params.get('steps', 10),
+            output_odb_tag=params.get('output_tag', 'static'),
+            show_progress=params.get('show_progress', True)
+        )
+
+    def _run_pushover(self, model, params):
+        """Run a pushover analysis with the extracted parameters."""
+        return model.analysis.run_pushover_analysis(
+            load_pattern_tag=params['load_pattern_tag'],
+            control_node=params['control_node'],
+            control_dof=params['control_dof'],
+            target_protocol=params['target_protocol'],
+            max_step=params['max_step_size'],
+            output_odb_tag=params.get('output_tag', 'pushover')
+        )
+
+    def _run_timehistory(self, model, params):
+        """Run a time history analysis with the extracted parameters."""
+        return model.analysis.run_time_history_analysis(
+            time_history=params['time_history'],
+            dt=params['dt'],
+            n_steps=params['n_steps'],
+            eigenvalues=params.get('eigenvalues'),
+            damping_ratio=params.get('damping_ratio', 0.05),
+            odb_tag=params.get('odb_tag', 'timehistory'),
+            direction=params.get('direction', 1),
+            scale_factor=params.get('scale_factor', 1.0)
+        )
+
     def _extract_parameters_from_nested_table(self, analysis_type, nested_table):
         """
         Extract parameters from nested table based on analysis type.
@@ -515,168 +641,23 @@ class ReplicaXFemAnalysisManager:
         """
         params = {}
         
-        # Handle different analysis types by extracting their specific parameters
+        # Handle different analysis types by walking their parameter schema
         
         if not isinstance(nested_table, ReplicaXTable):
             return params
 
         try:
-            if analysis_type == 'Modal':
-                # Extract Modal Analysis Parameters
-                num_modes = nested_table.get_cell_value(0, 1)
-                if num_modes is not None and str(num_modes).strip():
-                    params['num_modes'] = int(float(str(num_modes).strip()))
-                    
-                solver = nested_table.get_cell_value(1, 1)
-                if solver is not None and str(solver).strip():
-                    params['solver'] = str(solver).strip()
-                    
-                output_tag = nested_table.get_cell_value(2, 1)
-                if output_tag is not None and str(output_tag).strip():
-                    params['output_tag'] = str(output_tag).strip()
-
-            elif analysis_type == 'Gravity':
-                # Extract Gravity Analysis Parameters
-                load_pattern_tag = nested_table.get_cell_value(0, 1)
-                if load_pattern_tag is not None and str(load_pattern_tag).strip():
-                    params['load_pattern_tag'] = int(float(str(load_pattern_tag).strip()))
-                    
-                steps = nested_table.get_cell_value(1, 1)
-                if steps is not None and str(steps).strip():
-                    params['steps'] = int(float(str(steps).strip()))
-                    
-                tolerance = nested_table.get_cell_value(2, 1)
-                if tolerance is not None and str(tolerance).strip():
-                    params['tolerance'] = float(str(tolerance).strip())
-                    
-                max_iterations = nested_table.get_cell_value(3, 1)
-                if max_iterations is not None and str(max_iterations).strip():
-                    params['max_iterations'] = int(float(str(max_iterations).strip()))
-                    
-                output_tag = nested_table.get_cell_value(4, 1)
-                if output_tag is not None and str(output_tag).strip():
-                    params['output_tag'] = str(output_tag).strip()
-                    
-                show_progress = nested_table.get_cell_value(5, 1)
-                if show_progress is not None:
-                    # Handle boolean conversion properly
-                    if isinstance(show_progress, bool):
-                        params['show_progress'] = show_progress
-                    elif isinstance(show_progress, str):
-                        params['show_progress'] = show_progress.lower() in ('true', '1', 'yes')
-                    else:
-                        params['show_progress'] = bool(show_progress)
-
-            elif analysis_type == 'Static':
-                # Extract Static Analysis Parameters
-                load_pattern_tag = nested_table.get_cell_value(0, 1)
-                if load_pattern_tag is not None and str(load_pattern_tag).strip():
-                    params['load_pattern_tag'] = int(float(str(load_pattern_tag).strip()))
-                    
-                steps = nested_table.get_cell_value(1, 1)
-                if steps is not None and str(steps).strip():
-                    params['steps'] = int(float(str(steps).strip()))
-                    
-                output_tag = nested_table.get_cell_value(2, 1)
-                if output_tag is not None and str(output_tag).strip():
-                    params['output_tag'] = str(output_tag).strip()
-                    
-                show_progress = nested_table.get_cell_value(3, 1)
-                if show_progress is not None:
-                    # Handle boolean conversion properly
-                    if isinstance(show_progress, bool):
-                        params['show_progress'] = show_progress
-                    elif isinstance(show_progress, str):
-                        params['show_progress'] = show_progress.lower() in ('true', '1', 'yes')
-                    else:
-                        params['show_progress'] = bool(show_progress)
-
-            elif analysis_type == 'Pushover':
-                # Extract Pushover Analysis Parameters
-                load_pattern_tag = nested_table.get_cell_value(0, 1)
-                if load_pattern_tag is not None and str(load_pattern_tag).strip():
-                    params['load_pattern_tag'] = int(float(str(load_pattern_tag).strip()))
-                    
-                control_node = nested_table.get_cell_value(1, 1)
-                if control_node is not None and str(control_node).strip():
-                    params['control_node'] = int(float(str(control_node).strip()))
-                    
-                control_dof = nested_table.get_cell_value(2, 1)
-                if control_dof is not None and str(control_dof).strip():
-                    params['control_dof'] = int(float(str(control_dof).strip()))
-                    
-                target_protocol = nested_table.get_cell_value(3, 1)
-                if target_protocol is not None:
-                    # Handle list conversion properly
-                    try:
-                        import ast
-                        parsed_target = ast.literal_eval(str(target_protocol).strip())
-                        params['target_protocol'] = parsed_target if isinstance(parsed_target, (list, tuple)) else [parsed_target]
-                    except:
-                        if isinstance(target_protocol, str) and len(str(target_protocol).strip()) > 0:
-                            # Try splitting by comma
-                            try:
-                                params['target_protocol'] = [float(x.strip()) for x in str(target_protocol).split(',')]
-                            except:
-                                pass  # Keep original or handle appropriately
-                        
-                max_step_size = nested_table.get_cell_value(4, 1)
-                if max_step_size is not None and str(max_step_size).strip():
-                    params['max_step_size'] = float(str(max_step_size).strip())
-                    
-                output_tag = nested_table.get_cell_value(5, 1)
-                if output_tag is not None and str(output_tag).strip():
-                    params['output_tag'] = str(output_tag).strip()
-
-            elif analysis_type == 'TimeHistory':
-                # Extract Time History Analysis Parameters
-                time_history_data = nested_table.get_cell_value(0, 1)
-                if time_history_data is not None:
-                    params['time_history'] = time_history_data
-                    
-                dt = nested_table.get_cell_value(1, 1)
-                if dt is not None and str(dt).strip():
-                    params['dt'] = float(str(dt).strip())
-                    
-                n_steps = nested_table.get_cell_value(2, 1)
-                if n_steps is not None and str(n_steps).strip():
-                    params['n_steps'] = int(float(str(n_steps).strip()))
-                    
-                eigenvalues = nested_table.get_cell_value(3, 1)
-                if eigenvalues is not None:
-                    # Handle list conversion for eigenvalues
-                    try:
-                        import ast
-                        parsed_eigenvals = ast.literal_eval(str(eigenvalues).strip())
-                        params['eigenvalues'] = list(parsed_eigenvals) if isinstance(parsed_eigenvals, (list, tuple)) else [parsed_eigenvals]
-                    except:
-                        # If that fails, keep as original or handle appropriately
-                        pass
-                else:# SPECIAL CASE FOR SEQUENTIAL ANALYSIS
+            for row, col, key, convert in self.PARAM_SCHEMAS.get(analysis_type, ()):
+                value = nested_table.get_cell_value(row, col)
+                if value is None and key == 'eigenvalues':# SPECIAL CASE FOR SEQUENTIAL ANALYSIS
                     if self.store_modal_results:
-                        params['eigenvalues'] = self.store_modal_results[-1]['eigen_values']
-                    else:
-                        raise ValueError("Run Model analysis first OR provide eigan values manually!")
-                        
-                damping_ratio = nested_table.get_cell_value(4, 1)
-                if damping_ratio is not None and str(damping_ratio).strip():
-                    params['damping_ratio'] = float(str(damping_ratio).strip())
-                    
-                odb_tag = nested_table.get_cell_value(5, 1)
-                if odb_tag is not None and str(odb_tag).strip():
-                    params['odb_tag'] = str(odb_tag).strip()
-                    
-                direction = nested_table.get_cell_value(6, 1)
-                if direction is not None and str(direction).strip():
-                    params['direction'] = int(float(str(direction).strip()))
-                    
-                scale_factor = nested_table.get_cell_value(7, 1)
-                if scale_factor is not None and str(scale_factor).strip():
-                    # Handle float conversion for string representations
-                    try:
-                        params['scale_factor'] = float(str(scale_factor).strip())
-                    except ValueError:
-                        params['scale_factor'] = 1.0
+                        params[key] = self.store_modal_results[-1]['eigen_values']
+                        continue
+                    raise ValueError("Run Model analysis first OR provide eigan values manually!")
+
+                value = convert(value)
+                if value is not None:
+                    params[key] = value
                         
             return params
             
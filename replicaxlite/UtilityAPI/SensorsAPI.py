@@ -100,6 +100,8 @@ class ReplicaXSensorDataReader:
         """Initialize with an optional configuration dictionary"""
         # Initialize empty configuration
         self.config = config or {}
+        # Incremented whenever this class replaces or edits the configuration
+        self.config_version = 0
         self.processed_data = {}
         self.time_array = None
         
@@ -119,6 +121,7 @@ class ReplicaXSensorDataReader:
         try:
             with open(json_file_path, 'r') as json_file:
                 self.config = json.load(json_file)
+            self.config_version += 1
             self.log_info(f"Configuration loaded from {json_file_path}")
             
             if self._validate_config():
@@ -133,6 +136,7 @@ class ReplicaXSensorDataReader:
         """Load configuration from a dictionary"""
         try:
             self.config = config_dict.copy()
+            self.config_version += 1
             self.log_info("Configuration loaded from dictionary")
             
             if self._validate_config():
@@ -161,6 +165,7 @@ class ReplicaXSensorDataReader:
     def update_config(self, new_config):
         """Update the configuration with new values"""
         self.config.update(new_config)
+        self.config_version += 1
         self.log_info("Configuration updated")
         
         # Clear processed data
@@ -859,6 +864,7 @@ class ReplicaXSensorDataReader:
                     
                     # Update dt in config to match resampling
                     self.config["dt"] = 1.0 / target_fs
+                    self.config_version += 1
             
             # 3. SHIFT_TIME - Apply time shift early
             if "data_correction" in self.config and "shift_time" in self.config["data_correction"]:
@@ -978,7 +984,43 @@ class ReplicaXSensorDataReader:
             }
         return summary
     
-    def export_to_csv(self, file_path, precision=14, export_config=True):
+    def _write_sensors_csv(self, file_path, sensor_names, precision, chunk_rows=10000, progress_callback=None,
+                           write_buffer_size=1 << 20):
+        """
+        Write the time column and the given sensors' processed data to a CSV file.
+        Rows are formatted by np.savetxt and written in chunks of chunk_rows, so only one
+        chunk of formatted text is held in memory at a time.
+        
+        Args:
+            file_path: Path to the output CSV file
+            sensor_names: Names of the sensors to write, in column order
+            precision: Number of decimal places to use for numeric values
+            chunk_rows: Number of rows formatted and written per chunk
+            progress_callback: Optional callable receiving (rows_written, total_rows) after each chunk
+            write_buffer_size: Size in bytes of the output file buffer
+        """
+        columns = [np.asarray(self.time_array)] + [np.asarray(self.processed_data[name]["y"])
+                                                   for name in sensor_names]
+        total_rows = len(self.time_array)
+        separator = self.config["seperator"]
+        
+        with open(file_path, 'w', newline='', buffering=write_buffer_size) as csvfile:
+            writer = csv.writer(csvfile, delimiter=separator)
+            
+            # Write header row
+            writer.writerow(["Time"] + list(sensor_names))
+            
+            # Write data rows chunk by chunk, with the csv module's line terminator
+            for start in range(0, total_rows, chunk_rows):
+                stop = min(start + chunk_rows, total_rows)
+                chunk = np.column_stack([column[start:stop] for column in columns])
+                np.savetxt(csvfile, chunk, fmt=f"%.{precision}f",
+                           delimiter=separator, newline=writer.dialect.lineterminator)
+                if progress_callback is not None:
+                    progress_callback(stop, total_rows)
+
+    def export_to_csv(self, file_path, precision=14, export_config=True, chunk_rows=10000, progress_callback=None,
+                      write_buffer_size=1 << 20):
         """
         Export processed data to a new CSV file
         
@@ -986,28 +1028,17 @@ class ReplicaXSensorDataReader:
             file_path: Path to the output CSV file
             precision: Number of decimal places to use for numeric values
             export_config: Whether to export the configuration to a JSON file
+            chunk_rows: Number of rows formatted and written per chunk
+            progress_callback: Optional callable receiving (rows_written, total_rows) after each chunk
+            write_buffer_size: Size in bytes of the output file buffer
         """
         if not self.processed_data or self.time_array is None:
             self.log_error("No processed data available to export")
             return False
         
         try:
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile, delimiter=self.config["seperator"])
-                
-                # Write header row
-                header = ["Time"]
-                for sensor_name in self.processed_data.keys():
-                    header.append(sensor_name)
-                writer.writerow(header)
-                
-                # Write data rows
-                format_str = f"{{:.{precision}f}}"
-                for i in range(len(self.time_array)):
-                    row = [format_str.format(self.time_array[i])]
-                    for sensor_name in self.processed_data.keys():
-                        row.append(format_str.format(self.processed_data[sensor_name]["y"][i]))
-                    writer.writerow(row)
+            self._write_sensors_csv(file_path, list(self.processed_data.keys()), precision,
+                                    chunk_rows, progress_callback, write_buffer_size)
                     
             self.log_info(f"Exported processed data to {file_path}")
             
@@ -1063,7 +1094,8 @@ class ReplicaXSensorDataReader:
             self.log_error(f"Error exporting data to CSV: {e}")
             return False
 
-    def export_selected_sensors_to_csv(self, file_path, sensor_names=None, precision=14, export_config=True):
+    def export_selected_sensors_to_csv(self, file_path, sensor_names=None, precision=14, export_config=True,
+                                       chunk_rows=10000, progress_callback=None, write_buffer_size=1 << 20):
         """
         Export selected sensors' processed data to a new CSV file
         
@@ -1072,6 +1104,9 @@ class ReplicaXSensorDataReader:
             sensor_names: List of sensor names to export, or None for all sensors
             precision: Number of decimal places to use for numeric values
             export_config: Whether to export the configuration to a JSON file
+            chunk_rows: Number of rows formatted and written per chunk
+            progress_callback: Optional callable receiving (rows_written, total_rows) after each chunk
+            write_buffer_size: Size in bytes of the output file buffer
         """
         if not self.processed_data or self.time_array is None:
             self.log_error("No processed data available to export")
@@ -1088,22 +1123,8 @@ class ReplicaXSensorDataReader:
                     return False
         
         try:
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile, delimiter=self.config["seperator"])
-                
-                # Write header row
-                header = ["Time"]
-                for sensor_name in sensor_names:
-                    header.append(sensor_name)
-                writer.writerow(header)
-                
-                # Write data rows
-                format_str = f"{{:.{precision}f}}"
-                for i in range(len(self.time_array)):
-                    row = [format_str.format(self.time_array[i])]
-                    for sensor_name in sensor_names:
-                        row.append(format_str.format(self.processed_data[sensor_name]["y"][i]))
-                    writer.writerow(row)
+            self._write_sensors_csv(file_path, sensor_names, precision, chunk_rows, progress_callback,
+                                    write_buffer_size)
                     
             self.log_info(f"Exported selected sensors' data to {file_path}")
             
@@ -1166,7 +1187,8 @@ class ReplicaXSensorDataReader:
             self.log_error(f"Error exporting selected sensors' data to CSV: {e}")
             return False
 
-    def export_processed_data_in_original_format(self, output_file_path=None, precision=14, export_config=True):
+    def export_processed_data_in_original_format(self, output_file_path=None, precision=14, export_config=True,
+                                                 write_buffer_size=1 << 20):
         """
         Export data in the original CSV file format with processed data and save to output_file_path.
         If output_file_path is None, creates a new file with '_updated' suffix.
@@ -1175,6 +1197,7 @@ class ReplicaXSensorDataReader:
             output_file_path: Path to the output CSV file, or None to generate a path
             precision: Number of decimal places to use for numeric values
             export_config: Whether to export the configuration to a JSON file
+            write_buffer_size: Size in bytes of the output file buffer
         """
         if not self.processed_data or self.time_array is None:
             self.log_error("No processed data available to export")
@@ -1235,7 +1258,7 @@ class ReplicaXSensorDataReader:
                 self.log_info(f"Truncated rows beyond processed data (kept {len(all_rows)} rows)")
 
             # Write the updated data to the output file
-            with open(output_file_path, 'w', newline='') as outfile:
+            with open(output_file_path, 'w', newline='', buffering=write_buffer_size) as outfile:
                 writer = csv.writer(outfile, delimiter=self.config["seperator"])
                 writer.writerows(all_rows)
             
@@ -1354,6 +1377,7 @@ class ReplicaXSensorDataReader:
             # Update configuration
             self.config["data"][name] = column
             self.config["data_name"][name] = name
+            self.config_version += 1
             
             self.log_info(f"Added new sensor '{name}' with {len(data_array)} data points")
             self.log_info("After adding sensors, use update_config() to apply corrections to all sensors uniformly")
@@ -22,6 +22,8 @@
 from PySide6 import QtWidgets, QtCore, QtGui
 import json
 import os
+from contextlib import contextmanager
+import numpy as np
 from ..UtilityAPI.DataValidationAPI import ReplicaXDataTypesManager
 from ..UtilityAPI.UnitsAPI import ReplicaXUnits
 from ..config import INFO
@@ -297,6 +299,9 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         self._copied_data = None
         self._validating = False
         
+        # Append rows when a paste runs past the last row, instead of dropping the rest
+        self.grow_rows_on_paste = False
+        
         # Multi-select dropdown tracking
         self.dropdown_multi_columns = set()  # Columns that are multi-select
         
@@ -321,18 +326,8 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         # Install custom delegate for large data
         self.setItemDelegate(LargeDataDelegate(size_threshold=32767))
         
-        # Shortcuts
-        shortcuts = [
-            ("Ctrl++", self.add_row),
-            ("Ctrl+Shift++", self.import_rows),
-            ("Ctrl+-", self.remove_row),
-            ("Ctrl+Shift+-", self.remove_selected_rows),
-            ("Ctrl+C", self.copy_selection),
-            ("Ctrl+V", self.paste_selection),
-            ("Delete", self.clear_selection)
-        ]
-        for key, func in shortcuts:
-            QtGui.QShortcut(QtGui.QKeySequence(key), self, func, context=QtCore.Qt.WidgetShortcut)
+        # Shortcuts are installed on first show, hidden nested tables and templates never need them
+        self._shortcuts_installed = False
         
         # Signals
         self.cellDoubleClicked.connect(self._handle_double_click)
@@ -340,6 +335,26 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         
         # Track if we're internally updating to prevent recursion
         self._internal_update = False
+        
+        # Nested table cells that from_json() is about to restore from file
+        self._loading_nested_tables = set()
+    
+    def showEvent(self, event):
+        """Install the keyboard shortcuts the first time the table is shown."""
+        if not self._shortcuts_installed:
+            shortcuts = [
+                ("Ctrl++", self.add_row),
+                ("Ctrl+Shift++", self.import_rows),
+                ("Ctrl+-", self.remove_row),
+                ("Ctrl+Shift+-", self.remove_selected_rows),
+                ("Ctrl+C", self.copy_selection),
+                ("Ctrl+V", self.paste_selection),
+                ("Delete", self.clear_selection)
+            ]
+            for key, func in shortcuts:
+                QtGui.QShortcut(QtGui.QKeySequence(key), self, func, context=QtCore.Qt.WidgetShortcut)
+            self._shortcuts_installed = True
+        super().showEvent(event)
     
     # ============================================================================
     # UNIT CONVERSION SYSTEM
@@ -1177,6 +1192,25 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         
         return None
     
+    @contextmanager
+    def bulk_update(self):
+        """
+        Suspend repaints and table signals while many cells are configured at once.
+        
+        Example:
+            with table.bulk_update():
+                table.set_row_types(0, [...])
+                table.set_cell_value(0, 0, 'Steps')
+        """
+        updates_enabled = self.updatesEnabled()
+        signals_blocked = self.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+            self.blockSignals(signals_blocked)
+    
     def init_table_cells(self):
         """Initialize all special cell types and sync linked dropdowns.
         NEVER CALL THIS AFTER LOAD FROM FILE
@@ -1208,6 +1242,7 @@ class ReplicaXTable(QtWidgets.QTableWidget):
                        - String path: 'path/to/template.json'
                        - JSON dict: {'rows': 5, 'columns': 3, ...}
                        - ReplicaXTable instance: existing_table
+                       - Callable returning a ReplicaXTable: built on first selection and reused
         
         Examples:
             # File paths
@@ -1232,6 +1267,11 @@ class ReplicaXTable(QtWidgets.QTableWidget):
                 'TypeB': {'rows': 3, ...},
                 'TypeC': existing_table_instance
             })
+            
+            # Factories, for templates that are expensive to build and rarely used
+            table.link_dropdown_to_table(0, 1, {
+                'TypeD': build_type_d_table
+            })
         """
         if dropdown_col not in self.dropdown_options:
             raise ValueError(f"Column {dropdown_col} is not a dropdown column")
@@ -1252,6 +1292,9 @@ class ReplicaXTable(QtWidgets.QTableWidget):
             elif isinstance(template, ReplicaXTable):
                 # ReplicaXTable instance - valid
                 pass
+            elif callable(template):
+                # Factory - validated when it is first called
+                pass
             else:
                 raise ValueError(
                     f"Template for '{value}' must be string path, JSON dict, or ReplicaXTable instance, "
@@ -1281,9 +1324,19 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         
         for (d_col, t_col), templates in self._dropdown_table_links.items():
             if d_col == dropdown_col and template_key in templates:
+                if (row, t_col) in self._loading_nested_tables:
+                    continue  # from_json() restores this nested table, no template clone needed
+                
                 template = templates[template_key]
                 
                 try:
+                    if callable(template):
+                        # Factory: build the template once and keep it in place of the factory
+                        template = template()
+                        if not isinstance(template, ReplicaXTable):
+                            raise ValueError(f"Template factory must return a ReplicaXTable, got {type(template).__name__}")
+                        templates[template_key] = template
+                    
                     new_table = ReplicaXTable(parent=None, settings=self.settings)
                     new_table.hide()
                     
@@ -1714,8 +1767,10 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         if not item or not item.text():
             return None
         
-        text = item.text()
-        
+        return self._value_from_text(item.text(), row, col, cell_type, in_display_units)
+    
+    def _value_from_text(self, text, row, col, cell_type, in_display_units=False):
+        """Parse the text of a plain (non-dropdown, non-nested) cell into its typed value."""
         # Check if column has units and is numeric type
         unit_config = self._get_cell_unit_config(row, col)
         
@@ -1742,7 +1797,8 @@ class ReplicaXTable(QtWidgets.QTableWidget):
             value: Value to set
             value_is_in_base_units: If True (default), value is in base units
         """
-        self.blockSignals(True)
+        # Restore the caller's state so set_cell_value() keeps signals blocked inside bulk_update()
+        signals_blocked = self.blockSignals(True)
         
         try:
             if isinstance(value, ReplicaXTable):
@@ -1828,7 +1884,19 @@ class ReplicaXTable(QtWidgets.QTableWidget):
                     item.setText("")
         
         finally:
-            self.blockSignals(False)
+            self.blockSignals(signals_blocked)
+    
+    def set_cell_values(self, cells, value_is_in_base_units=True):
+        """
+        Set many cell values in one bulk update.
+        
+        Args:
+            cells: Iterable of (row, col, value) tuples
+            value_is_in_base_units: If True (default), values are in base units
+        """
+        with self.bulk_update():
+            for row, col, value in cells:
+                self.set_cell_value(row, col, value, value_is_in_base_units)
     
     def get_cell_value(self, row, col, in_display_units=True):
         """
@@ -1861,6 +1929,74 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         """
         return self._get_cell_value_internal_use(row, col, in_display_units=in_display_units, dropdown_true_type=True)
     
+    def to_numpy(self, columns=None, in_display_units=True, row_count=None):
+        """
+        Read numeric columns into a float64 array in one pass.
+        
+        Empty cells are skipped without parsing and stay NaN. Plain cells are parsed from the
+        text read here, without the per-cell lookups of get_cell_value, and identical texts
+        in a column are parsed once when no row or cell level units or types are set.
+        
+        Args:
+            columns: Column indices to read (default: all columns)
+            in_display_units: If True, return values in display units
+            row_count: Number of leading rows to read (default: all rows)
+        
+        Returns:
+            Array of shape (row_count, len(columns)) with NaN for empty cells
+        
+        Raises:
+            ValueError: If a cell holds a non-numerical value
+        """
+        if columns is None:
+            columns = range(self.columnCount())
+        columns = list(columns)
+        if row_count is None:
+            row_count = self.rowCount()
+        else:
+            row_count = max(0, min(row_count, self.rowCount()))
+        values = np.full((row_count, len(columns)), np.nan, dtype=np.float64)
+        
+        # Per-cell overrides can give equal texts different meanings, so only cache without them
+        use_cache = not (self.row_units or self.cell_units or self.row_types)
+        item = self.item
+        get_value = self.get_cell_value
+        value_from_text = self._value_from_text
+        
+        for j, col in enumerate(columns):
+            widget_col = col in self.dropdown_options
+            cell_type = self.column_types[col]
+            cache = {}
+            for row in range(row_count):
+                if not widget_col and (row, col) not in self.nested_tables and (row, col) not in self.cell_dropdowns:
+                    # Plain cell: the text read here is parsed without another item lookup
+                    cell = item(row, col)
+                    if cell is None:
+                        continue
+                    text = cell.text()
+                    if not text:
+                        continue
+                    if use_cache and text in cache:
+                        values[row, j] = cache[text]
+                        continue
+                    row_cell_type = self.row_types[row][col] if row in self.row_types else cell_type
+                    value = value_from_text(text, row, col, row_cell_type, in_display_units)
+                else:
+                    text = None
+                    value = get_value(row, col, in_display_units=in_display_units)
+                
+                if value is None:
+                    continue
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    raise ValueError(f"Row {row + 1}, column {col + 1} contains a non-numerical value") from None
+                values[row, j] = value
+                if use_cache and text is not None:
+                    cache[text] = value
+        
+        return values
+    
     # ============================================================================
     # NESTED TABLES
     # ============================================================================
@@ -2002,6 +2138,15 @@ class ReplicaXTable(QtWidgets.QTableWidget):
                 self._init_row(row)
             self._recreate_all_table_buttons()
     
+    def grow_to(self, row_count):
+        """Append empty rows until the table has at least row_count rows."""
+        first_new = self.rowCount()
+        if row_count <= first_new:
+            return
+        self.setRowCount(row_count)
+        for row in range(first_new, row_count):
+            self._init_row(row)
+    
     def remove_row(self):
         """Remove current row (Ctrl+-)."""
         row = self.currentRow()
@@ -2033,6 +2178,10 @@ class ReplicaXTable(QtWidgets.QTableWidget):
             if cell_type == 'table':
                 self._add_widget(row, col, 'table')
             elif (row, col) in self.cell_dropdowns or col in self.dropdown_options:
+                # set_cell_dropdown() may already have created a matching, up to date widget
+                widget = self.cellWidget(row, col)
+                if isinstance(widget, _MultiSelectDropdown if self._is_multi_select_dropdown(row, col) else QtWidgets.QComboBox):
+                    continue
                 self._add_widget(row, col, 'dropdown')
 
 
@@ -2252,7 +2401,12 @@ class ReplicaXTable(QtWidgets.QTableWidget):
         if row < 0 or col < 0:
             return
         
-        for i, line in enumerate(text.split('\n')):
+        lines = text.split('\n')
+        if self.grow_rows_on_paste:
+            last_line = max((i for i, line in enumerate(lines) if line), default=-1)
+            self.grow_to(row + last_line + 1)
+        
+        for i, line in enumerate(lines):
             if not line:
                 continue
             for j, val in enumerate(line.split('\t')):
@@ -2539,6 +2693,10 @@ class ReplicaXTable(QtWidgets.QTableWidget):
             self.init_table_cells()
             
             # THEN load values using dropdown-aware types
+            # (dropdowns linked to nested tables skip their template when the file holds the table)
+            self._loading_nested_tables = {
+                tuple(map(int, key.split(','))) for key in data.get('nested_tables', {})
+            }
             for row, row_data in enumerate(data.get('cells', [])):
                 if row >= self.rowCount():
                     break
@@ -2568,6 +2726,7 @@ class ReplicaXTable(QtWidgets.QTableWidget):
                         self._add_widget(row, col, 'table')
         
         finally:
+            self._loading_nested_tables = set()
             self.blockSignals(False)
         
         return self
@@ -0,0 +1,48 @@
+######################################################################################################
+# ReplicaXLite - A finite element toolkit for creating, analyzing and monitoring 3D structural models
+# Copyright (C) 2024-2025 Vachan Vanian
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Contact: vachanvanian@outlook.com
+######################################################################################################
+
+import warnings
+
+import numpy as np
+
+from replicaxlite.GUIs.ToolsGUI.TimeHistoryFEMTable import _check_time_history
+
+
+def _values(rows):
+    """Build a (rows, 4) time history array from (time, accel) pairs, NaN for empty cells."""
+    values = np.full((len(rows), 4), np.nan)
+    values[:, :2] = rows
+    return values
+
+
+def test_repeated_infinite_time_is_rejected():
+    values = _values([[0.0, 1.0], [1.0, 1.0], [np.inf, 1.0], [np.inf, 1.0]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        check = _check_time_history(values)
+    assert check['first_bad_step'] == 3
+
+
+def test_nan_time_rows_are_left_out_of_the_monotonicity_check():
+    values = _values([[0.0, 1.0], [np.nan, 1.0], [1.0, 1.0]])
+    check = _check_time_history(values)
+    assert check['first_bad_step'] is None
+    assert check['missing_time'].tolist() == [2]
+    assert check['data'][:, 0].tolist() == [0.0, 1.0]